@@ -0,0 +1,44 @@
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, Final, List
+
+DEFAULT_REPEAT: Final[int] = 5
+
+
+def measure(func: Callable[[], Any], number: int, repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    """Time the given function, the best and median time for a single call are returned.
+
+    Args:
+        func (Callable[[], Any]): function to benchmark, without arguments.
+        number (int): calls for each repetition.
+        repeat (int, optional): repetitions. Defaults to DEFAULT_REPEAT.
+
+    Returns:
+        Dict[str, float]: best and median time of a single call, in microseconds.
+    """
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((perf_counter() - start) / number)
+    return {"best_us": min(timings) * 1e6, "median_us": median(timings) * 1e6}
+
+
+def percentiles(samples: List[float], points: tuple = (50, 95, 99)) -> Dict[str, float]:
+    """Return the requested percentiles (nearest rank) of the given samples.
+
+    Args:
+        samples (List[float]): samples to analyze.
+        points (tuple, optional): percentiles to compute. Defaults to (50, 95, 99).
+
+    Returns:
+        Dict[str, float]: a "pXX" key for each requested percentile.
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return {f"p{point}": 0.0 for point in points}
+    return {
+        f"p{point}": ordered[min(len(ordered) - 1, max(0, round(point / 100 * len(ordered)) - 1))]
+        for point in points
+    }
@@ -0,0 +1,182 @@
+"""Measure the per-request cost of the ways a route gets its dependencies.
+
+Each case is a route of a bare FastAPI application, called as an ASGI application (no
+network, no middleware); the cost of a case is its time minus the time of a route without
+dependencies:
+* container: the logger and the user repository looked up with CONTAINER.get;
+* provide: the same instances from Depends(provide(...)), kept by the dependencies;
+* authorized_sync / authorized_async: the caller of the request from is_authorized, run
+  by FastAPI in its thread pool, and from is_authorized_async, run on the event loop;
+* admin_sync / admin_async: the admin routes, the admin check depending on the caller.
+
+Run from the fastapi directory, the environment of the application set, with:
+    $ python -m benchmarks.dependencies --requests 2000
+"""
+import asyncio
+import json
+import platform
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+from typing import Any, Dict, Final, List, Tuple
+
+from fastapi import Depends, FastAPI
+from src.core.auth import (
+    create_token,
+    is_admin,
+    is_admin_async,
+    is_authorized,
+    is_authorized_async,
+    require_admin,
+    require_admin_async,
+)
+from src.core.settings import SettingsStore
+from src.helpers.container import CONTAINER
+from src.helpers.dependencies import provide
+from src.services.logger.interfaces.i_logger import ILogger
+from src.services.users.interfaces.i_user_repository import IUserRepository
+
+DEFAULT_REQUESTS: Final[int] = 2_000
+DEFAULT_REPEAT: Final[int] = 5
+_WARMUP: Final[int] = 200
+
+
+def build_app() -> FastAPI:
+    """Return the application serving a route for each case."""
+    # pylint: disable=unused-argument,unused-variable
+    app = FastAPI()
+
+    @app.get("/baseline")
+    async def baseline():
+        return None
+
+    @app.get("/container")
+    async def container():
+        CONTAINER.get(ILogger).get("routes")
+        CONTAINER.get(IUserRepository)
+
+    @app.get("/provide")
+    async def provided(
+        loggers: ILogger = Depends(provide(ILogger)),
+        repository: IUserRepository = Depends(provide(IUserRepository)),
+    ):
+        loggers.get("routes")
+
+    @app.get("/authorized_sync")
+    async def authorized_sync(result: Tuple[bool, dict] = Depends(is_authorized)):
+        return None
+
+    @app.get("/authorized_async")
+    async def authorized_async(result: Tuple[bool, dict] = Depends(is_authorized_async)):
+        return None
+
+    @app.get("/admin_sync", dependencies=[Depends(require_admin)])
+    async def admin_sync(result: Tuple[bool, bool, dict] = Depends(is_admin)):
+        return None
+
+    @app.get("/admin_async", dependencies=[Depends(require_admin_async)])
+    async def admin_async(result: Tuple[bool, bool, dict] = Depends(is_admin_async)):
+        return None
+
+    return app
+
+
+def admin_token() -> str:
+    """An access token of the admin, signed with the settings of the application."""
+    settings = CONTAINER.get(SettingsStore).current
+    data = {"username": "admin", "email": "admin@email.com", "roles": ["admin", "user"]}
+    return create_token(
+        data, settings.jwt.access_delta, False, settings.signing_key, settings.jwt.algorithm
+    )
+
+
+async def time_route(
+    app: FastAPI, path: str, token: str, requests: int, repeat: int = DEFAULT_REPEAT
+) -> Dict[str, float]:
+    """Time the requests to a route.
+
+    Args:
+        app (FastAPI): the application.
+        path (str): path of the route.
+        token (str): access token sent with each request.
+        requests (int): requests for each repetition.
+        repeat (int, optional): repetitions. Defaults to DEFAULT_REPEAT.
+
+    Returns:
+        Dict[str, float]: best and median time of a single request, in microseconds.
+    """
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+    }
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} answered {message['status']}")
+
+    for _ in range(_WARMUP):
+        await app(dict(scope), receive, send)
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(requests):
+            await app(dict(scope), receive, send)
+        timings.append((perf_counter() - start) / requests)
+    return {"best_us": min(timings) * 1e6, "median_us": median(timings) * 1e6}
+
+
+async def run(requests: int) -> Dict[str, Dict[str, float]]:
+    """Time every case.
+
+    Args:
+        requests (int): requests for each repetition.
+
+    Returns:
+        Dict[str, Dict[str, float]]: timings by case, with the overhead over the baseline.
+    """
+    app = build_app()
+    token = admin_token()
+    results: Dict[str, Dict[str, float]] = {}
+    for path in (route.path for route in app.routes if route.path.count("/") == 1):
+        if path.startswith("/docs") or path.startswith("/openapi") or path == "/redoc":
+            continue
+        results[path[1:]] = await time_route(app, path, token, requests)
+    baseline = results["baseline"]["best_us"]
+    for timings in results.values():
+        timings["overhead_us"] = timings["best_us"] - baseline
+    return {
+        name: {key: round(value, 2) for key, value in timings.items()}
+        for name, timings in results.items()
+    }
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help="requests for each repetition of a case",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests))
+    print(json.dumps({"python": platform.python_version(), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Measure the auth hot path and the user models against the stored baseline.
+
+Every case is timed with benchmarks.measure and its best time, the least disturbed by
+the other processes, is compared with the baseline in benchmarks/baselines/hot_paths.json:
+the exit status is 1 when any case got slower than the tolerance allows. Timings depend
+on the machine: save the baseline on the machine running the check, e.g. the CI runner,
+and commit it.
+
+Run from the fastapi directory, the environment of the application set, with:
+    $ python -m benchmarks.hot_paths --tolerance 0.25
+    $ python -m benchmarks.hot_paths --save
+"""
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from os.path import dirname, join
+from typing import Any, Callable, Dict, Final, List, Tuple
+
+from benchmarks import measure
+from src.core.auth import (
+    create_token,
+    decode_token,
+    has_roles,
+    hash_password,
+    is_admin,
+    is_authorized,
+    valid_access_token,
+    verify_password,
+)
+from src.core.settings import SettingsStore
+from src.helpers.container import CONTAINER
+from src.models import user as user_models
+from src.models.user import Role
+
+BASELINE_PATH: Final[str] = join(dirname(__file__), "baselines", "hot_paths.json")
+DEFAULT_TOLERANCE: Final[float] = 0.25
+
+# Calls for each repetition, bcrypt is slow on purpose and timed with few calls.
+_SLOW_NUMBER: Final[int] = 5
+_FAST_NUMBER: Final[int] = 2_000
+
+
+def _model_payloads() -> Dict[type, Dict[str, Any]]:
+    """Return a valid payload for every model of src.models.user."""
+    now = datetime.utcnow()
+    username = {"username": "bench.user"}
+    user = {**username, "email": "bench.user@email.com"}
+    roles = {"roles": ["admin", "user"]}
+    dates = {"creation": now, "last_update": now}
+    return {
+        user_models.BaseUsername: username,
+        user_models.BaseUser: user,
+        user_models.BaseUserRoles: roles,
+        user_models.UserRegistration: {**user, "password": "password"},
+        user_models.UserRegistrationAdmin: {**user, **roles, "password": "password"},
+        user_models.UserLogin: {**user, **roles},
+        user_models.UserPartialDetails: {**username, **roles, "creation": now},
+        user_models.UserPartialDetailsAdmin: {**user, **roles, **dates},
+        user_models.CurrentUserDetails: {**user, **roles, **dates},
+        user_models.UpdateUserDetails: {**user, **roles},
+    }
+
+
+def build_cases() -> Dict[str, Tuple[Callable[[], Any], int]]:
+    """Return the benchmarked calls by name, with the calls for each repetition."""
+    hashed = hash_password("password")
+    token_data = {"username": "admin", "email": "admin@email.com", "roles": ["admin", "user"]}
+    settings = CONTAINER.get(SettingsStore).current
+    expiration = settings.jwt.access_delta
+    token = create_token(
+        token_data, expiration, False, settings.signing_key, settings.jwt.algorithm
+    )
+    decoded = decode_token(token)
+
+    cases: Dict[str, Tuple[Callable[[], Any], int]] = {
+        "hash_password": (lambda: hash_password("password"), _SLOW_NUMBER),
+        "verify_password": (lambda: verify_password("password", hashed), _SLOW_NUMBER),
+        "create_token": (
+            lambda: create_token(
+                token_data, expiration, False, settings.signing_key, settings.jwt.algorithm
+            ),
+            _FAST_NUMBER,
+        ),
+        "decode_token": (lambda: decode_token(token), _FAST_NUMBER),
+        "valid_access_token": (lambda: valid_access_token(decoded), _FAST_NUMBER),
+        "has_roles": (lambda: has_roles(decoded["roles"], [Role.ADMIN]), _FAST_NUMBER),
+        "is_authorized": (lambda: is_authorized(token), _FAST_NUMBER),
+        "is_admin": (lambda: is_admin(token), _FAST_NUMBER),
+    }
+    for model, payload in _model_payloads().items():
+        # Binding the loop variables, every lambda would validate the last model otherwise.
+        cases[f"models.{model.__name__}"] = (
+            lambda model=model, payload=payload: model.parse_obj(payload),
+            _FAST_NUMBER,
+        )
+    return cases
+
+
+def regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Compare the best times with the baseline ones.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): timings by case, as returned by measure.
+        baseline (Dict[str, Dict[str, float]]): stored timings by case.
+        tolerance (float): allowed slowdown, 0.25 lets a case get 25% slower.
+
+    Returns:
+        List[str]: a description of each regressed case, empty when none regressed.
+    """
+    found: List[str] = []
+    for name, timings in results.items():
+        if name not in baseline:
+            continue
+        allowed = baseline[name]["best_us"] * (1 + tolerance)
+        if timings["best_us"] > allowed:
+            found.append(
+                f"{name}: {timings['best_us']:.2f}us, baseline "
+                f"{baseline[name]['best_us']:.2f}us (+{tolerance:.0%} allowed)"
+            )
+    return found
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed slowdown of the best time, as a fraction of the baseline",
+    )
+    parser.add_argument("--save", action="store_true", help="overwrite the baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline path")
+    args = parser.parse_args()
+
+    results = {
+        name: {key: round(value, 3) for key, value in measure(func, number).items()}
+        for name, (func, number) in build_cases().items()
+    }
+    report: Dict[str, Any] = {"python": platform.python_version(), "results": results}
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_stream:
+            json.dump(report, baseline_stream, indent=2)
+            baseline_stream.write("\n")
+        print(json.dumps(report, indent=2))
+        return
+
+    with open(args.baseline, encoding="utf-8") as baseline_stream:
+        baseline = json.load(baseline_stream)["results"]
+    report["regressions"] = regressions(results, baseline, args.tolerance)
+    print(json.dumps(report, indent=2))
+    if report["regressions"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""End-to-end load benchmark of every route against a seeded users collection.
+
+The application is served in process (no network, no uvicorn): the numbers are the cost
+of the application and of MongoDB. The MongoDB configured by the DB_ variables must be
+initialized with mongo-init.js, the admin and user accounts sign in the requests;
+with DB_BACKEND=memory the in-process users collection measures the application alone,
+DB_BACKEND=sqlite an embedded SQLite file. Every backend is seeded through the user
+repository of the application.
+The seeded users are named bench.<n> and removed at the end.
+
+Run from the fastapi directory with:
+    $ python -m benchmarks.load --users 100000 --concurrency 32 --requests 2000 \
+        --output load.json
+"""
+import asyncio
+import json
+import platform
+import random
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from itertools import count
+from time import perf_counter
+from typing import Awaitable, Callable, Dict, Final, Iterator, List, Tuple
+
+from httpx import AsyncClient, Response
+
+from benchmarks import percentiles
+from src.app import fastapi_app
+from src.core.auth import hash_password
+from src.helpers.container import CONTAINER
+from src.models.user import Role
+from src.services.users.interfaces.i_user_repository import IUserRepository
+from src.services.users.models.user_record import UserRecord
+from tests import BASE_URL, admin_login, user_login
+
+BENCH_PREFIX: Final[str] = "bench."
+BENCH_PASSWORD: Final[str] = "bench-password"
+# Inserts and deletions in flight while seeding and cleaning up.
+SEED_BATCH: Final[int] = 1_000
+
+# A scenario sends the i-th request with the given client.
+Scenario = Callable[[AsyncClient, int], Awaitable[Response]]
+
+
+def bench_username(i: int) -> str:
+    """Username of the i-th seeded user."""
+    return f"{BENCH_PREFIX}{i}"
+
+
+def registered_username(n: int) -> str:
+    """Username of the n-th user registered by the register scenario."""
+    return f"{BENCH_PREFIX}registered.{n}"
+
+
+async def seed(users: int) -> None:
+    """Insert the given amount of users sharing a single password hash, through the user
+    repository of the application so that every backend is seeded the same way.
+
+    Args:
+        users (int): users to insert.
+    """
+    repository = CONTAINER.get(IUserRepository)
+    # Hashing each password would take hours, every user shares the same one.
+    password = hash_password(BENCH_PASSWORD)
+    now = datetime.utcnow()
+    for start in range(0, users, SEED_BATCH):
+        await asyncio.gather(
+            *(
+                repository.insert(
+                    UserRecord(
+                        email=f"{bench_username(i)}@email.com",
+                        username=bench_username(i),
+                        password=password,
+                        roles=[Role.ADMIN, Role.USER] if i % 100 == 0 else [Role.USER],
+                        creation=now - timedelta(minutes=i),
+                        last_update=now,
+                    )
+                )
+                for i in range(start, min(users, start + SEED_BATCH))
+            )
+        )
+
+
+async def cleanup(users: int, registered: int) -> None:
+    """Remove the seeded and registered users, the missing ones are skipped.
+
+    Args:
+        users (int): seeded users.
+        registered (int): users registered by the register scenario.
+    """
+    repository = CONTAINER.get(IUserRepository)
+    usernames = [bench_username(i) for i in range(users)]
+    usernames.extend(registered_username(n) for n in range(registered))
+    for start in range(0, len(usernames), SEED_BATCH):
+        await asyncio.gather(
+            *(repository.delete(username) for username in usernames[start : start + SEED_BATCH])
+        )
+
+
+def build_scenarios(
+    users: int, admin_token: str, refresh_token: str, user_token: str, registered: Iterator[int]
+):
+    """Return the scenarios by name, with the statuses they are expected to return.
+
+    The register scenario takes the numbers of its users from registered. The delete
+    scenario removes seeded users from the last one, it runs last.
+    """
+    admin = {"Authorization": f"Bearer {admin_token}"}
+    user = {"Authorization": f"Bearer {user_token}"}
+
+    def login(ac: AsyncClient, _: int) -> Awaitable[Response]:
+        username = bench_username(random.randrange(users))
+        form = {"username": username, "password": BENCH_PASSWORD}
+        return ac.post("/auth/login", data=form)
+
+    def refresh(ac: AsyncClient, _: int) -> Awaitable[Response]:
+        return ac.post("/auth/refresh", headers={"refresh-token": refresh_token})
+
+    def register(ac: AsyncClient, _: int) -> Awaitable[Response]:
+        username = registered_username(next(registered))
+        body = {"username": username, "email": f"{username}@email.com", "password": "password"}
+        return ac.post("/user/register", json=body)
+
+    def all_page(ac: AsyncClient, _: int) -> Awaitable[Response]:
+        params = {"limit": 50, "skip": random.randrange(max(1, users - 50))}
+        return ac.get("/user/all", params=params, headers=admin)
+
+    def users_count(ac: AsyncClient, _: int) -> Awaitable[Response]:
+        return ac.get("/user/count", headers=user)
+
+    def me(ac: AsyncClient, _: int) -> Awaitable[Response]:
+        return ac.get("/user/me", headers=user)
+
+    def username(ac: AsyncClient, _: int) -> Awaitable[Response]:
+        return ac.get(f"/user/username/{bench_username(random.randrange(users))}", headers=admin)
+
+    def put(ac: AsyncClient, i: int) -> Awaitable[Response]:
+        name = bench_username(i % users)
+        body = {"username": name, "email": f"{name}@email.com", "roles": ["user"]}
+        return ac.put(f"/user/username/{name}", json=body, headers=admin)
+
+    def delete(ac: AsyncClient, i: int) -> Awaitable[Response]:
+        return ac.delete(f"/user/username/{bench_username(users - 1 - i)}", headers=admin)
+
+    scenarios: Dict[str, Tuple[Scenario, Tuple[int, ...]]] = {
+        "login": (login, (200,)),
+        "refresh": (refresh, (200,)),
+        "register": (register, (201,)),
+        "all_page": (all_page, (200,)),
+        "count": (users_count, (200,)),
+        "me": (me, (200,)),
+        "username": (username, (200,)),
+        "put": (put, (200,)),
+        "delete": (delete, (200,)),
+    }
+    return scenarios
+
+
+async def run_scenario(
+    ac: AsyncClient,
+    scenario: Scenario,
+    expected: Tuple[int, ...],
+    requests: int,
+    concurrency: int,
+) -> dict:
+    """Send the requests with the given concurrency and return throughput and latencies.
+
+    Args:
+        ac (AsyncClient): client bound to the application.
+        scenario (Scenario): builds the i-th request.
+        expected (Tuple[int, ...]): statuses counted as successful.
+        requests (int): requests to send.
+        concurrency (int): requests in flight at most.
+
+    Returns:
+        dict: the scenario report, latencies in milliseconds.
+    """
+    next_request = count()
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    async def worker() -> None:
+        while (i := next(next_request)) < requests:
+            start = perf_counter()
+            response = await scenario(ac, i)
+            latencies.append((perf_counter() - start) * 1000)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = perf_counter() - start
+
+    report = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput_rps": round(requests / elapsed, 1),
+        "errors": sum(n for status, n in statuses.items() if status not in expected),
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+    }
+    report.update(
+        {f"{key}_ms": round(value, 2) for key, value in percentiles(latencies).items()}
+    )
+    return report
+
+
+async def run(users: int, requests: int, concurrency: int, only: List[str]) -> dict:
+    """Seed the users, run the scenarios in order and clean up."""
+    await fastapi_app.router.startup()
+    registered = count()
+    try:
+        # Users left by an interrupted run.
+        await cleanup(users, 0)
+        seed_start = perf_counter()
+        await seed(users)
+        seed_s = perf_counter() - seed_start
+
+        admin = await admin_login()
+        user = await user_login()
+        scenarios = build_scenarios(
+            users, admin.access_token, admin.refresh_token, user.access_token, registered
+        )
+        results = {}
+        async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
+            for name, (scenario, expected) in scenarios.items():
+                if only and name not in only:
+                    continue
+                # The deletions can not outnumber the seeded users.
+                scenario_requests = min(requests, users) if name == "delete" else requests
+                results[name] = await run_scenario(
+                    ac, scenario, expected, scenario_requests, concurrency
+                )
+        await cleanup(users, next(registered))
+    finally:
+        await fastapi_app.router.shutdown()
+
+    return {
+        "created": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "users": users,
+        "seed_s": round(seed_s, 2),
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000, help="users to seed (1k/100k/1M)")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32, help="requests in flight")
+    parser.add_argument(
+        "--scenario", action="append", default=[], help="run only this scenario, repeatable"
+    )
+    parser.add_argument("--output", help="JSON artifact path, printed only when missing")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.users, args.requests, args.concurrency, args.scenario))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare the latency paid by the caller with a synchronous file handler
+and with the queued handler used by TimedLogger.
+
+Run from the fastapi directory with:
+    $ python -m benchmarks.logger --records 100000
+"""
+import json
+import logging
+from argparse import ArgumentParser
+from logging import Handler
+from logging.handlers import TimedRotatingFileHandler
+from os.path import join
+from queue import Queue
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks import percentiles
+from src.services.logger.enums.overflow import OverflowPolicy
+from src.services.logger.implementations.queue_handler import (
+    BackgroundListener,
+    BoundedQueueHandler,
+)
+
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def busy_wait(seconds: float) -> None:
+    """Simulate the request work done between two log statements."""
+    end = perf_counter() + seconds
+    while perf_counter() < end:
+        pass
+
+
+def run(logger_name: str, handler: Handler, records: int, work_s: float) -> dict:
+    """Log the given amount of records and return the caller latency percentiles (us)."""
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    samples = []
+    for i in range(records):
+        start = perf_counter()
+        logger.info("Successfully generated token for user.%s", i)
+        samples.append((perf_counter() - start) * 1e6)
+        busy_wait(work_s)
+
+    logger.removeHandler(handler)
+    return {key: round(value, 2) for key, value in percentiles(samples, (50, 99, 100)).items()}
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000, help="records to log")
+    parser.add_argument("--queue-size", type=int, default=10_000, help="queue size")
+    parser.add_argument(
+        "--work-us", type=float, default=50, help="simulated request work between two records"
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as logging_dir:
+        # Rotating every second, to include the inline rotations in the synchronous case.
+        sync_handler = TimedRotatingFileHandler(join(logging_dir, "sync.log"), when="S")
+        sync_handler.setFormatter(logging.Formatter(FORMAT))
+        sync_report = run("bench-sync", sync_handler, args.records, args.work_us / 1e6)
+        sync_handler.close()
+
+        file_handler = TimedRotatingFileHandler(join(logging_dir, "queued.log"), when="S")
+        file_handler.setFormatter(logging.Formatter(FORMAT))
+        queue: Queue = Queue(maxsize=args.queue_size)
+        listener = BackgroundListener(queue, file_handler)
+        listener.start()
+        queued_report = run(
+            "bench-queued",
+            BoundedQueueHandler(queue, OverflowPolicy.BLOCK),
+            args.records,
+            args.work_us / 1e6,
+        )
+        flush_start = perf_counter()
+        listener.stop()
+        flush_s = perf_counter() - flush_start
+        file_handler.close()
+
+    report = {
+        "records": args.records,
+        "caller_latency_us": {"sync": sync_report, "queued": queued_report},
+        "queued_flush_on_shutdown_s": round(flush_s, 3),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Measure the validation of the user models, as done for every projected DB row.
+
+Run from the fastapi directory with:
+    $ python -m benchmarks.models --rows 100000
+"""
+import json
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from src.models.user import UserPartialDetailsAdmin
+
+
+def build_documents(rows: int) -> list:
+    """Build raw documents shaped as the users collection projection."""
+    now = datetime.utcnow()
+    return [
+        {
+            "username": f"user.{i}",
+            "email": f"user.{i}@email.com",
+            "roles": ["admin", "user"] if i % 10 == 0 else ["user"],
+            "creation": now - timedelta(minutes=i),
+            "last_update": now,
+        }
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000, help="documents to validate")
+    args = parser.parse_args()
+
+    documents = build_documents(args.rows)
+    start = perf_counter()
+    for document in documents:
+        UserPartialDetailsAdmin.parse_obj(document)
+    elapsed = perf_counter() - start
+
+    report = {
+        "model": UserPartialDetailsAdmin.__name__,
+        "rows": args.rows,
+        "total_s": elapsed,
+        "per_row_us": elapsed / args.rows * 1e6,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare payload size and encode time of the formats returned by the user routes.
+
+Run from the fastapi directory with:
+    $ python -m benchmarks.serialization --rows 1000
+"""
+import json
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+
+from benchmarks import measure
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from src.helpers.responses import MsgPackResponse
+from src.models.user import Role, UserPartialDetailsAdmin
+
+
+def build_rows(rows: int) -> list:
+    """Build the same payload returned by /user/all for an admin."""
+    now = datetime.utcnow()
+    return [
+        UserPartialDetailsAdmin(
+            username=f"user.{i}",
+            email=f"user.{i}@email.com",
+            roles=[Role.ADMIN, Role.USER] if i % 10 == 0 else [Role.USER],
+            creation=now - timedelta(days=i),
+            last_update=now,
+        )
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000, help="users in the payload")
+    parser.add_argument("--number", type=int, default=20, help="encodings for each repetition")
+    args = parser.parse_args()
+
+    content = build_rows(args.rows)
+    encoders = {
+        "json": lambda: JSONResponse(content=jsonable_encoder(content)).body,
+        "msgpack": lambda: MsgPackResponse(content=content).body,
+    }
+
+    report = {}
+    for name, encode in encoders.items():
+        report[name] = {"payload_bytes": len(encode()), **measure(encode, args.number)}
+    print(json.dumps({"rows": args.rows, "formats": report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
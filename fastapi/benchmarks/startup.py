@@ -0,0 +1,160 @@
+"""Measure the startup of the application against the budgets.
+
+Two figures are reported, each measured in a fresh interpreter:
+* the import time of src.app, with the modules costing the most (python -X importtime);
+* the time to first request: interpreter start, import, lifespan startup (settings,
+  configuration files, database connection) and a first GET /health/live, served in
+  process.
+
+The budgets are in benchmarks/baselines/startup.json, the exit status is 1 when any
+figure exceeds its budget. Use DB_BACKEND=memory to leave the database out of the figures.
+
+Run from the fastapi directory, the environment of the application set, with:
+    $ python -m benchmarks.startup --top 15
+"""
+import json
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from os.path import dirname, join
+from time import perf_counter
+from typing import Any, Dict, Final, List
+
+BUDGETS_PATH: Final[str] = join(dirname(__file__), "baselines", "startup.json")
+FASTAPI_DIR: Final[str] = dirname(dirname(__file__))
+DEFAULT_TOP: Final[int] = 15
+
+# Runs in the measured interpreter, prints the phases of the startup in milliseconds.
+_FIRST_REQUEST_SCRIPT: Final[str] = """
+import asyncio, json
+from time import perf_counter
+start = perf_counter()
+from httpx import AsyncClient
+from src.app import fastapi_app
+imported = perf_counter()
+
+async def first_request():
+    await fastapi_app.router.startup()
+    started = perf_counter()
+    # The middleware stack is built on the first call, as on the lifespan startup.
+    async with AsyncClient(app=fastapi_app, base_url="http://") as client:
+        response = await client.get("/health/live")
+    response.raise_for_status()
+    served = perf_counter()
+    await fastapi_app.router.shutdown()
+    return started, served
+
+started, served = asyncio.run(first_request())
+print(json.dumps({
+    "import_ms": (imported - start) * 1e3,
+    "startup_ms": (started - imported) * 1e3,
+    "first_request_ms": (served - started) * 1e3,
+}))
+"""
+
+
+def import_times(top: int = DEFAULT_TOP) -> Dict[str, Any]:
+    """Import src.app in a fresh interpreter with -X importtime.
+
+    Args:
+        top (int, optional): modules to report, by their own import time.
+            Defaults to DEFAULT_TOP.
+
+    Returns:
+        Dict[str, Any]: the cumulative import time of src.app, the profiling included,
+        and the costliest modules, in milliseconds.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.app"],
+        cwd=FASTAPI_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines are "import time: <self us> | <cumulative us> | <indented module>".
+    modules: List[Dict[str, Any]] = []
+    total_ms = 0.0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        name = module.strip()
+        modules.append(
+            {
+                "module": name,
+                "self_ms": int(self_us) / 1e3,
+                "cumulative_ms": int(cumulative_us) / 1e3,
+            }
+        )
+        if name == "src.app":
+            total_ms = int(cumulative_us) / 1e3
+    modules.sort(key=lambda module: module["self_ms"], reverse=True)
+    return {"profiled_import_ms": total_ms, "modules": modules[:top]}
+
+
+def time_to_first_request() -> Dict[str, float]:
+    """Start the application in a fresh interpreter and serve a first request.
+
+    Returns:
+        Dict[str, float]: the phases of the startup and the time from the interpreter
+        launch to the first response, in milliseconds.
+    """
+    start = perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", _FIRST_REQUEST_SCRIPT],
+        cwd=FASTAPI_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The interpreter teardown is left out, the first request is already served.
+    phases = json.loads(completed.stdout.splitlines()[-1])
+    phases["time_to_first_request_ms"] = (perf_counter() - start) * 1e3
+    return phases
+
+
+def over_budget(results: Dict[str, float], budgets: Dict[str, float]) -> List[str]:
+    """Compare the figures with their budgets.
+
+    Args:
+        results (Dict[str, float]): figures by name, in milliseconds.
+        budgets (Dict[str, float]): budgets by name, in milliseconds.
+
+    Returns:
+        List[str]: a description of each figure over its budget, empty when none is.
+    """
+    return [
+        f"{name}: {results[name]:.1f}ms, budget {budget:.1f}ms"
+        for name, budget in budgets.items()
+        if name in results and results[name] > budget
+    ]
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--top", type=int, default=DEFAULT_TOP, help="modules reported by import time"
+    )
+    parser.add_argument("--budgets", default=BUDGETS_PATH, help="budgets path")
+    args = parser.parse_args()
+
+    imports = import_times(args.top)
+    phases = time_to_first_request()
+    results = {"profiled_import_ms": imports["profiled_import_ms"], **phases}
+    with open(args.budgets, encoding="utf-8") as budgets_stream:
+        budgets = json.load(budgets_stream)["budgets"]
+    report: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "results": {name: round(value, 1) for name, value in results.items()},
+        "modules": imports["modules"],
+        "over_budget": over_budget(results, budgets),
+    }
+    print(json.dumps(report, indent=2))
+    if report["over_budget"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,84 @@
 from fastapi import FastAPI
-from src.db.connection import build_client
+from src.core.auth import is_admin_token
+from src.core.hashing import HashingPool
+from src.core.health import HealthChecker
+from src.core.loop_monitor import EventLoopMonitor
+from src.core.settings import SettingsStore
+from src.db.monitoring import CommandMonitor
+from src.helpers.container import CONTAINER, deferred
+from src.middleware.compression import CompressionConfig, CompressionMiddleware
+from src.middleware.concurrency import ConcurrencyConfig, ConcurrencyLimitMiddleware
+from src.middleware.metrics import MetricsMiddleware
+from src.middleware.profiling import ProfileStore, ProfilingConfig, ProfilingMiddleware
+from src.middleware.request_id import RequestIdMiddleware
+from src.middleware.tracing import TracingMiddleware
+from src.routes.admin import router as admin_router
 from src.routes.auth import router as auth_router
+from src.routes.health import router as health_router
 from src.routes.hello_world import router as hello_world_router
+from src.routes.metrics import router as metrics_router
 from src.routes.user import router as user_router
+from src.services.logger.interfaces.i_logger import ILogger
+from src.services.metrics.interfaces.i_metrics import IMetrics
+from src.services.tracing.interfaces.i_tracer import ITracer
+from src.services.users.interfaces.i_user_repository import IUserRepository
 
 fastapi_app = FastAPI()
 
+# Injecting middlewares into app.
+# Their dependencies are stand-ins: importing the application reads no configuration,
+# the instances are resolved when Starlette builds the stack, on the lifespan startup.
+# Innermost, the profiles only show the application code.
+fastapi_app.add_middleware(
+    ProfilingMiddleware,
+    config=deferred(ProfilingConfig),
+    store=deferred(ProfileStore),
+    authorize=is_admin_token,
+)
+fastapi_app.add_middleware(CompressionMiddleware, config=deferred(CompressionConfig))
+# Sheds the requests over the limits before any work, the rejections are still measured.
+fastapi_app.add_middleware(
+    ConcurrencyLimitMiddleware,
+    metrics=deferred(IMetrics),
+    config=deferred(ConcurrencyConfig),
+)
+# Latencies include the compression time.
+fastapi_app.add_middleware(MetricsMiddleware, metrics=deferred(IMetrics))
+# The root span of each request, it carries the request id.
+fastapi_app.add_middleware(TracingMiddleware, tracer=deferred(ITracer))
+# Outermost, everything done for a request is correlated to its id.
+fastapi_app.add_middleware(RequestIdMiddleware)
+
 # Injecting routers into app.
 fastapi_app.include_router(hello_world_router, prefix="/cdrt", tags=["Hello, world!"])
 fastapi_app.include_router(auth_router, prefix="/auth", tags=["Auth"])
 fastapi_app.include_router(user_router, prefix="/user", tags=["User"])
+fastapi_app.include_router(admin_router, prefix="/admin", tags=["Admin"])
+fastapi_app.include_router(metrics_router, tags=["Metrics"])
+fastapi_app.include_router(health_router, prefix="/health", tags=["Health"])
 
 
 @fastapi_app.on_event("startup")
 async def app_init():
     """Application initialization, launghed on startup state"""
+    # Settings and configuration files are read here, not when the application is imported.
+    CONTAINER.get(SettingsStore)
+    await CONTAINER.get(EventLoopMonitor).start()
     # Execute db connection.
-    await build_client()
+    repository = CONTAINER.get(IUserRepository)
+    await repository.connect()
+    await CONTAINER.get(HealthChecker).start(repository)
+
+
+@fastapi_app.on_event("shutdown")
+async def app_shutdown():
+    """Application teardown, launched on shutdown state"""
+    await CONTAINER.get(HealthChecker).stop()
+    await CONTAINER.get(IUserRepository).close()
+    await CONTAINER.get(EventLoopMonitor).stop()
+    CONTAINER.get(HashingPool).shutdown()
+    CONTAINER.get(CommandMonitor).shutdown()
+    # Export the last spans, the exporter may log failures.
+    CONTAINER.get(ITracer).shutdown()
+    # Flush the queued log records.
+    CONTAINER.get(ILogger).shutdown()
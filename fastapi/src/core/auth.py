@@ -1,20 +1,21 @@
-import sys
 from datetime import datetime, timedelta
-from os import environ
-from os.path import join
-from typing import Any, Dict, Final, List, Tuple
+from functools import lru_cache
+from typing import Final, List, Tuple, Union
 
 from jose import jwt
+from jose.backends.base import Key
 from jose.exceptions import ExpiredSignatureError, JWTError
 from passlib.context import CryptContext
-from yaml import safe_load
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from src.core.exceptions import DecodeTokenError
-from src.helpers.container import CONTAINER
+from src.core.hashing import HashingPool
+from src.core.metrics import JWT_DECODE, JWT_ENCODE, PASSWORD_HASH, PASSWORD_VERIFY
+from src.core.settings import SettingsStore
+from src.core.tracing import TRACER
+from src.helpers.container import CONTAINER, deferred
 from src.models.user import Role
-from src.services.logger.interfaces.i_logger import ILogger
 
 # This is instance will be injected in routes when those have to be secured.
 # This is just checcking the user exists and the inserted credentials are corect, role is not
@@ -28,38 +29,48 @@ OAUTH2_SCHEME: Final = OAuth2PasswordBearer(
 
 _PWD_CONTEX: Final = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+TOKEN_FIELDS: Final[set] = {"email", "username", "roles", "exp", "is_refresh"}
 
-# Read configuration file for jwt configuration.
-JWT_CONFIG: Final[Dict[str, Any]]
-try:
-    config_file_path = join(environ["CONFIGS_DIR"], "auth", "jwt_details.yaml")
-    with open(config_file_path, encoding="utf-8") as config_file_stream:
-        JWT_CONFIG = safe_load(config_file_stream)
-except Exception:
-    logger = CONTAINER.get(ILogger)
-    logger.critical(
-        "errors", f"An error occured while reading the configuration file in {__file__}"
-    )
-    sys.exit()
+# Resolved on the first password hashed, the pool is a singleton.
+_HASHING_POOL: Final[HashingPool] = deferred(HashingPool)
 
-TOKEN_FIELDS: Final[set] = {"email", "username", "roles", "exp", "is_refresh"}
+
+@lru_cache(maxsize=None)
+def _settings_store() -> SettingsStore:
+    """The settings store, resolved once: read its current settings on each call."""
+    return CONTAINER.get(SettingsStore)
 
 
 def hash_password(password: str) -> str:
     """Returning the given password with hash."""
-    return _PWD_CONTEX.hash(password)
+    with TRACER.span("auth.hash_password"), PASSWORD_HASH.time():
+        return _PWD_CONTEX.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password is correct"""
-    return _PWD_CONTEX.verify(plain_password, hashed_password)
+    with TRACER.span("auth.verify_password"), PASSWORD_VERIFY.time():
+        return _PWD_CONTEX.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Returning the given password with hash, computed in the hashing pool."""
+    # The time waiting for a free thread is the gap before the auth.hash_password child.
+    with TRACER.span("hashing_pool.run"):
+        return await _HASHING_POOL.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify password is correct, in the hashing pool."""
+    with TRACER.span("hashing_pool.run"):
+        return await _HASHING_POOL.run(verify_password, plain_password, hashed_password)
 
 
 def create_token(
     data: dict,
     expires_delta: timedelta,
     is_refresh: bool,
-    secret_key: str,
+    secret_key: Union[str, Key],
     algorithm: str,
 ) -> str:
     """Return a token for the given data.
@@ -71,7 +82,8 @@ def create_token(
     Args:
         data (dict): data to encode in jwt.
         expires_delta (timedelta): expiration time expressed in timedelta.
-        secret_key (str): secret key to apply signature to jwt.
+        secret_key (Union[str, Key]): secret key to apply signature to jwt, or the key
+            prepared once as Settings.signing_key to spare its parsing.
         algorithm (str): desired encription algoritm.
 
     Returns:
@@ -81,7 +93,8 @@ def create_token(
     expire = datetime.utcnow() + expires_delta
     to_encode.update({"exp": expire})
     to_encode.update({"is_refresh": is_refresh})
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
+    with TRACER.span("auth.create_token", {"is_refresh": is_refresh}), JWT_ENCODE.time():
+        encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
     return encoded_jwt
 
 
@@ -100,12 +113,14 @@ def decode_token(encoded_token: str) -> dict:
 
     # This function is tested when testing the /auth/refresh route.
     decoded_token: dict
+    settings = _settings_store().current
     try:
-        decoded_token = jwt.decode(
-            token=encoded_token,
-            key=environ["SECRET_KEY"],
-            algorithms=JWT_CONFIG["algorithm"],
-        )
+        with TRACER.span("auth.decode_token"), JWT_DECODE.time():
+            decoded_token = jwt.decode(
+                token=encoded_token,
+                key=settings.signing_key,
+                algorithms=settings.jwt.algorithm,
+            )
     except ExpiredSignatureError as e:
         msg = "The provided token is expired"
         raise DecodeTokenError(loggable=str(e), msg=msg) from e
@@ -222,8 +237,11 @@ def is_admin(token: str = Depends(OAUTH2_SCHEME)) -> Tuple[bool, bool, dict]:
         bool: True if the user is admin (valid token), False otherwise.
         dict: Dictionary contining the decoded token if is authorized, otherwise empty dictionary.
     """
-    authorized, decoded_token = is_authorized(token)
+    return _admin_result(*is_authorized(token))
+
 
+def _admin_result(authorized: bool, decoded_token: dict) -> Tuple[bool, bool, dict]:
+    """The result of is_admin for the result of is_authorized."""
     if not authorized:
         return authorized, False, {}
 
@@ -233,6 +251,25 @@ def is_admin(token: str = Depends(OAUTH2_SCHEME)) -> Tuple[bool, bool, dict]:
     return authorized, True, decoded_token
 
 
+def is_admin_token(token: str) -> bool:
+    """This function will say if a token belongs to an admin, without raising.
+
+    Meant for the code running outside of the routes, as the middlewares, where an
+    HTTPException is not turned into a response.
+
+    Args:
+        token (str): the encoded token.
+
+    Returns:
+        bool: True if the token is a valid access token of an admin, False otherwise.
+    """
+    try:
+        authorized, admin, _ = is_admin(token)
+    except (HTTPException, DecodeTokenError):
+        return False
+    return authorized and admin
+
+
 def require_admin(token: str = Depends(OAUTH2_SCHEME)) -> None:
     """This function will chck if an user is admin or not, if not raise an HTTPException.
 
@@ -249,3 +286,60 @@ def require_admin(token: str = Depends(OAUTH2_SCHEME)) -> None:
 
     if not admin:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
+
+
+# The dependencies of the routes. FastAPI runs the plain functions in its thread pool, these
+# coroutines run on the event loop; decoding a token takes a few microseconds. They share
+# the caller of the request: the token is decoded once, whatever the dependencies needing it.
+async def is_authorized_async(token: str = Depends(OAUTH2_SCHEME)) -> Tuple[bool, dict]:
+    """This function is is_authorized as a coroutine.
+
+    Args:
+        token (str, optional): Token read from the header. Defaults to Depends(OAUTH2_SCHEME).
+
+    Raises:
+        HTTPException: When the token is invalid an exception is thrown.
+
+    Returns:
+        bool: True if the user is authenticated (has a valid accesss token), False otherwise.
+        dict: Dictionary contining the decoded token if is authorized, otherwise empty dictionary.
+    """
+    return is_authorized(token)
+
+
+async def is_admin_async(
+    authorization: Tuple[bool, dict] = Depends(is_authorized_async),
+) -> Tuple[bool, bool, dict]:
+    """This function is is_admin as a coroutine, on the caller of the request.
+
+    Args:
+        authorization (Tuple[bool, dict], optional): the caller of the request.
+            Defaults to Depends(is_authorized_async).
+
+    Returns:
+        bool: True if the user is authenticated (has a valid accesss token), False otherwise.
+        bool: True if the user is admin (valid token), False otherwise.
+        dict: Dictionary contining the decoded token if is authorized, otherwise empty dictionary.
+    """
+    return _admin_result(*authorization)
+
+
+async def require_admin_async(
+    admin_result: Tuple[bool, bool, dict] = Depends(is_admin_async),
+) -> None:
+    """This function is require_admin as a coroutine, on the caller of the request.
+
+    Args:
+        admin_result (Tuple[bool, bool, dict], optional): the caller of the request.
+            Defaults to Depends(is_admin_async).
+
+    Raises:
+        HTTPException: Missing authorization or forbidden acces (not admin).
+    """
+    authorized, admin, _ = admin_result
+
+    if not authorized:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED)
+
+    if not admin:
+        raise HTTPException(status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,6 @@
+from contextvars import ContextVar
+from typing import Final, Optional
+
+# Identifier of the request being served, set by the request id middleware
+# and read by everything that has to be correlated to the request (e.g. logs).
+REQUEST_ID: Final[ContextVar[Optional[str]]] = ContextVar("request_id", default=None)
@@ -18,3 +18,7 @@ class DecodeTokenError(BaseCdrtException):
 
 class ValidateTokenError(BaseCdrtException):
     """Custom class to express an exception while token validation."""
+
+
+class DuplicateUserError(BaseCdrtException):
+    """Custom class to express a user taking the username or the email of another one."""
@@ -0,0 +1,62 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class HashingPoolConfig(BaseModel):
+    """Password hashing pool configuration."""
+
+    # Threads running bcrypt, it releases the GIL so they run in parallel.
+    workers: int = Field(4, ge=1)
+
+
+class HashingPool:
+    """
+    Threads dedicated to the password hashing, bcrypt takes hundreds of milliseconds
+    and would block the event loop for all the other requests.
+    """
+
+    def __init__(self, config: HashingPoolConfig) -> None:
+        self.workers = config.workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.workers, thread_name_prefix="hashing"
+        )
+        # Submitted and not completed, only touched by the event loop thread.
+        self._pending = 0
+
+    @property
+    def backlog(self) -> int:
+        """Hashing requests waiting for a free thread."""
+        return max(0, self._pending - self.workers)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run the given function in the pool.
+
+        Args:
+            func (Callable[..., T]): the function to run.
+            args (Any): the function arguments.
+
+        Returns:
+            T: the function result.
+        """
+        self._pending += 1
+        # The request context (request id, current span) follows the function.
+        context = copy_context()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, context.run, func, *args
+            )
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """
+        Stop the threads, the hashing requests in progress are completed.
+        """
+        self._executor.shutdown(wait=True)
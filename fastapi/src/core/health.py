@@ -0,0 +1,142 @@
+import asyncio
+from time import monotonic, perf_counter
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from src.core.hashing import HashingPool
+from src.core.loop_monitor import EventLoopMonitor
+from src.db.monitoring import PoolMonitor
+from src.services.logger.interfaces.i_bound_logger import IBoundLogger
+from src.services.users.interfaces.i_user_repository import IUserRepository
+
+
+class HealthConfig(BaseModel):
+    """Readiness thresholds, above any of them the instance asks to be drained."""
+
+    # Seconds between two MongoDB pings, the probes read the cached result.
+    ping_interval: float = Field(5, gt=0)
+    ping_timeout: float = Field(2, gt=0)
+    max_ping_ms: float = Field(250, gt=0)
+    # Operations waiting for a free MongoDB connection.
+    max_pool_wait_queue: int = Field(20, ge=0)
+    # Password hashes waiting for a free hashing thread.
+    max_hashing_backlog: int = Field(16, ge=0)
+    max_loop_lag_ms: float = Field(200, gt=0)
+
+
+class HealthChecker:
+    """
+    Compare the saturation signals of the instance with the configured thresholds.
+
+    The probes never do I/O: MongoDB is pinged in background and the probes read
+    the last result, a slow database can not make the probes time out.
+    """
+
+    def __init__(
+        self,
+        config: HealthConfig,
+        loop_monitor: EventLoopMonitor,
+        hashing_pool: HashingPool,
+        pool_monitor: PoolMonitor,
+        logger: IBoundLogger,
+    ) -> None:
+        self.config = config
+        self._loop_monitor = loop_monitor
+        self._hashing_pool = hashing_pool
+        self._pool_monitor = pool_monitor
+        self._logger = logger
+        self._ping_ms: Optional[float] = None
+        self._pinged_at: Optional[float] = None
+        self._ping_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    async def start(self, repository: IUserRepository) -> None:
+        """
+        Start pinging the database in background.
+
+        Args:
+            repository (IUserRepository): the application user repository.
+        """
+        if self._task is None:
+            self._stopped = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._ping_forever(repository))
+
+    async def stop(self) -> None:
+        """
+        Stop pinging MongoDB.
+        """
+        if self._task is not None:
+            # wait_for may swallow a cancellation arriving as the ping completes,
+            # the event stops the loop anyway.
+            self._stopped.set()
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def readiness(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return each readiness check with its value, threshold and outcome.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: checks by name.
+        """
+        config = self.config
+        return {
+            "mongo_ping_ms": self._ping_check(),
+            "mongo_pool_wait_queue": _check(
+                self._pool_monitor.waiting, config.max_pool_wait_queue
+            ),
+            "hashing_backlog": _check(self._hashing_pool.backlog, config.max_hashing_backlog),
+            "event_loop_lag_ms": _check(self._loop_monitor.lag * 1000, config.max_loop_lag_ms),
+        }
+
+    # Private methods.
+    def _ping_check(self) -> Dict[str, Any]:
+        """
+        Check the last ping, a missing or stale ping makes the instance not ready.
+
+        Returns:
+            Dict[str, Any]: the check.
+        """
+        check = _check(self._ping_ms, self.config.max_ping_ms)
+        # Missed pings, the ping task is stuck or too slow.
+        stale_after = 3 * self.config.ping_interval + self.config.ping_timeout
+        if self._pinged_at is None or monotonic() - self._pinged_at > stale_after:
+            check["ok"] = False
+        if self._ping_error is not None:
+            check["ok"] = False
+            check["error"] = self._ping_error
+        return check
+
+    async def _ping_forever(self, repository: IUserRepository) -> None:
+        """
+        Ping the database every interval and cache the latency.
+
+        Args:
+            repository (IUserRepository): the application user repository.
+        """
+        while not self._stopped.is_set():
+            start = perf_counter()
+            try:
+                await asyncio.wait_for(repository.ping(), timeout=self.config.ping_timeout)
+                self._ping_ms = (perf_counter() - start) * 1000
+                self._ping_error = None
+            except Exception as e:  # pylint: disable=broad-except
+                self._ping_ms = None
+                self._ping_error = str(e) or type(e).__name__
+                self._logger.warning("Database ping failed: %s", self._ping_error)
+            self._pinged_at = monotonic()
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.config.ping_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+def _check(value: Optional[float], threshold: float) -> Dict[str, Any]:
+    """Build a check, missing values are never ok."""
+    return {"value": value, "threshold": threshold, "ok": value is not None and value <= threshold}
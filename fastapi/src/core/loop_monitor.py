@@ -0,0 +1,151 @@
+import asyncio
+import sys
+import traceback
+from threading import Event, Thread, get_ident
+from time import monotonic
+from typing import Final, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from src.services.logger.interfaces.i_bound_logger import IBoundLogger
+from src.services.metrics.interfaces.i_metrics import IMetrics
+
+# A healthy loop lags well below a millisecond, a blocking call moves to the tens.
+LAG_BUCKETS: Final[Tuple[float, ...]] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+
+class LoopMonitorConfig(BaseModel):
+    """Event loop monitor configuration."""
+
+    # Seconds between two lag probes.
+    interval: float = Field(0.25, gt=0)
+    # The loop held longer than this (in seconds) counts as blocked.
+    block_threshold: float = Field(0.1, gt=0)
+    # Log the stack of the code blocking the loop, always on in asyncio debug mode.
+    capture_stacks: bool = False
+
+
+class EventLoopMonitor:
+    """
+    Measure how late the event loop runs a callback scheduled at a known time,
+    the lag is the time the loop spent on something else: a blocking call.
+
+    With the stack capture enabled a watchdog thread looks at the probe heartbeat,
+    when the loop is held longer than the threshold the stack of the loop thread,
+    the blocking code, is logged once for each block.
+    """
+
+    def __init__(
+        self, config: LoopMonitorConfig, logger: IBoundLogger, metrics: IMetrics
+    ) -> None:
+        self.config = config
+        self._logger = logger
+        self._lag = metrics.histogram(
+            "event_loop_lag_seconds",
+            "Delay of the event loop in running the scheduled callbacks, in seconds.",
+            buckets=LAG_BUCKETS,
+        ).labels()
+        self._blocks = metrics.counter(
+            "event_loop_blocks",
+            "Times the event loop has been held longer than the block threshold.",
+        ).labels()
+        # Last measured lag, in seconds.
+        self.lag = 0.0
+        self.blocks = 0
+        self.last_block_stack: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[Thread] = None
+        self._stop = Event()
+        self._heartbeat = 0.0
+        self._loop_thread_id = 0
+
+    async def start(self) -> None:
+        """
+        Start monitoring the running event loop.
+        """
+        if self._task is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = get_ident()
+        self._heartbeat = monotonic()
+        self._task = loop.create_task(self._probe())
+
+        if self.config.capture_stacks or loop.get_debug():
+            # asyncio debug mode also logs the slow callbacks, with the same threshold.
+            loop.slow_callback_duration = self.config.block_threshold
+            self._stop.clear()
+            self._watchdog = Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        """
+        Stop monitoring.
+        """
+        self._stop.set()
+        if self._watchdog is not None:
+            # The watchdog wakes up every half threshold, never wait for it on the loop.
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # Private methods.
+    async def _probe(self) -> None:
+        """
+        Sleep for the interval and measure how late the loop wakes up.
+        """
+        loop = asyncio.get_running_loop()
+        interval = self.config.interval
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+            self.lag = max(0.0, loop.time() - start - interval)
+            self._heartbeat = monotonic()
+            self._lag.observe(self.lag)
+            if self.lag >= self.config.block_threshold:
+                self.blocks += 1
+                self._blocks.inc()
+
+    def _watch(self) -> None:
+        """
+        Log the loop thread stack when the probe is late by more than the threshold.
+        """
+        threshold = self.config.block_threshold
+        late_after = self.config.interval + threshold
+        captured_heartbeat = None
+        while not self._stop.wait(threshold / 2):
+            heartbeat = self._heartbeat
+            held = monotonic() - heartbeat
+            # Once for each block, the heartbeat moves when the loop is released.
+            if held < late_after or heartbeat == captured_heartbeat:
+                continue
+            captured_heartbeat = heartbeat
+
+            # pylint: disable=protected-access
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            self.last_block_stack = "".join(traceback.format_stack(frame))
+            self._logger.warning(
+                "Event loop blocked for more than %.0f ms at:\n%s",
+                (held - self.config.interval) * 1000,
+                self.last_block_stack,
+            )
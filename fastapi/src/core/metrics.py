@@ -0,0 +1,40 @@
+from typing import Final, Tuple
+
+from src.helpers.container import CONTAINER
+from src.services.metrics.interfaces.i_metric import IHistogram
+from src.services.metrics.interfaces.i_metrics import IMetrics
+
+# Internal phases go from tens of microseconds (serialization) to hundreds of milliseconds
+# (bcrypt), the request latency buckets would put most of them in the first bucket.
+PHASE_BUCKETS: Final[Tuple[float, ...]] = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+_PHASES: Final = CONTAINER.get(IMetrics).histogram(
+    "app_phase_duration_seconds",
+    "Time spent in the internal phases of the requests, in seconds.",
+    ("phase",),
+    PHASE_BUCKETS,
+)
+
+# Resolved once, timing a phase costs two clock reads and a bucket increment.
+PASSWORD_HASH: Final[IHistogram] = _PHASES.labels("password_hash")
+PASSWORD_VERIFY: Final[IHistogram] = _PHASES.labels("password_verify")
+JWT_ENCODE: Final[IHistogram] = _PHASES.labels("jwt_encode")
+JWT_DECODE: Final[IHistogram] = _PHASES.labels("jwt_decode")
+SERIALIZE_JSON: Final[IHistogram] = _PHASES.labels("serialize_json")
+SERIALIZE_MSGPACK: Final[IHistogram] = _PHASES.labels("serialize_msgpack")
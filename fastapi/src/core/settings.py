@@ -0,0 +1,150 @@
+from datetime import timedelta
+from os import environ
+from os.path import join
+from threading import Lock
+from typing import Any, Optional
+
+from jose import jwk
+from jose.backends.base import Key
+from pydantic import BaseModel, BaseSettings, Field, PrivateAttr, SecretStr
+
+from src.helpers.config import load_yaml_model
+from src.services.users.enums.backend import DatabaseBackend
+
+
+class JwtConfig(BaseModel):
+    """Signature and lifetimes of the tokens."""
+
+    algorithm: str = "HS256"
+    # Minutes.
+    access_expiration: int = Field(..., gt=0)
+    refresh_expiration: int = Field(..., gt=0)
+
+    _access_delta: timedelta = PrivateAttr()
+    _refresh_delta: timedelta = PrivateAttr()
+
+    class Config:
+        allow_mutation = False
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._access_delta = timedelta(minutes=self.access_expiration)
+        self._refresh_delta = timedelta(minutes=self.refresh_expiration)
+
+    @property
+    def access_delta(self) -> timedelta:
+        """Lifetime of the access tokens."""
+        return self._access_delta
+
+    @property
+    def refresh_delta(self) -> timedelta:
+        """Lifetime of the refresh tokens."""
+        return self._refresh_delta
+
+
+class Settings(BaseSettings):
+    """
+    Settings of the application, each field is read from the environment variable
+    with the same name in upper case; the JWT configuration comes from configs/auth.
+    The values derived from the fields are computed once, when the settings are loaded.
+    """
+
+    secret_key: SecretStr
+    configs_dir: str
+    logging_dir: str
+    # The logging configuration is configs/log/log_<logging_profile>.yaml.
+    logging_profile: str = "prod"
+    # Seconds, when set the logging configuration is applied as soon as it changes.
+    logging_watch_interval: Optional[float] = Field(None, gt=0)
+    db_backend: DatabaseBackend = DatabaseBackend.MONGO
+    db_username: str
+    db_password: SecretStr
+    db_host: str
+    db_port: str
+    db_name: str
+    # MongoDB connections of the process, set by the production server for each worker.
+    db_max_pool_size: int = Field(100, gt=0)
+    # Database file of the sqlite backend, <db_name>.sqlite3 when missing.
+    db_sqlite_path: Optional[str] = None
+    jwt: JwtConfig
+
+    _signing_key: Key = PrivateAttr()
+    _mongo_url: str = PrivateAttr()
+
+    class Config:
+        allow_mutation = False
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        # Prepared once, jose would otherwise parse the secret on each signature check.
+        self._signing_key = jwk.construct(self.secret_key.get_secret_value(), self.jwt.algorithm)
+        self._mongo_url = (
+            f"mongodb://{self.db_username}:{self.db_password.get_secret_value()}"
+            f"@{self.db_host}:{self.db_port}/{self.db_name}"
+        )
+
+    @property
+    def signing_key(self) -> Key:
+        """Key signing and verifying the tokens, built from the secret key."""
+        return self._signing_key
+
+    @property
+    def mongo_url(self) -> str:
+        """The MongoDB connection string, credentials included."""
+        return self._mongo_url
+
+    def config_file(self, *parts: str) -> str:
+        """
+        Return the path of a configuration file.
+
+        Args:
+            *parts (str): path of the file below the configuration directory.
+
+        Returns:
+            str: the path.
+        """
+        return join(self.configs_dir, *parts)
+
+
+def load_settings() -> Settings:
+    """Read the settings from the environment and the configuration files.
+
+    Returns:
+        Settings: the validated settings.
+    """
+    jwt_config = load_yaml_model(
+        JwtConfig, join(environ["CONFIGS_DIR"], "auth", "jwt_details.yaml")
+    )
+    return Settings(jwt=jwt_config)
+
+
+class SettingsStore:
+    """
+    Holder of the current settings. A reload validates the new settings completely before
+    swapping the reference at once: a reader gets either the old or the new settings,
+    never a mix, and an invalid configuration leaves the current settings in place.
+
+    Read the settings once per operation, e.g. a request, to use a single version.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.current = settings
+        self._lock = Lock()
+
+    def reload(self) -> Settings:
+        """
+        Read again the environment and the configuration files.
+
+        Raises:
+            pydantic.ValidationError: when the new settings are not valid.
+            OSError: when a configuration file cannot be read.
+            jose.exceptions.JWKError: when the secret key does not suit the algorithm.
+
+        Returns:
+            Settings: the new settings.
+        """
+        # Two concurrent reloads would otherwise race for the swap.
+        with self._lock:
+            settings = load_settings()
+            self.current = settings
+        return settings
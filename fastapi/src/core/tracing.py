@@ -0,0 +1,8 @@
+from typing import Final
+
+from src.helpers.container import deferred
+from src.services.tracing.interfaces.i_tracer import ITracer
+
+# Resolved on the first span, a span below a request not sampled costs a context
+# variable read.
+TRACER: Final[ITracer] = deferred(ITracer)
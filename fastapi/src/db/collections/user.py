@@ -1,4 +1,5 @@
 from datetime import datetime
+from os import environ
 from typing import List
 
 from beanie import Document, Indexed
@@ -19,4 +20,5 @@ class User(Document):
         # pylint: disable=fixme
         # TODO: create PyLint beanie plugin to prevent this warning
         # pylint: disable=too-few-public-methods
-        name = "users"
+        # A collection of its own lets parallel test runs share a database.
+        name = environ.get("DB_USERS_COLLECTION", "users")
@@ -1,29 +1,80 @@
-from os import environ
-from typing import Final
+from functools import lru_cache
+from typing import Any, Optional, Sequence
 
 from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
+from src.core.settings import Settings
 from src.db.collections import user
+from src.db.memory import DEFAULT_USERS, MemoryClient
+from src.db.monitoring import CommandMonitor
+from src.services.users.enums.backend import DatabaseBackend
 
-# pylint: disable=fixme
-# TODO: Move to config file.
-# TODO: Handle correctly secrets.
-_DATABASE_USERNAME: Final[str] = environ["DB_USERNAME"]
-_DATABASE_PASSOWRD: Final[str] = environ["DB_PASSWORD"]
-_DATABASE_HOST: Final[str] = environ["DB_HOST"]
-_DATABASE_PORT: Final[str] = environ["DB_PORT"]
-_DATABASE_NAME: Final[str] = environ["DB_NAME"]
 
-# pylint: disable=line-too-long
-_CONNECTION_STRING = f"mongodb://{_DATABASE_USERNAME}:{_DATABASE_PASSOWRD}@{_DATABASE_HOST}:{_DATABASE_PORT}/{_DATABASE_NAME}"
+@lru_cache(maxsize=None)
+def _memory_client(database_name: str) -> MemoryClient:
+    """The in-process client, shared by every connection as a MongoDB server would be.
 
+    Args:
+        database_name (str): database of the users collection.
 
-async def build_client() -> None:
+    Returns:
+        MemoryClient: the client, the users of mongo-init.js already inserted.
     """
-    Build MongoDB client with beanie.
+    client = MemoryClient()
+    client[database_name][user.User.Settings.name].load(DEFAULT_USERS)
+    return client
+
+
+async def build_client(
+    settings: Settings,
+    command_monitor: Optional[CommandMonitor] = None,
+    listeners: Sequence[Any] = (),
+) -> AsyncIOMotorClient | MemoryClient:
+    """
+    Build MongoDB client with beanie, or the in-process one when DB_BACKEND is memory.
+
+    Args:
+        settings (Settings): the application settings.
+        command_monitor (Optional[CommandMonitor], optional): listener explaining the slow
+            queries with the same client. Defaults to None.
+        listeners (Sequence[Any], optional): further command and pool listeners.
+            Defaults to ().
+
+    Returns:
+        AsyncIOMotorClient | MemoryClient: the client.
     """
-    client = AsyncIOMotorClient(_CONNECTION_STRING)
+    if settings.db_backend == DatabaseBackend.MEMORY:
+        client = _memory_client(settings.db_name)
+    else:
+        event_listeners = [*listeners]
+        if command_monitor is not None:
+            event_listeners.insert(0, command_monitor)
+        client = AsyncIOMotorClient(
+            settings.mongo_url,
+            maxPoolSize=settings.db_max_pool_size,
+            event_listeners=event_listeners,
+        )
+        if command_monitor is not None:
+            # Slow queries are explained with the same client, outside the event loop.
+            command_monitor.attach(client.delegate)
     await init_beanie(
-        client[_DATABASE_NAME], document_models=[user.User], allow_index_dropping=True
+        client[settings.db_name], document_models=[user.User], allow_index_dropping=True
     )
+    return client
+
+
+def build_bulk_database(settings: Settings, max_pool_size: int) -> AsyncIOMotorDatabase:
+    """
+    Build the database of a client without monitoring and beanie, for bulk jobs as the
+    seeding where the listeners would only add overhead. Close it with database.client.close().
+
+    Args:
+        settings (Settings): the application settings.
+        max_pool_size (int): connections of the client, one for each parallel write.
+
+    Returns:
+        AsyncIOMotorDatabase: the database.
+    """
+    client = AsyncIOMotorClient(settings.mongo_url, maxPoolSize=max_pool_size)
+    return client[settings.db_name]
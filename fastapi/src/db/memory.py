@@ -0,0 +1,438 @@
+"""In-process stand-in of the Motor client, selected with DB_BACKEND=memory.
+
+Beanie and the routes run unchanged on top of it: only the collection methods and the
+query shapes used by beanie for the users collection are supported, i.e. equality,
+$in, $all and $regex filters combined with $and, sort, skip, limit and projection,
+unique indexes, $set/$unset updates with upsert. The documents live in the process,
+no network round trip is made: meant for the tests and the benchmarks.
+"""
+import re
+from datetime import datetime
+from typing import Any, Dict, Final, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import IndexModel, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.results import DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+# Reported to beanie, which checks the server version during the initialization.
+SERVER_VERSION: Final[str] = "6.0.0"
+
+# The users inserted by mongo/docker-entrypoint-initdb.d/mongo-init.js.
+DEFAULT_USERS: Final[Tuple[Dict[str, Any], ...]] = (
+    {
+        "email": "admin@email.com",
+        "username": "admin",
+        "password": "$2b$12$N/LPnzvpHyE2KI2cuxhMz.3FSnF7MuoN6EeDKtE9yGiqMBVj3US/e",
+        "roles": ["admin"],
+        "creation": datetime(2022, 8, 5, 17, 35, 0, 60000),
+        "last_update": datetime(2022, 8, 5, 17, 35, 0, 60000),
+    },
+    {
+        "email": "user@email.com",
+        "username": "user",
+        "password": "$2b$12$bCT0LidMlwjjA1YCKtZkxeuc74CU1R1zxqE9ntSE7s7IYkP2fbtrK",
+        "roles": ["user"],
+        "creation": datetime(2022, 7, 15, 21, 37),
+        "last_update": datetime(2022, 7, 15, 21, 37),
+    },
+)
+
+_ID: Final[str] = "_id"
+
+
+def _copy(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a document, the lists too: the stored documents are never shared."""
+    return {
+        key: list(value) if isinstance(value, list) else value for key, value in document.items()
+    }
+
+
+def _plain(query: Any) -> Any:
+    """Rebuild a filter with str keys: the beanie expression fields override ==."""
+    if isinstance(query, dict):
+        return {str(key): _plain(value) for key, value in query.items()}
+    if isinstance(query, list):
+        return [_plain(value) for value in query]
+    return query
+
+
+def _matches_value(value: Any, condition: Any) -> bool:
+    """Tell if a field value satisfies a filter condition, arrays match by element."""
+    if isinstance(condition, dict) and condition and next(iter(condition)).startswith("$"):
+        for operator, operand in condition.items():
+            match operator:
+                case "$eq":
+                    if not _matches_value(value, operand):
+                        return False
+                case "$ne":
+                    if _matches_value(value, operand):
+                        return False
+                case "$in":
+                    if not any(_matches_value(value, item) for item in operand):
+                        return False
+                case "$all":
+                    if not isinstance(value, list) or any(item not in value for item in operand):
+                        return False
+                case "$regex":
+                    if not isinstance(value, str) or re.search(operand, value) is None:
+                        return False
+                case _:
+                    raise OperationFailure(f"unknown operator: {operator}")
+        return True
+    if isinstance(value, list) and not isinstance(condition, list):
+        return condition in value
+    return value == condition
+
+
+def matches(document: Dict[str, Any], query: Optional[Dict[str, Any]]) -> bool:
+    """Tell if a document satisfies a filter.
+
+    Args:
+        document (Dict[str, Any]): the document.
+        query (Optional[Dict[str, Any]]): the filter, None or empty match everything.
+
+    Returns:
+        bool: True if the document satisfies the filter.
+    """
+    for key, condition in (query or {}).items():
+        if key == "$and":
+            if not all(matches(document, sub_query) for sub_query in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(document, sub_query) for sub_query in condition):
+                return False
+        elif not _matches_value(document.get(key), condition):
+            return False
+    return True
+
+
+def _project(document: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a copy of the document with only the projected fields, _id included by default."""
+    if not projection:
+        return _copy(document)
+    included = {key for key, value in projection.items() if value}
+    if projection.get(_ID, 1):
+        included.add(_ID)
+    return _copy({key: value for key, value in document.items() if key in included})
+
+
+class MemoryCursor:
+    """Cursor over the already found documents."""
+
+    def __init__(self, documents: List[Dict[str, Any]]) -> None:
+        self._documents = iter(documents)
+
+    def __aiter__(self) -> "MemoryCursor":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            return next(self._documents)
+        except StopIteration as e:
+            raise StopAsyncIteration from e
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the next documents, all of them when length is None."""
+        if length is None:
+            return list(self._documents)
+        return [document for _, document in zip(range(length), self._documents)]
+
+
+class MemoryCollection:
+    """
+    Stand-in of AsyncIOMotorCollection keeping the documents in a dictionary by _id.
+    Every method completes without yielding to the event loop, so each one is atomic
+    for the coroutines of the loop.
+    """
+
+    def __init__(self, database: "MemoryDatabase", name: str) -> None:
+        self.database = database
+        self.name = name
+        self._documents: Dict[Any, Dict[str, Any]] = {}
+        # Unique indexes by name: indexed field and the _id of each indexed value.
+        self._unique: Dict[str, Tuple[str, Dict[Any, Any]]] = {}
+
+    # Indexes.
+
+    async def index_information(self) -> Dict[str, Dict[str, Any]]:
+        # pylint: disable=missing-function-docstring
+        information = {"_id_": {"key": [(_ID, 1)], "v": 2}}
+        for name, (field, _) in self._unique.items():
+            information[name] = {"key": [(field, 1)], "unique": True, "v": 2}
+        return information
+
+    async def create_indexes(self, indexes: Iterable[IndexModel]) -> List[str]:
+        """Create the indexes, only the unique ones are enforced, on a single field."""
+        names = []
+        for index in indexes:
+            document = index.document
+            names.append(document["name"])
+            if not document.get("unique") or document["name"] in self._unique:
+                continue
+            (field,) = document["key"].keys()
+            values: Dict[Any, Any] = {}
+            for document_id, stored in self._documents.items():
+                if stored.get(field) in values:
+                    raise DuplicateKeyError(f"E11000 duplicate key error index: {field}", 11000)
+                values[stored.get(field)] = document_id
+            self._unique[document["name"]] = (field, values)
+        return names
+
+    async def drop_index(self, name: str) -> None:
+        # pylint: disable=missing-function-docstring
+        self._unique.pop(name, None)
+
+    async def drop(self) -> None:
+        # pylint: disable=missing-function-docstring
+        self._documents.clear()
+        for _, values in self._unique.values():
+            values.clear()
+
+    # Reads.
+
+    def _find(self, query: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the stored documents matching the filter, in insertion order."""
+        query = _plain(query)
+        if query and isinstance(query.get(_ID), ObjectId):
+            document = self._documents.get(query[_ID])
+            return [document] if document is not None and matches(document, query) else []
+        # Equality on a unique field, as the lookups by username, goes through the index.
+        for field, values in self._unique.values():
+            value = (query or {}).get(field)
+            if value is not None and not isinstance(value, (dict, list)):
+                document = self._documents.get(values.get(value))
+                return [document] if document is not None and matches(document, query) else []
+        return [document for document in self._documents.values() if matches(document, query)]
+
+    async def find_one(
+        self,
+        filter: Optional[Dict[str, Any]] = None,  # pylint: disable=redefined-builtin
+        projection: Optional[Dict[str, Any]] = None,
+        **_: Any,
+    ) -> Optional[Dict[str, Any]]:
+        # pylint: disable=missing-function-docstring
+        found = self._find(filter)
+        return _project(found[0], projection) if found else None
+
+    def find(
+        self,
+        filter: Optional[Dict[str, Any]] = None,  # pylint: disable=redefined-builtin
+        projection: Optional[Dict[str, Any]] = None,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        **_: Any,
+    ) -> MemoryCursor:
+        # pylint: disable=missing-function-docstring
+        found = self._find(filter)
+        # Stable sorts from the last key, the documents missing the key go first.
+        for key, direction in reversed(sort or []):
+            found.sort(
+                key=lambda document, key=key: (key in document, document.get(key)),
+                reverse=direction < 0,
+            )
+        found = found[skip or 0 :]
+        if limit:
+            found = found[:limit]
+        return MemoryCursor([_project(document, projection) for document in found])
+
+    async def count_documents(
+        self, filter: Dict[str, Any], **_: Any  # pylint: disable=redefined-builtin
+    ) -> int:
+        # pylint: disable=missing-function-docstring
+        if not filter:
+            return len(self._documents)
+        return len(self._find(filter))
+
+    # Writes.
+
+    def _check_unique(self, document: Dict[str, Any], document_id: Any) -> None:
+        """Raise as MongoDB when the document would duplicate a unique value."""
+        for field, values in self._unique.values():
+            owner = values.get(document.get(field), document_id)
+            if owner != document_id:
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.name} dup key: "
+                    f"{{ {field}: {document.get(field)!r} }}",
+                    11000,
+                    {"keyPattern": {field: 1}, "keyValue": {field: document.get(field)}},
+                )
+
+    def _store(self, document: Dict[str, Any]) -> None:
+        """Store the document and index its unique values, once checked."""
+        document_id = document[_ID]
+        previous = self._documents.get(document_id)
+        for field, values in self._unique.values():
+            if previous is not None:
+                values.pop(previous.get(field), None)
+            values[document.get(field)] = document_id
+        self._documents[document_id] = document
+
+    def _insert(self, document: Dict[str, Any]) -> Any:
+        document = _copy(document)
+        document.setdefault(_ID, ObjectId())
+        if document[_ID] in self._documents:
+            raise DuplicateKeyError(
+                "E11000 duplicate key error index: _id_",
+                11000,
+                {"keyPattern": {_ID: 1}, "keyValue": {_ID: document[_ID]}},
+            )
+        self._check_unique(document, document[_ID])
+        self._store(document)
+        return document[_ID]
+
+    async def insert_one(self, document: Dict[str, Any], **_: Any) -> InsertOneResult:
+        # pylint: disable=missing-function-docstring
+        return InsertOneResult(self._insert(document), True)
+
+    async def insert_many(
+        self, documents: Iterable[Dict[str, Any]], ordered: bool = True, **_: Any
+    ) -> InsertManyResult:
+        """Insert the documents, unordered the duplicates are skipped and reported at last."""
+        inserted_ids = []
+        write_errors = []
+        for index, document in enumerate(documents):
+            try:
+                inserted_ids.append(self._insert(document))
+            except DuplicateKeyError as e:
+                write_errors.append({"index": index, "code": e.code, "errmsg": str(e), **e.details})
+                if ordered:
+                    break
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors, "nInserted": len(inserted_ids)})
+        return InsertManyResult(inserted_ids, True)
+
+    def load(self, documents: Iterable[Dict[str, Any]]) -> None:
+        """Insert the documents without awaiting, to fill the collection before it is used.
+
+        Args:
+            documents (Iterable[Dict[str, Any]]): the documents, copied.
+        """
+        for document in documents:
+            self._insert(document)
+
+    def _update(
+        self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Apply $set and $unset to the first match, return it before and after."""
+        query, update = _plain(query), _plain(update)
+        found = self._find(query)
+        if not found and not upsert:
+            return None, None
+        before = found[0] if found else None
+        after = _copy(before) if before is not None else {
+            key: value for key, value in query.items() if not key.startswith("$")
+        }
+        for operator, fields in update.items():
+            match operator:
+                case "$set":
+                    after.update(_copy(fields))
+                case "$unset":
+                    for key in fields:
+                        after.pop(key, None)
+                case _:
+                    raise OperationFailure(f"unknown update operator: {operator}")
+        after.setdefault(_ID, ObjectId())
+        self._check_unique(after, after[_ID])
+        self._store(after)
+        return before, after
+
+    async def find_one_and_update(
+        self,
+        filter: Dict[str, Any],  # pylint: disable=redefined-builtin
+        update: Dict[str, Any],
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        **_: Any,
+    ) -> Optional[Dict[str, Any]]:
+        # pylint: disable=missing-function-docstring
+        before, after = self._update(filter, update, upsert)
+        document = after if return_document == ReturnDocument.AFTER else before
+        return _copy(document) if document is not None else None
+
+    async def update_one(
+        self,
+        filter: Dict[str, Any],  # pylint: disable=redefined-builtin
+        update: Dict[str, Any],
+        upsert: bool = False,
+        **_: Any,
+    ) -> UpdateResult:
+        # pylint: disable=missing-function-docstring
+        before, after = self._update(filter, update, upsert)
+        upserted = before is None and after is not None
+        result = {"n": int(after is not None), "nModified": int(before is not None)}
+        if upserted:
+            result["upserted"] = after[_ID]
+        return UpdateResult(result, True)
+
+    async def delete_one(
+        self, filter: Dict[str, Any], **_: Any  # pylint: disable=redefined-builtin
+    ) -> DeleteResult:
+        # pylint: disable=missing-function-docstring
+        found = self._find(filter)
+        if found:
+            self._delete(found[0])
+        return DeleteResult({"n": len(found[:1])}, True)
+
+    async def delete_many(
+        self, filter: Dict[str, Any], **_: Any  # pylint: disable=redefined-builtin
+    ) -> DeleteResult:
+        # pylint: disable=missing-function-docstring
+        found = self._find(filter)
+        for document in found:
+            self._delete(document)
+        return DeleteResult({"n": len(found)}, True)
+
+    def _delete(self, document: Dict[str, Any]) -> None:
+        del self._documents[document[_ID]]
+        for field, values in self._unique.values():
+            values.pop(document.get(field), None)
+
+
+class MemoryDatabase:
+    """Stand-in of AsyncIOMotorDatabase, the collections are created on first access."""
+
+    def __init__(self, client: "MemoryClient", name: str) -> None:
+        self.client = client
+        self.name = name
+        self._collections: Dict[str, MemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(self, name)
+        return self._collections[name]
+
+    async def list_collection_names(self) -> List[str]:
+        # pylint: disable=missing-function-docstring
+        return list(self._collections)
+
+    async def command(self, command: Any, **_: Any) -> Dict[str, Any]:
+        """Answer the ping and buildInfo commands only."""
+        name = command if isinstance(command, str) else next(iter(command))
+        match name:
+            case "ping":
+                return {"ok": 1.0}
+            case "buildInfo":
+                return {"version": SERVER_VERSION, "ok": 1.0}
+        raise OperationFailure(f"no such command: {name}")
+
+
+class MemoryClient:
+    """Stand-in of AsyncIOMotorClient, its databases live as long as the client."""
+
+    def __init__(self) -> None:
+        self._databases: Dict[str, MemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> MemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = MemoryDatabase(self, name)
+        return self._databases[name]
+
+    @property
+    def admin(self) -> MemoryDatabase:
+        """The admin database, answering the ping of the health checker."""
+        return self["admin"]
+
+    def close(self) -> None:
+        """Nothing to release, the documents are kept for the next connection."""
@@ -0,0 +1,430 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Final, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+from pymongo import MongoClient, monitoring
+
+from src.services.logger.interfaces.i_bound_logger import IBoundLogger
+from src.services.metrics.interfaces.i_metrics import IMetrics
+
+# Where the filter lives in the commands having one.
+_FILTER_FIELDS: Final[Dict[str, str]] = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+    "aggregate": "pipeline",
+}
+# Statement lists of the write commands, each statement has its filter under "q".
+_STATEMENTS_FIELDS: Final[Dict[str, str]] = {"update": "updates", "delete": "deletes"}
+# Only reads can be explained without side effects worth mentioning.
+_EXPLAINABLE: Final[frozenset] = frozenset({"find", "count", "distinct", "aggregate"})
+# Added by the driver, not accepted inside an explain.
+_DRIVER_FIELDS: Final[frozenset] = frozenset(
+    {"lsid", "txnNumber", "autocommit", "startTransaction"}
+)
+_REDACTED: Final[str] = "?"
+
+
+class MonitoringConfig(BaseModel):
+    """MongoDB command monitoring configuration."""
+
+    # Commands slower than this (in milliseconds) are logged with their shape.
+    slow_threshold_ms: float = Field(100, ge=0)
+    # Run explain in background for the slow read shapes.
+    explain: bool = False
+    explain_verbosity: str = "queryPlanner"
+    # Seconds before the same shape is explained again.
+    explain_interval: float = Field(300, ge=0)
+    # Slow shapes tracked at most, the others are only logged.
+    max_shapes: int = Field(500, ge=0)
+
+
+def redact(value: Any) -> Any:
+    """Return the shape of a filter: keys and operators are kept, values are replaced.
+
+    Args:
+        value (Any): filter, pipeline or any of their values.
+
+    Returns:
+        Any: the redacted copy.
+    """
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # Lists of documents ($or, pipelines) keep their structure, lists of values
+        # ($in) would make a new shape for each length.
+        if value and all(isinstance(item, dict) for item in value):
+            return [redact(item) for item in value]
+    return _REDACTED
+
+
+def command_shape(command_name: str, command: Dict[str, Any]) -> Optional[str]:
+    """Return the redacted filter shape of a command.
+
+    Args:
+        command_name (str): the command name.
+        command (Dict[str, Any]): the command document.
+
+    Returns:
+        Optional[str]: the shape, None if the command has no filter.
+    """
+    if command_name in _FILTER_FIELDS:
+        shape = redact(command.get(_FILTER_FIELDS[command_name], {}))
+    elif command_name in _STATEMENTS_FIELDS:
+        statements = command.get(_STATEMENTS_FIELDS[command_name], [])
+        shape = [redact(statement.get("q", {})) for statement in statements[:1]]
+    else:
+        return None
+    return json.dumps(shape, sort_keys=True, default=str)
+
+
+def command_collection(command_name: str, command: Dict[str, Any]) -> str:
+    """Return the collection targeted by a command, empty for the database commands."""
+    target = command.get(command_name)
+    if isinstance(target, str):
+        return target
+    # getMore carries the cursor id, the collection is given apart.
+    collection = command.get("collection")
+    return collection if isinstance(collection, str) else ""
+
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Return the stages of a query plan, from the outermost."""
+    stages = []
+    while plan:
+        stages.append(plan.get("stage", "?"))
+        if "inputStages" in plan:
+            for child in plan["inputStages"]:
+                stages.extend(_plan_stages(child))
+            break
+        plan = plan.get("inputStage") or plan.get("queryPlan")
+    return stages
+
+
+class _OperationStats:
+    """Timings of one command on one collection."""
+
+    __slots__ = ("count", "failures", "slow", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.failures = 0
+        self.slow = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class _ShapeStats:
+    """Slow executions of one filter shape."""
+
+    __slots__ = ("count", "total", "max", "plan", "explained_at")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.plan: Optional[str] = None
+        self.explained_at: Optional[float] = None
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    Observe every command sent to MongoDB.
+
+    Durations are measured by the driver and aggregated by command and collection,
+    the commands slower than the threshold are logged with their filter shape (values
+    redacted) and, when enabled, explained in background once for each shape.
+    """
+
+    def __init__(self, config: MonitoringConfig, logger: IBoundLogger, metrics: IMetrics) -> None:
+        self.config = config
+        self._logger = logger
+        self._slow_threshold = config.slow_threshold_ms / 1000
+        self._durations = metrics.histogram(
+            "mongo_command_duration_seconds",
+            "Duration of the MongoDB commands, in seconds.",
+            ("command", "collection", "outcome"),
+        )
+        # Commands in progress, by connection and request id.
+        self._pending: Dict[Tuple[Any, int], Tuple[str, Dict[str, Any]]] = {}
+        self._operations: Dict[Tuple[str, str], _OperationStats] = {}
+        self._shapes: Dict[Tuple[str, str, str], _ShapeStats] = {}
+        self._lock = Lock()
+        self._client: Optional[MongoClient] = None
+        self._explainer: Optional[ThreadPoolExecutor] = None
+
+    def attach(self, client: MongoClient) -> None:
+        """
+        Give the client used to run the explains, the one this listener is registered on.
+
+        Args:
+            client (MongoClient): pymongo client, the delegate of the motor one.
+        """
+        self._client = client
+        if self.config.explain and self._explainer is None:
+            self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mongo-explain")
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        # The explains run by this listener are not observed.
+        if event.command_name == "explain":
+            return
+        # Only a reference is kept, the shape is computed for the slow commands only.
+        self._pending[(event.connection_id, event.request_id)] = (
+            event.database_name,
+            event.command,
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        self._finished(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        self._finished(event, failed=True)
+
+    def stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return the timings by command and collection and the slow shapes,
+        durations in milliseconds, slowest first.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: "operations" and "slow_queries" statistics.
+        """
+        with self._lock:
+            operations = [
+                {
+                    "command": command,
+                    "collection": collection,
+                    "count": stats.count,
+                    "failures": stats.failures,
+                    "slow": stats.slow,
+                    "mean_ms": stats.total * 1000 / stats.count,
+                    "max_ms": stats.max * 1000,
+                }
+                for (command, collection), stats in self._operations.items()
+            ]
+            slow_queries = [
+                {
+                    "command": command,
+                    "collection": collection,
+                    "shape": shape,
+                    "count": stats.count,
+                    "mean_ms": stats.total * 1000 / stats.count,
+                    "max_ms": stats.max * 1000,
+                    "plan": stats.plan,
+                }
+                for (command, collection, shape), stats in self._shapes.items()
+            ]
+        operations.sort(key=lambda item: item["mean_ms"] * item["count"], reverse=True)
+        slow_queries.sort(key=lambda item: item["max_ms"], reverse=True)
+        return {"operations": operations, "slow_queries": slow_queries}
+
+    def shutdown(self) -> None:
+        """
+        Stop the explains in progress.
+        """
+        if self._explainer is not None:
+            self._explainer.shutdown(wait=False, cancel_futures=True)
+            self._explainer = None
+
+    # Private methods.
+    def _finished(
+        self,
+        event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent,
+        failed: bool,
+    ) -> None:
+        """
+        Record a completed command.
+
+        Args:
+            event (monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent): the event.
+            failed (bool): True if the command failed.
+        """
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        database_name, command = pending
+        command_name = event.command_name
+        collection = command_collection(command_name, command)
+        duration = event.duration_micros / 1e6
+
+        self._durations.labels(
+            command_name, collection, "failed" if failed else "succeeded"
+        ).observe(duration)
+
+        slow = duration >= self._slow_threshold
+        with self._lock:
+            stats = self._operations.get((command_name, collection))
+            if stats is None:
+                stats = self._operations.setdefault((command_name, collection), _OperationStats())
+            stats.count += 1
+            stats.total += duration
+            stats.max = max(stats.max, duration)
+            if failed:
+                stats.failures += 1
+            if slow:
+                stats.slow += 1
+
+        if slow:
+            self._slow(database_name, command_name, collection, command, duration)
+
+    def _slow(
+        self,
+        database_name: str,
+        command_name: str,
+        collection: str,
+        command: Dict[str, Any],
+        duration: float,
+    ) -> None:
+        """
+        Log a slow command and track its shape, the shape is explained when due.
+
+        Args:
+            database_name (str): the database name.
+            command_name (str): the command name.
+            collection (str): the collection name.
+            command (Dict[str, Any]): the command document, with values.
+            duration (float): the duration in seconds.
+        """
+        shape = command_shape(command_name, command)
+        self._logger.warning(
+            "Slow %s on %s.%s: %.1f ms, shape %s",
+            command_name,
+            database_name,
+            collection,
+            duration * 1000,
+            shape,
+        )
+        if shape is None:
+            return
+
+        key = (command_name, collection, shape)
+        explain = False
+        with self._lock:
+            stats = self._shapes.get(key)
+            if stats is None:
+                if len(self._shapes) >= self.config.max_shapes:
+                    return
+                stats = self._shapes[key] = _ShapeStats()
+            stats.count += 1
+            stats.total += duration
+            stats.max = max(stats.max, duration)
+
+            now = monotonic()
+            if (
+                self._explainer is not None
+                and command_name in _EXPLAINABLE
+                and (
+                    stats.explained_at is None
+                    or now - stats.explained_at >= self.config.explain_interval
+                )
+            ):
+                # Set before running, so the same shape is not queued twice.
+                stats.explained_at = now
+                explain = True
+
+        if explain:
+            self._explainer.submit(self._explain, database_name, key, command)
+
+    def _explain(
+        self, database_name: str, key: Tuple[str, str, str], command: Dict[str, Any]
+    ) -> None:
+        """
+        Explain a slow command and store its winning plan, run by the explain thread.
+
+        Args:
+            database_name (str): the database name.
+            key (Tuple[str, str, str]): command name, collection and shape.
+            command (Dict[str, Any]): the command document, with values.
+        """
+        to_explain = {
+            field: value
+            for field, value in command.items()
+            if not field.startswith("$") and field not in _DRIVER_FIELDS
+        }
+        try:
+            result = self._client[database_name].command(
+                "explain", to_explain, verbosity=self.config.explain_verbosity
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            self._logger.error("Explain of %s %s failed: %s", key[0], key[2], e)
+            return
+
+        # Aggregations nest the plan in their first stage.
+        planner = result.get("queryPlanner") or result.get("stages", [{}])[0].get(
+            "$cursor", {}
+        ).get("queryPlanner", {})
+        plan = " <- ".join(_plan_stages(planner.get("winningPlan", {}))) or None
+        with self._lock:
+            if key in self._shapes:
+                self._shapes[key].plan = plan
+        self._logger.warning("Plan of the slow %s on %s %s: %s", key[0], key[1], key[2], plan)
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    Track the MongoDB connection pool: operations waiting for a connection and
+    connections in use. Events come from the driver threads, hence the lock.
+    """
+
+    def __init__(self) -> None:
+        self.waiting = 0
+        self.checked_out = 0
+        self._lock = Lock()
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        # pylint: disable=missing-function-docstring
+        with self._lock:
+            self.waiting += 1
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        with self._lock:
+            self.waiting -= 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        with self._lock:
+            self.waiting -= 1
+            self.checked_out += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        with self._lock:
+            self.checked_out -= 1
+
+    # Nothing to track in the other pool events.
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
@@ -0,0 +1,212 @@
+"""Seed the users collection with synthetic users, to reproduce production-scale behavior.
+
+Usernames and emails are unique and valid for the user models, around 2% of the users
+are admins and the creation dates are spread over the last years. Hashing a password
+takes hundreds of milliseconds: a small pool of bcrypt hashes is computed once and shared,
+the password of the n-th user is f"{prefix}password.{n % hash_pool}".
+
+Run from the fastapi directory, with the DB_ variables set, with:
+    $ python -m src.db.seed --users 1000000
+"""
+import asyncio
+import json
+import random
+import re
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Dict, Final, List, Sequence, Tuple
+
+from beanie import init_beanie
+from pymongo.errors import BulkWriteError
+
+from src.core.auth import hash_password
+from src.core.settings import load_settings
+from src.db.collections.user import User
+from src.db.connection import build_bulk_database
+from src.models.user import Role
+
+# fmt: off
+_FIRST_NAMES: Final[Tuple[str, ...]] = (
+    "alice", "bob", "carla", "davide", "elena", "fabio", "giulia", "hugo", "irene",
+    "jonas", "kate", "luca", "marta", "nico", "olga", "paolo", "quinn", "rosa", "sara",
+    "tommaso", "ugo", "vera", "walter", "xenia", "yuri", "zoe",
+)
+_LAST_NAMES: Final[Tuple[str, ...]] = (
+    "rossi", "smith", "muller", "garcia", "bianchi", "martin", "novak", "kowalski",
+    "jensen", "silva", "dubois", "costa", "ferrari", "schmidt", "brown", "moreau",
+)
+_DOMAINS: Final[Tuple[str, ...]] = (
+    "email.com", "gmail.com", "outlook.com", "yahoo.com", "proton.me", "company.io",
+)
+# fmt: on
+
+ADMIN_RATIO: Final[float] = 0.02
+
+
+def build_password_hashes(prefix: str, size: int, workers: int) -> List[str]:
+    """Hash the pool passwords in parallel, bcrypt releases the GIL.
+
+    Args:
+        prefix (str): prefix of the seeded users.
+        size (int): passwords in the pool.
+        workers (int): hashing threads.
+
+    Returns:
+        List[str]: the hash of f"{prefix}password.{n}" at the n-th position.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(hash_password, (f"{prefix}password.{n}" for n in range(size))))
+
+
+def build_users(
+    start: int,
+    stop: int,
+    prefix: str,
+    hashes: Sequence[str],
+    now: datetime,
+    days: int,
+    rng: random.Random,
+) -> List[Dict[str, Any]]:
+    """Build the raw documents of the users in [start, stop).
+
+    Args:
+        start (int): index of the first user, the index makes username and email unique.
+        stop (int): index after the last user.
+        prefix (str): username prefix, to tell the seeded users apart.
+        hashes (Sequence[str]): password hashes, the n-th user gets hashes[n % len(hashes)].
+        now (datetime): most recent creation date.
+        days (int): creation dates are spread over the given days before now.
+        rng (random.Random): random generator, seed it for reproducible data.
+
+    Returns:
+        List[Dict[str, Any]]: documents ready for insert_many.
+    """
+    span = days * 86_400
+    admin = [Role.ADMIN.value, Role.USER.value]
+    user = [Role.USER.value]
+    documents = []
+    for n in range(start, stop):
+        username = f"{prefix}{rng.choice(_FIRST_NAMES)}.{rng.choice(_LAST_NAMES)}.{n}"
+        age = rng.random() * span
+        creation = now - timedelta(seconds=age)
+        documents.append(
+            {
+                "email": f"{username}@{rng.choice(_DOMAINS)}",
+                "username": username,
+                "password": hashes[n % len(hashes)],
+                "roles": admin if rng.random() < ADMIN_RATIO else user,
+                "creation": creation,
+                "last_update": creation + timedelta(seconds=age * rng.random()),
+            }
+        )
+    return documents
+
+
+async def seed(
+    users: int,
+    prefix: str,
+    batch_size: int,
+    parallelism: int,
+    hash_pool: int,
+    days: int,
+    clear: bool,
+    random_seed: int | None,
+) -> Dict[str, Any]:
+    """Insert the synthetic users with parallel unordered batches and build the indexes.
+
+    The next batch is built while the previous ones are written, at most parallelism
+    batches are in memory.
+
+    Args:
+        users (int): users to insert.
+        prefix (str): username prefix, also the one of the pool passwords.
+        batch_size (int): users for each insert_many.
+        parallelism (int): batches written at once, and connections of the client.
+        hash_pool (int): distinct password hashes.
+        days (int): creation dates are spread over the given days.
+        clear (bool): delete the users having the prefix first.
+        random_seed (int | None): seed of the random generator, None for a random one.
+
+    Returns:
+        Dict[str, Any]: inserted users, duplicates skipped and timings in seconds.
+    """
+    database = build_bulk_database(load_settings(), max_pool_size=parallelism)
+    collection = database[User.Settings.name]
+    rng = random.Random(random_seed)
+    report: Dict[str, Any] = {"users": users, "inserted": 0, "duplicates": 0}
+    try:
+        if clear:
+            await collection.delete_many({"username": {"$regex": f"^{re.escape(prefix)}"}})
+
+        start = perf_counter()
+        hashes = build_password_hashes(prefix, hash_pool, hash_pool)
+        report["hashing_s"] = round(perf_counter() - start, 2)
+
+        slots = asyncio.Semaphore(parallelism)
+
+        async def insert(documents: List[Dict[str, Any]]) -> None:
+            try:
+                result = await collection.insert_many(documents, ordered=False)
+                report["inserted"] += len(result.inserted_ids)
+            except BulkWriteError as e:
+                # The other documents of an unordered batch are written anyway.
+                report["inserted"] += e.details["nInserted"]
+                report["duplicates"] += len(e.details["writeErrors"])
+            finally:
+                slots.release()
+
+        start = perf_counter()
+        now = datetime.utcnow()
+        tasks = []
+        for batch_start in range(0, users, batch_size):
+            await slots.acquire()
+            batch_stop = min(users, batch_start + batch_size)
+            documents = build_users(batch_start, batch_stop, prefix, hashes, now, days, rng)
+            tasks.append(asyncio.create_task(insert(documents)))
+        await asyncio.gather(*tasks)
+        report["insert_s"] = round(perf_counter() - start, 2)
+
+        # Building the indexes once after the inserts is faster than updating them on
+        # every insert, they already exist when the application started before.
+        start = perf_counter()
+        await init_beanie(database, document_models=[User])
+        report["index_s"] = round(perf_counter() - start, 2)
+    finally:
+        database.client.close()
+    return report
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000, help="users to insert")
+    parser.add_argument("--prefix", default="seed.", help="username prefix of the seeded users")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="users per insert_many")
+    parser.add_argument("--parallelism", type=int, default=8, help="batches written at once")
+    parser.add_argument("--hash-pool", type=int, default=8, help="distinct password hashes")
+    parser.add_argument("--days", type=int, default=3 * 365, help="creation dates spread")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument(
+        "--clear", action="store_true", help="delete the users having the prefix first"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        seed(
+            args.users,
+            args.prefix,
+            args.batch_size,
+            args.parallelism,
+            args.hash_pool,
+            args.days,
+            args.clear,
+            args.seed,
+        )
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from typing import Any, Dict, Tuple
+
+from pymongo import monitoring
+
+from src.db.monitoring import command_collection, command_shape
+from src.services.tracing.enums.span_kind import SpanKind
+from src.services.tracing.interfaces.i_span import ISpan
+from src.services.tracing.interfaces.i_tracer import ITracer
+
+
+class CommandTracer(monitoring.CommandListener):
+    """
+    Add a span for each MongoDB command sent while serving a traced request.
+
+    Motor runs the driver in its executor with a copy of the caller context, the events
+    are received with the request span as the current one. Commands outside of a
+    recorded trace (heartbeats, background tasks) are ignored.
+    """
+
+    def __init__(self, tracer: ITracer) -> None:
+        self._tracer = tracer
+        # Commands in progress, by connection and request id.
+        self._spans: Dict[Tuple[Any, int], ISpan] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        current = self._tracer.current_span()
+        if current is None or not current.sampled:
+            return
+        command_name = event.command_name
+        self._spans[(event.connection_id, event.request_id)] = self._tracer.span(
+            f"mongo.{command_name}",
+            {
+                "db.system": "mongodb",
+                "db.name": event.database_name,
+                "db.operation": command_name,
+                "db.mongodb.collection": command_collection(command_name, event.command),
+                # Values are redacted, only the filter shape is recorded.
+                "db.statement": command_shape(command_name, event.command),
+            },
+            kind=SpanKind.CLIENT,
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.end()
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        # pylint: disable=missing-function-docstring
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.set_error(str(event.failure.get("errmsg", "MongoDB command failed")))
+            span.end()
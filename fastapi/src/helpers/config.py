@@ -0,0 +1,23 @@
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+from yaml import safe_load
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def load_yaml_model(model: Type[M], config_file_path: str) -> M:
+    """Read a configuration model from a YAML file, an empty file gives the defaults.
+
+    Args:
+        model (Type[M]): the configuration model.
+        config_file_path (str): absolute path of the configuration file.
+
+    Raises:
+        ValidationError: when the file content does not match the model.
+
+    Returns:
+        M: the parsed configuration.
+    """
+    with open(config_file_path, encoding="utf-8") as config_file_stream:
+        return model.parse_obj(safe_load(config_file_stream) or {})
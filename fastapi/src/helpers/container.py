@@ -1,28 +1,233 @@
-from os import environ
-from os.path import join
-from typing import Final
+from typing import Any, Final, Type, TypeVar, cast
 
-from injector import Binder, Injector, singleton
+from injector import Injector, Module, provider, singleton
 
+from src.core.hashing import HashingPool, HashingPoolConfig
+from src.core.health import HealthChecker, HealthConfig
+from src.core.loop_monitor import EventLoopMonitor, LoopMonitorConfig
+from src.core.settings import Settings, SettingsStore, load_settings
+from src.db.monitoring import CommandMonitor, MonitoringConfig, PoolMonitor
+from src.db.tracing import CommandTracer
+from src.helpers.config import load_yaml_model
+from src.middleware.compression import CompressionConfig
+from src.middleware.concurrency import ConcurrencyConfig
+from src.middleware.profiling import ProfileStore, ProfilingConfig
 from src.services.logger.implementations.logger import TimedLogger
 from src.services.logger.interfaces.i_logger import ILogger
+from src.services.metrics.implementations.registry import MetricsRegistry
+from src.services.metrics.interfaces.i_metrics import IMetrics
+from src.services.tracing.implementations.exporters import build_span_exporter
+from src.services.tracing.implementations.processor import BatchSpanProcessor
+from src.services.tracing.implementations.tracer import Tracer
+from src.services.tracing.interfaces.i_tracer import ITracer
+from src.services.tracing.models.configuration import TracingConfig
+from src.services.users.enums.backend import DatabaseBackend
+from src.services.users.implementations.mongo_repository import MongoUserRepository
+from src.services.users.implementations.sqlite_repository import SqliteUserRepository
+from src.services.users.interfaces.i_user_repository import IUserRepository
 
+T = TypeVar("T")
 
-def resolve(binder: Binder) -> None:
+
+class ApplicationModule(Module):
     """
-    This method is self explanatory, aims to resolve the dependencies of classes
+    This class is self explanatory, aims to resolve the dependencies of classes
     and interfaces. Here the instances will be created and interfaces associated
     to implementations.
 
+    Every instance is a singleton built the first time it is requested, importing
+    the application reads no configuration: the settings are loaded with the first
+    dependency needing them, at the latest on startup.
+    """
+
+    # pylint: disable=missing-function-docstring
 
-    Args:
-        injector (Injector): dependency injector.
+    @singleton
+    @provider
+    def provide_settings_store(self) -> SettingsStore:
+        return SettingsStore(load_settings())
+
+    # Not a singleton, the current settings after a reload. The hot paths read them with
+    # CONTAINER.get(SettingsStore).current, resolving a provider costs more.
+    @provider
+    def provide_settings(self, store: SettingsStore) -> Settings:
+        return store.current
+
+    @singleton
+    @provider
+    def provide_logger(self, settings: Settings) -> ILogger:
+        # DEBUG is off in the prod profile, LOGGING_PROFILE=dev turns it on.
+        logger = TimedLogger(
+            config_file_path=settings.config_file("log", f"log_{settings.logging_profile}.yaml"),
+            logging_dir=settings.logging_dir,
+        )
+        # When set, the configuration file changes are applied without restarting.
+        if settings.logging_watch_interval:
+            logger.watch(settings.logging_watch_interval)
+        return logger
+
+    @singleton
+    @provider
+    def provide_metrics(self) -> IMetrics:
+        return MetricsRegistry()
+
+    @singleton
+    @provider
+    def provide_tracer(self, settings: Settings, logger: ILogger) -> ITracer:
+        tracing_config = load_yaml_model(
+            TracingConfig, settings.config_file("tracing", "tracing.yaml")
+        )
+        span_exporter = (
+            build_span_exporter(tracing_config, settings.logging_dir)
+            if tracing_config.enabled
+            else None
+        )
+        span_processor = (
+            BatchSpanProcessor(
+                span_exporter,
+                logger.get("tracing"),
+                tracing_config.queue_size,
+                tracing_config.batch_size,
+                tracing_config.export_interval,
+            )
+            if span_exporter is not None
+            else None
+        )
+        return Tracer(tracing_config, span_processor)
+
+    @singleton
+    @provider
+    def provide_command_tracer(self, tracer: ITracer) -> CommandTracer:
+        return CommandTracer(tracer)
+
+    @singleton
+    @provider
+    def provide_command_monitor(
+        self, settings: Settings, logger: ILogger, metrics: IMetrics
+    ) -> CommandMonitor:
+        return CommandMonitor(
+            load_yaml_model(MonitoringConfig, settings.config_file("db", "monitoring.yaml")),
+            logger.get("db"),
+            metrics,
+        )
+
+    @singleton
+    @provider
+    def provide_loop_monitor(
+        self, settings: Settings, logger: ILogger, metrics: IMetrics
+    ) -> EventLoopMonitor:
+        return EventLoopMonitor(
+            load_yaml_model(LoopMonitorConfig, settings.config_file("core", "event_loop.yaml")),
+            logger.get("loop"),
+            metrics,
+        )
+
+    @singleton
+    @provider
+    def provide_hashing_pool_config(self, settings: Settings) -> HashingPoolConfig:
+        return load_yaml_model(HashingPoolConfig, settings.config_file("core", "hashing.yaml"))
+
+    @singleton
+    @provider
+    def provide_hashing_pool(self, config: HashingPoolConfig) -> HashingPool:
+        return HashingPool(config)
+
+    @singleton
+    @provider
+    def provide_pool_monitor(self) -> PoolMonitor:
+        return PoolMonitor()
+
+    @singleton
+    @provider
+    def provide_user_repository(
+        self,
+        settings: Settings,
+        tracer: ITracer,
+        command_monitor: CommandMonitor,
+        pool_monitor: PoolMonitor,
+        command_tracer: CommandTracer,
+    ) -> IUserRepository:
+        # MongoDB, or its in-process stand-in, unless an embedded SQLite file is asked for.
+        if settings.db_backend == DatabaseBackend.SQLITE:
+            return SqliteUserRepository(
+                settings.db_sqlite_path or f"{settings.db_name}.sqlite3"
+            )
+        return MongoUserRepository(
+            settings, tracer, command_monitor, [pool_monitor, command_tracer]
+        )
+
+    @singleton
+    @provider
+    def provide_health_checker(
+        self,
+        settings: Settings,
+        loop_monitor: EventLoopMonitor,
+        hashing_pool: HashingPool,
+        pool_monitor: PoolMonitor,
+        logger: ILogger,
+    ) -> HealthChecker:
+        return HealthChecker(
+            load_yaml_model(HealthConfig, settings.config_file("core", "health.yaml")),
+            loop_monitor,
+            hashing_pool,
+            pool_monitor,
+            logger.get("db"),
+        )
+
+    @singleton
+    @provider
+    def provide_profiling_config(self, settings: Settings) -> ProfilingConfig:
+        return load_yaml_model(
+            ProfilingConfig, settings.config_file("middleware", "profiling.yaml")
+        )
+
+    @singleton
+    @provider
+    def provide_profile_store(self, config: ProfilingConfig) -> ProfileStore:
+        return ProfileStore(config.buffer_size)
+
+    @singleton
+    @provider
+    def provide_compression_config(self, settings: Settings) -> CompressionConfig:
+        return load_yaml_model(
+            CompressionConfig, settings.config_file("middleware", "compression.yaml")
+        )
+
+    @singleton
+    @provider
+    def provide_concurrency_config(self, settings: Settings) -> ConcurrencyConfig:
+        return load_yaml_model(
+            ConcurrencyConfig, settings.config_file("middleware", "concurrency.yaml")
+        )
+
+
+CONTAINER: Final[Injector] = Injector([ApplicationModule()])
+
+
+class _Deferred:
     """
+    Stand-in for an instance of the container, resolved on the first attribute read.
+    The attributes are then kept on the stand-in, later reads cost as a plain attribute.
+    """
+
+    def __init__(self, interface: Type[Any]) -> None:
+        self._interface = interface
 
-    # Singletons instantiations
-    logger_config_file_path = join(environ["CONFIGS_DIR"], "log", "log_dev.yaml")
-    logger = TimedLogger(config_file_path=logger_config_file_path)
-    binder.bind(ILogger, to=logger, scope=singleton)
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(CONTAINER.get(self._interface), name)
+        setattr(self, name, value)
+        return value
 
 
-CONTAINER: Final[Injector] = Injector([resolve])
+def deferred(interface: Type[T]) -> T:
+    """
+    Return a stand-in for the instance bound to the interface, for the module level
+    references and the middleware options, which are set when the modules are imported.
+
+    Args:
+        interface (Type[T]): the bound interface or class.
+
+    Returns:
+        T: the stand-in, resolving the instance the first time it is used.
+    """
+    return cast(T, _Deferred(interface))
@@ -0,0 +1,52 @@
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, Type, TypeVar
+
+from injector import SingletonScope
+
+from src.core.tracing import TRACER
+from src.helpers.container import CONTAINER
+from src.services.tracing.interfaces.i_span import ISpan
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def provide(interface: Type[T]) -> Callable[[], Awaitable[T]]:
+    """
+    Return the FastAPI dependency of the instance bound to the interface in the container.
+    A singleton is resolved on the first request and then kept by the dependency, the
+    other bindings are resolved on each request. An interface always gets the same
+    dependency: FastAPI resolves it once per request, and the tests can replace it with
+    app.dependency_overrides[provide(interface)].
+
+    Args:
+        interface (Type[T]): the bound interface or class.
+
+    Returns:
+        Callable[[], Awaitable[T]]: the dependency, e.g. Depends(provide(ILogger)).
+    """
+    instance: Optional[T] = None
+
+    # A coroutine, FastAPI runs the plain functions in its thread pool.
+    async def dependency() -> T:
+        nonlocal instance
+        if instance is not None:
+            return instance
+        resolved = CONTAINER.get(interface)
+        binding, _ = CONTAINER.binder.get_binding(interface)
+        if binding.scope is SingletonScope:
+            instance = resolved
+        return resolved
+
+    dependency.__name__ = f"provide_{interface.__name__}"
+    return dependency
+
+
+async def request_span() -> Optional[ISpan]:
+    """
+    The server span of the current request, opened by the tracing middleware.
+
+    Returns:
+        Optional[ISpan]: the span, None when the request is not sampled.
+    """
+    return TRACER.current_span()
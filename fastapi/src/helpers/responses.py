@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+from typing import Any, Final, List, Tuple
+
+import msgpack
+from pydantic import BaseModel
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from src.core.metrics import SERIALIZE_JSON, SERIALIZE_MSGPACK
+from src.core.tracing import TRACER
+from src.models.user import Role
+
+JSON_MEDIA_TYPE: Final[str] = "application/json"
+MSGPACK_MEDIA_TYPE: Final[str] = "application/msgpack"
+# Media types accepted as an alias of MSGPACK_MEDIA_TYPE.
+MSGPACK_MEDIA_TYPES: Final[frozenset] = frozenset(
+    {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+)
+
+# Roles are sent as small integers in the binary encoding, the mapping must stay stable
+# in time because it is shared with the consumers: only append new roles.
+ROLE_CODES: Final[dict] = {Role.ADMIN: 0, Role.USER: 1}
+
+# OpenAPI description of the negotiated content, to be added to the route "responses".
+NEGOTIATED_CONTENT: Final[dict] = {
+    "content": {MSGPACK_MEDIA_TYPE: {}},
+    "description": f"Successful response, {MSGPACK_MEDIA_TYPE} is returned when requested.",
+}
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode the types msgpack does not know natively.
+    Packing is done with strict types, so str subclasses (EmailStr, Role) land here too.
+
+    Args:
+        obj (Any): object to encode.
+
+    Raises:
+        TypeError: when the object type is not supported.
+
+    Returns:
+        Any: a msgpack serializable object.
+    """
+    if isinstance(obj, Role):
+        return ROLE_CODES[obj]
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, datetime):
+        # Dates are stored as naive UTC datetimes.
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return msgpack.Timestamp.from_datetime(obj)
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    if isinstance(obj, (list, tuple)):
+        return list(obj)
+    if isinstance(obj, dict):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+class MsgPackResponse(Response):
+    """Response rendering the content with MessagePack."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=_msgpack_default, strict_types=True)
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Parse the Accept header into a list of (media type, quality) pairs.
+
+    Args:
+        accept (str): Accept header value.
+
+    Returns:
+        List[Tuple[str, float]]: media ranges with their quality.
+    """
+    media_ranges = []
+    for media_range in accept.split(","):
+        media_type, _, params = media_range.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_ranges.append((media_type.strip().lower(), quality))
+    return media_ranges
+
+
+def wants_msgpack(accept: str | None) -> bool:
+    """Say if the client prefers MessagePack over JSON.
+    JSON is kept as default, also on ties and on wildcards.
+
+    Args:
+        accept (str | None): Accept header value.
+
+    Returns:
+        bool: True if MessagePack must be returned.
+    """
+    if not accept or "msgpack" not in accept:
+        return False
+
+    msgpack_quality = 0.0
+    json_quality = 0.0
+    for media_type, quality in _parse_accept(accept):
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+    return msgpack_quality > json_quality
+
+
+def negotiated_response(accept: str | None, status_code: int, content: Any) -> Response:
+    """Build the response in the format requested by the client.
+    The same response models are used for every format, only the encoding changes.
+
+    Args:
+        accept (str | None): Accept header value.
+        status_code (int): response status code.
+        content (Any): response content (models, list of models, builtins).
+
+    Returns:
+        Response: JSONResponse by default, MsgPackResponse if requested.
+    """
+    # The same url returns different representations, caches must know it.
+    headers = {"Vary": "Accept"}
+    if wants_msgpack(accept):
+        with TRACER.span("serialize.msgpack"), SERIALIZE_MSGPACK.time():
+            return MsgPackResponse(status_code=status_code, content=content, headers=headers)
+    with TRACER.span("serialize.json"), SERIALIZE_JSON.time():
+        return JSONResponse(
+            status_code=status_code, content=jsonable_encoder(content), headers=headers
+        )
@@ -0,0 +1,213 @@
+import zlib
+from typing import Callable, Dict, Final, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Brotli is optional, when missing only gzip is offered.
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+GZIP: Final[str] = "gzip"
+BROTLI: Final[str] = "br"
+
+
+class CompressionRule(BaseModel):
+    """Overrides applied to the responses having a matching content type."""
+
+    minimum_size: Optional[int] = None
+    gzip_level: Optional[int] = Field(None, ge=0, le=9)
+    brotli_quality: Optional[int] = Field(None, ge=0, le=11)
+
+
+class CompressionConfig(BaseModel):
+    """Compression middleware configuration."""
+
+    # Bodies smaller than this (in bytes) are sent as they are.
+    minimum_size: int = 1024
+    gzip_level: int = Field(6, ge=0, le=9)
+    brotli_quality: int = Field(4, ge=0, le=11)
+    # Content type prefixes to compress, responses not matching any rule are never compressed.
+    rules: Dict[str, CompressionRule] = {
+        "application/json": CompressionRule(),
+        "text/": CompressionRule(),
+    }
+    # Paths never compressed, no matter the size.
+    excluded_paths: List[str] = []
+
+
+class _Compressor:
+    """Incremental compressor, every chunk is flushed to keep streaming responses streaming."""
+
+    process: Callable[[bytes], bytes]
+    finish: Callable[[bytes], bytes]
+
+    def __init__(self, encoding: str, level: int) -> None:
+        if encoding == BROTLI:
+            compressor = brotli.Compressor(quality=level)
+            self.process = lambda chunk: compressor.process(chunk) + compressor.flush()
+            self.finish = lambda chunk: compressor.process(chunk) + compressor.finish()
+        else:
+            # wbits=31 writes the gzip header and trailer.
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self.process = lambda chunk: compressor.compress(chunk) + compressor.flush(
+                zlib.Z_SYNC_FLUSH
+            )
+            self.finish = lambda chunk: compressor.compress(chunk) + compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing the responses with brotli or gzip,
+    following the client Accept-Encoding preferences.
+
+    Responses are compressed chunk by chunk, so streaming responses are never buffered.
+    Small bodies, already encoded bodies and content types without a rule are left untouched.
+    """
+
+    def __init__(self, app: ASGIApp, config: Optional[CompressionConfig] = None) -> None:
+        self.app = app
+        self.config = config if config is not None else CompressionConfig()
+        self._excluded_paths = frozenset(self.config.excluded_paths)
+        # Longest prefixes first, so the most specific rule wins.
+        self._rules: List[Tuple[str, CompressionRule]] = sorted(
+            self.config.rules.items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self._excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    @staticmethod
+    def _select_encoding(accept_encoding: str) -> Optional[str]:
+        """
+        Select the encoding to use given the Accept-Encoding header,
+        brotli is preferred over gzip on equal quality.
+
+        Args:
+            accept_encoding (str): Accept-Encoding header value.
+
+        Returns:
+            Optional[str]: the selected encoding, None if no supported encoding is accepted.
+        """
+        if not accept_encoding:
+            return None
+
+        qualities: Dict[str, float] = {}
+        for token in accept_encoding.lower().split(","):
+            coding, _, params = token.partition(";")
+            quality = 1.0
+            key, _, value = params.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+            qualities[coding.strip()] = quality
+
+        wildcard = qualities.get("*", 0.0)
+        candidates = [GZIP] if brotli is None else [BROTLI, GZIP]
+        best = max(candidates, key=lambda coding: qualities.get(coding, wildcard))
+        if qualities.get(best, wildcard) <= 0:
+            return None
+        return best
+
+    def rule_for(self, content_type: str) -> Optional[CompressionRule]:
+        """Return the rule matching the given content type, if any.
+
+        Args:
+            content_type (str): response content type.
+
+        Returns:
+            Optional[CompressionRule]: the matching rule, None if the type must not be compressed.
+        """
+        for prefix, rule in self._rules:
+            if content_type.startswith(prefix):
+                return rule
+        return None
+
+
+class _CompressionResponder:
+    """Wrap the send callable of a single response to compress its body."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send_wrapped = send
+        self.initial_message: Message = {}
+        self.compressor: Optional[_Compressor] = None
+        self.started = False
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        # pylint: disable=missing-function-docstring
+        if message["type"] == "http.response.start":
+            # Hold the start message until the first body chunk says how to handle it.
+            self.initial_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send_wrapped(message)
+            return
+
+        if not self.started:
+            self.started = True
+            await self._start(message)
+        elif self.passthrough:
+            await self.send_wrapped(message)
+        else:
+            if message.get("more_body", False):
+                message["body"] = self.compressor.process(message.get("body", b""))
+            else:
+                message["body"] = self.compressor.finish(message.get("body", b""))
+            await self.send_wrapped(message)
+
+    async def _start(self, message: Message) -> None:
+        """Decide on the first body chunk if and how the response must be compressed."""
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        config = self.middleware.config
+
+        rule = self.middleware.rule_for(headers.get("content-type", ""))
+        minimum_size = config.minimum_size
+        if rule is not None and rule.minimum_size is not None:
+            minimum_size = rule.minimum_size
+        # Streaming responses are compressed unless they declared a small length.
+        size = len(body) if not more_body else int(headers.get("content-length", minimum_size))
+
+        if rule is None or "content-encoding" in headers or size < minimum_size:
+            self.passthrough = True
+            await self.send_wrapped(self.initial_message)
+            await self.send_wrapped(message)
+            return
+
+        if self.encoding == BROTLI:
+            level = config.brotli_quality if rule.brotli_quality is None else rule.brotli_quality
+        else:
+            level = config.gzip_level if rule.gzip_level is None else rule.gzip_level
+        self.compressor = _Compressor(self.encoding, level)
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+            message["body"] = self.compressor.process(body)
+        else:
+            message["body"] = self.compressor.finish(body)
+            headers["Content-Length"] = str(len(message["body"]))
+
+        await self.send_wrapped(self.initial_message)
+        await self.send_wrapped(message)
@@ -0,0 +1,205 @@
+from time import perf_counter
+from typing import Dict, Final, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, root_validator
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.services.metrics.interfaces.i_metric import ICounter, IGauge
+from src.services.metrics.interfaces.i_metrics import IMetrics
+
+SHED_MESSAGE: Final[str] = "The server is overloaded, retry later"
+
+
+class RouteClassConfig(BaseModel):
+    """A class of routes sharing an adaptive concurrency limit."""
+
+    # Methods of the class, any method when empty.
+    methods: List[str] = []
+    # Path prefixes of the class.
+    paths: List[str] = ["/"]
+    # Requests slower than this (in seconds) are taken as a sign of overload.
+    target_latency: float = Field(..., gt=0)
+    initial_limit: int = Field(..., ge=1)
+    min_limit: int = Field(1, ge=1)
+    max_limit: int = Field(..., ge=1)
+
+    @root_validator(skip_on_failure=True)
+    def check_limits(cls, values):  # pylint: disable=no-self-argument
+        # pylint: disable=missing-function-docstring
+        if not values["min_limit"] <= values["initial_limit"] <= values["max_limit"]:
+            raise ValueError("expected min_limit <= initial_limit <= max_limit")
+        return values
+
+
+class ConcurrencyConfig(BaseModel):
+    """Concurrency limit middleware configuration."""
+
+    enabled: bool = True
+    # The limit of a class is multiplied by this ratio on a request slower than the target.
+    backoff_ratio: float = Field(0.9, gt=0, lt=1)
+    # Seconds sent in the Retry-After header of the rejected requests.
+    retry_after: int = Field(1, ge=0)
+    # A request belongs to the first class matching its method and path, the requests
+    # matching none are never limited.
+    classes: Dict[str, RouteClassConfig] = {}
+    # Path prefixes never limited, whatever their class.
+    excluded_paths: List[str] = []
+
+
+class AimdLimiter:
+    """
+    Concurrency limit adjusted with additive increase, multiplicative decrease (AIMD)
+    from the latency of the completed requests.
+
+    A request slower than the target multiplies the limit by the backoff ratio, once per
+    round: the requests started before the last decrease ran under the previous limit and
+    are not counted again. A request within the target adds 1 / limit, about one more
+    request per round, only while the limit is in use so that an idle class does not
+    grow up to its maximum. Used from the event loop only, no lock is needed.
+    """
+
+    def __init__(self, config: RouteClassConfig, backoff_ratio: float) -> None:
+        self.limit: float = config.initial_limit
+        self.in_flight = 0
+        self._target_latency = config.target_latency
+        self._min_limit = config.min_limit
+        self._max_limit = config.max_limit
+        self._backoff_ratio = backoff_ratio
+        self._last_decrease = float("-inf")
+
+    def try_acquire(self) -> bool:
+        """
+        Admit a request if the in-flight requests are under the limit.
+
+        Returns:
+            bool: True if admitted, the request must then be released.
+        """
+        if self.in_flight >= int(self.limit):
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, start: float, end: float) -> None:
+        """
+        Release an admitted request and adjust the limit with its latency.
+
+        Args:
+            start (float): perf_counter() when the request was admitted.
+            end (float): perf_counter() when the request completed.
+        """
+        busy = self.in_flight
+        self.in_flight -= 1
+        if end - start > self._target_latency:
+            if start >= self._last_decrease:
+                self.limit = max(self._min_limit, self.limit * self._backoff_ratio)
+                self._last_decrease = end
+        elif busy * 2 >= self.limit:
+            self.limit = min(self._max_limit, self.limit + 1 / self.limit)
+
+
+class _RouteClass:
+    """The limiter of a class and its metrics."""
+
+    __slots__ = ("methods", "paths", "limiter", "limit", "in_flight", "shed", "published")
+
+    def __init__(
+        self, name: str, config: RouteClassConfig, backoff_ratio: float, metrics: "_Metrics"
+    ) -> None:
+        self.methods = frozenset(method.upper() for method in config.methods)
+        self.paths = tuple(config.paths)
+        self.limiter = AimdLimiter(config, backoff_ratio)
+        self.limit: IGauge = metrics.limit.labels(name)
+        self.in_flight: IGauge = metrics.in_flight.labels(name)
+        self.shed: ICounter = metrics.shed.labels(name)
+        self.published = int(self.limiter.limit)
+        self.limit.inc(self.published)
+
+
+class _Metrics:
+    """Metric families of the middleware, labelled by route class."""
+
+    def __init__(self, metrics: IMetrics) -> None:
+        self.limit = metrics.gauge(
+            "http_concurrency_limit",
+            "Concurrency limit of the route class.",
+            ("route_class",),
+        )
+        self.in_flight = metrics.gauge(
+            "http_concurrency_in_flight",
+            "Requests of the route class being served.",
+            ("route_class",),
+        )
+        self.shed = metrics.counter(
+            "http_requests_shed",
+            "Requests of the route class rejected over the concurrency limit.",
+            ("route_class",),
+        )
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    ASGI middleware limiting the requests served at once by route class (e.g. cheap
+    reads, password hashing, writes), each limit adapted to the observed latency.
+
+    A request over the limit of its class is rejected at once with 503 and Retry-After,
+    before any work is done for it: queueing it would only add to the latency of the
+    requests already admitted. Requests are classified on their method and path before
+    routing, the route template is not known yet. Each worker process has its own limits.
+    """
+
+    def __init__(
+        self, app: ASGIApp, metrics: IMetrics, config: Optional[ConcurrencyConfig] = None
+    ) -> None:
+        self.app = app
+        self.config = config if config is not None else ConcurrencyConfig()
+        self._enabled = self.config.enabled
+        self._excluded_paths: Tuple[str, ...] = tuple(self.config.excluded_paths)
+        families = _Metrics(metrics)
+        self._classes: List[_RouteClass] = [
+            _RouteClass(name, class_config, self.config.backoff_ratio, families)
+            for name, class_config in self.config.classes.items()
+        ]
+        self._shed_response = JSONResponse(
+            {"detail": SHED_MESSAGE},
+            status_code=503,
+            headers={"Retry-After": str(self.config.retry_after)},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._enabled:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self._classify(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = route_class.limiter
+        if not limiter.try_acquire():
+            route_class.shed.inc()
+            await self._shed_response(scope, receive, send)
+            return
+
+        route_class.in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(start, perf_counter())
+            route_class.in_flight.dec()
+            limit = int(limiter.limit)
+            if limit != route_class.published:
+                route_class.limit.inc(limit - route_class.published)
+                route_class.published = limit
+
+    def _classify(self, method: str, path: str) -> Optional[_RouteClass]:
+        if path.startswith(self._excluded_paths):
+            return None
+        for route_class in self._classes:
+            if (not route_class.methods or method in route_class.methods) and path.startswith(
+                route_class.paths
+            ):
+                return route_class
+        return None
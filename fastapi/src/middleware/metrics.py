@@ -0,0 +1,55 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.middleware.routing import RouteTemplates
+from src.services.metrics.interfaces.i_metrics import IMetrics
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the requests latency by method, route and status,
+    and the requests in flight by method.
+
+    Routes are labelled with their path template (/user/username/{username}),
+    never with the requested path, so the number of series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: IMetrics) -> None:
+        self.app = app
+        self._durations = metrics.histogram(
+            "http_request_duration_seconds",
+            "Duration of the HTTP requests, in seconds.",
+            ("method", "route", "status"),
+        )
+        self._in_flight = metrics.gauge(
+            "http_requests_in_flight",
+            "HTTP requests being served.",
+            ("method",),
+        )
+        self._templates = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        method = scope["method"]
+        in_flight = self._in_flight.labels(method)
+        in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            in_flight.dec()
+            route = self._templates(scope)
+            self._durations.labels(method, route, str(status_code)).observe(elapsed)
@@ -0,0 +1,223 @@
+import cProfile
+import marshal
+import random
+from collections import deque
+from datetime import datetime
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Deque, Final, List, Optional
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Pyinstrument is optional, when missing cProfile is used and pstats files are stored.
+try:
+    from pyinstrument import Profiler
+except ImportError:  # pragma: no cover
+    Profiler = None
+
+PROFILE_ID_HEADER: Final[str] = "X-Profile-Id"
+HTML_MEDIA_TYPE: Final[str] = "text/html"
+PSTATS_MEDIA_TYPE: Final[str] = "application/octet-stream"
+
+
+class ProfilingConfig(BaseModel):
+    """Profiling middleware configuration."""
+
+    # Requests from an admin having this header are profiled.
+    header: str = "X-Profile"
+    # Fraction of all the requests profiled, 0 disables the sampling.
+    sample_rate: float = Field(0.0, ge=0, le=1)
+    # Seconds between two samples of the sampling profiler.
+    interval: float = Field(0.001, gt=0)
+    # Profiles kept, the oldest is dropped first.
+    buffer_size: int = Field(20, ge=1)
+
+
+class StoredProfile(BaseModel):
+    """A profiled request and its profiler output."""
+
+    profile_id: str
+    creation: datetime
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    media_type: str
+    content: bytes = Field(..., repr=False)
+
+    @property
+    def filename(self) -> str:
+        """Download file name, the extension says how to open it."""
+        extension = "html" if self.media_type == HTML_MEDIA_TYPE else "pstats"
+        return f"profile-{self.profile_id}.{extension}"
+
+
+class ProfileStore:
+    """Bounded ring buffer of the latest profiles."""
+
+    def __init__(self, size: int) -> None:
+        self._profiles: Deque[StoredProfile] = deque(maxlen=size)
+        self._lock = Lock()
+
+    def add(self, profile: StoredProfile) -> None:
+        """Store a profile, dropping the oldest one when full.
+
+        Args:
+            profile (StoredProfile): the profile.
+        """
+        with self._lock:
+            self._profiles.append(profile)
+
+    def profiles(self) -> List[StoredProfile]:
+        """Return the stored profiles, newest first.
+
+        Returns:
+            List[StoredProfile]: the profiles.
+        """
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Optional[StoredProfile]:
+        """Return a stored profile.
+
+        Args:
+            profile_id (str): the profile id.
+
+        Returns:
+            Optional[StoredProfile]: the profile, None if missing or already dropped.
+        """
+        with self._lock:
+            for profile in self._profiles:
+                if profile.profile_id == profile_id:
+                    return profile
+        return None
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling the requests asked by an admin with the profiling header,
+    plus a random sample of all the requests when a sampling rate is configured.
+
+    Pyinstrument follows the request coroutine across the awaits and gives an HTML
+    flame graph. The cProfile fallback sees the whole thread, the requests served
+    meanwhile end up in the same pstats. One request at a time is profiled.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: ProfilingConfig,
+        store: ProfileStore,
+        authorize: Callable[[str], bool],
+    ) -> None:
+        """
+        Args:
+            app (ASGIApp): the wrapped application.
+            config (ProfilingConfig): the profiling configuration.
+            store (ProfileStore): where the profiles are kept.
+            authorize (Callable[[str], bool]): says if a bearer token belongs to an admin.
+        """
+        self.app = app
+        self.config = config
+        self.store = store
+        self.authorize = authorize
+        self._header = config.header.lower().encode("latin-1")
+        self._busy = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Not profiling costs one scan of the raw headers, no parsing and no allocation.
+        if scope["type"] != "http" or self._busy or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._busy = False
+
+    def _requested(self, scope: Scope) -> bool:
+        """
+        Say if the request must be profiled.
+
+        Args:
+            scope (Scope): the request scope.
+
+        Returns:
+            bool: True if sampled or asked by an admin.
+        """
+        if self.config.sample_rate and random.random() < self.config.sample_rate:
+            return True
+
+        asked = False
+        authorization = b""
+        for name, value in scope["headers"]:
+            if name == self._header:
+                asked = True
+            elif name == b"authorization":
+                authorization = value
+        if not asked:
+            return False
+        # Only the admins can ask for a profile, the header is ignored otherwise.
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        return scheme.lower() == "bearer" and self.authorize(token)
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Serve the request under the profiler and store the result.
+
+        Args:
+            scope (Scope): the request scope.
+            receive (Receive): the ASGI receive callable.
+            send (Send): the ASGI send callable.
+        """
+        profile_id = uuid4().hex
+        status_code = 500
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = profile_id
+            await send(message)
+
+        creation = datetime.utcnow()
+        start = perf_counter()
+        if Profiler is not None:
+            profiler = Profiler(interval=self.config.interval, async_mode="enabled")
+            profiler.start()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                profiler.stop()
+                duration = perf_counter() - start
+            media_type = HTML_MEDIA_TYPE
+            content = profiler.output_html().encode("utf-8")
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                profiler.disable()
+                duration = perf_counter() - start
+            profiler.create_stats()
+            # Same format written by pstats.Stats.dump_stats.
+            media_type = PSTATS_MEDIA_TYPE
+            content = marshal.dumps(profiler.stats)
+
+        self.store.add(
+            StoredProfile(
+                profile_id=profile_id,
+                creation=creation,
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
+                duration_ms=duration * 1000,
+                media_type=media_type,
+                content=content,
+            )
+        )
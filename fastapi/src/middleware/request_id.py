@@ -0,0 +1,45 @@
+from typing import Final
+from uuid import uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.context import REQUEST_ID
+
+REQUEST_ID_HEADER: Final[str] = "X-Request-ID"
+# Incoming ids longer than this are replaced, they end up in every log line.
+_MAX_REQUEST_ID_LENGTH: Final[int] = 128
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware binding an id to each request, the id is taken from the
+    X-Request-ID header when valid or generated, then returned in the response headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if (
+            not request_id
+            or len(request_id) > _MAX_REQUEST_ID_LENGTH
+            or not request_id.isprintable()
+        ):
+            request_id = uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = REQUEST_ID.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            REQUEST_ID.reset(token)
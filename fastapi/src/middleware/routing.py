@@ -0,0 +1,43 @@
+from typing import Callable, Dict, Final
+
+from starlette.types import Scope
+
+# Name of the requests not matching any route, the raw path would explode the cardinality.
+UNMATCHED_ROUTE: Final[str] = "<unmatched>"
+
+
+class RouteTemplates:
+    """
+    Path templates of the matched routes (/user/username/{username}), never the requested
+    path, for metrics labels and span names. Filled on the first request of each route.
+    """
+
+    def __init__(self) -> None:
+        self._templates: Dict[Callable, str] = {}
+
+    def __call__(self, scope: Scope) -> str:
+        """
+        Return the path template of the route matched by the request.
+
+        Args:
+            scope (Scope): the request scope, after routing.
+
+        Returns:
+            str: the path template, UNMATCHED_ROUTE if no route matched.
+        """
+        # The router adds the matched endpoint to the scope.
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        try:
+            return self._templates[endpoint]
+        except KeyError:
+            pass
+
+        template = UNMATCHED_ROUTE
+        for route in scope["app"].routes:
+            if getattr(route, "endpoint", None) is endpoint:
+                template = route.path
+                break
+        self._templates[endpoint] = template
+        return template
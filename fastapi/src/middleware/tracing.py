@@ -0,0 +1,72 @@
+from typing import Final
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.context import REQUEST_ID
+from src.middleware.routing import RouteTemplates
+from src.services.tracing.enums.span_kind import SpanKind
+from src.services.tracing.interfaces.i_tracer import ITracer
+
+TRACEPARENT_HEADER: Final[str] = "traceparent"
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening the root span of each request, every span started while
+    serving it (hashing, JWT, MongoDB commands) becomes a descendant.
+
+    A W3C traceparent header continues the caller trace and follows its sampling decision.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: ITracer) -> None:
+        self.app = app
+        self.tracer = tracer
+        self._templates = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        remote_parent = self.tracer.continue_trace(
+            Headers(scope=scope).get(TRACEPARENT_HEADER)
+        )
+        if remote_parent is None:
+            await self._serve(scope, receive, send)
+            return
+        with remote_parent:
+            await self._serve(scope, receive, send)
+
+    async def _serve(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Serve the request inside its root span.
+
+        Args:
+            scope (Scope): the request scope.
+            receive (Receive): the ASGI receive callable.
+            send (Send): the ASGI send callable.
+        """
+        method = scope["method"]
+
+        with self.tracer.span(method, kind=SpanKind.SERVER) as span:
+            if not span.sampled:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_error(f"HTTP {message['status']}")
+                await send(message)
+
+            span.set_attribute("http.method", method)
+            span.set_attribute("http.target", scope["path"])
+            span.set_attribute("http.request_id", REQUEST_ID.get())
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = self._templates(scope)
+                span.update_name(f"{method} {route}")
+                span.set_attribute("http.route", route)
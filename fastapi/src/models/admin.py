@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.services.logger.enums.level import LogLevel
+
+
+class LogLevels(BaseModel):
+    """Class for representing the current level of each configured logger."""
+
+    levels: Dict[str, LogLevel] = Field(..., description="Levels by logger name.")
+
+
+class LogLevelUpdate(BaseModel):
+    """Class for changing the level of a configured logger."""
+
+    level: LogLevel = Field(..., description="New logger level.")
+
+
+class OperationStats(BaseModel):
+    """Class for representing the timings of a MongoDB command on a collection."""
+
+    command: str
+    collection: str
+    count: int
+    failures: int
+    slow: int = Field(..., description="Executions slower than the slow threshold.")
+    mean_ms: float
+    max_ms: float
+
+
+class SlowQueryStats(BaseModel):
+    """Class for representing the slow executions of a filter shape, values redacted."""
+
+    command: str
+    collection: str
+    shape: str = Field(..., description="Filter with the values replaced by '?'.")
+    count: int
+    mean_ms: float
+    max_ms: float
+    plan: Optional[str] = Field(None, description="Winning plan stages, when explained.")
+
+
+class DbStats(BaseModel):
+    """Class for representing the MongoDB commands statistics."""
+
+    operations: List[OperationStats]
+    slow_queries: List[SlowQueryStats]
+
+
+class ProfileSummary(BaseModel):
+    """Class for representing a stored request profile, without its content."""
+
+    profile_id: str
+    creation: datetime
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    media_type: str = Field(..., description="text/html for pyinstrument, pstats otherwise.")
@@ -0,0 +1,19 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+
+class HealthCheck(BaseModel):
+    """Class for representing a readiness check against its threshold."""
+
+    value: Optional[float] = Field(..., description="Current value, null when unknown.")
+    threshold: float
+    ok: bool
+    error: Optional[str] = None
+
+
+class Readiness(BaseModel):
+    """Class for representing the instance readiness and the checks it comes from."""
+
+    ready: bool
+    checks: Dict[str, HealthCheck]
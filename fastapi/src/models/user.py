@@ -1,9 +1,35 @@
 import re
+import string
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Callable, Final, Iterator, List
 
+from email_validator import SPECIAL_USE_DOMAIN_NAMES
 from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic.validators import str_validator
+
+# Validation runs on every request body and on every projected DB row, the checks are
+# built once here and shared by all the models in the inheritance chain.
+_USERNAME_CHARS: Final[str] = string.ascii_lowercase + string.digits + "._"
+_USERNAME_ERROR: Final[str] = (
+    "The username validation was not succesful,"
+    " the username can only contain alfanumerical chars underscores and dots."
+)
+
+# Conservative subset of the valid ASCII emails, anything else goes through email-validator.
+_EMAIL_PATTERN: Final[re.Pattern] = re.compile(
+    r"(?P<local>[A-Za-z0-9_+-]+(?:\.[A-Za-z0-9_+-]+)*)"
+    r"@(?P<domain>(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+(?P<tld>[A-Za-z]{2,63}))"
+)
+_EMAIL_MAX_LENGTH: Final[int] = 254
+_EMAIL_LOCAL_MAX_LENGTH: Final[int] = 64
+_SPECIAL_USE_TLDS: Final[frozenset] = frozenset(SPECIAL_USE_DOMAIN_NAMES)
+_PUNYCODE_PREFIX: Final[str] = "xn--"
+_EMAIL_ERROR: Final[str] = "The email validation was not succesful, the email may be invalid."
+
+_ROLES_ERROR: Final[str] = (
+    "The roles validation was not succesful, at least a role must be present."
+)
 
 
 class Role(str, Enum):
@@ -11,85 +37,103 @@ class Role(str, Enum):
     USER = "user"
 
 
-class BaseUsername(BaseModel):
-    """Class for representing and validating the users username."""
+class FastEmailStr(EmailStr):
+    """EmailStr with a fast path for the common ASCII emails,
+    the result is the same normalized email returned by EmailStr."""
 
-    username: str = Field(..., description="User username")
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable]:
+        yield str_validator
+        yield cls.validate
 
-    @validator("username")
-    def username_validation(cls, username: str) -> str:
-        """Username validator function.
+    @classmethod
+    def validate(cls, value: str) -> str:
+        """Email validator function.
 
         Args:
-            username (str): username to validate.
+            value (str): email to validate.
 
         Raises:
-            ValueError: Raised when username contains different chars form: alfanumerical,
-             underscores and dots.
+            ValueError: Raised when unvalid email is provided.
 
         Returns:
-            str: validated username.
+            str: validated and normalized email.
         """
+        match = _EMAIL_PATTERN.fullmatch(value)
+        if (
+            match is not None
+            and len(value) <= _EMAIL_MAX_LENGTH
+            and len(match["local"]) <= _EMAIL_LOCAL_MAX_LENGTH
+            and match["tld"].lower() not in _SPECIAL_USE_TLDS
+        ):
+            domain = match["domain"].lower()
+            # Punycode labels (xn--) are returned decoded by email-validator.
+            if not domain.startswith(_PUNYCODE_PREFIX) and f".{_PUNYCODE_PREFIX}" not in domain:
+                return f"{match['local']}@{domain}"
+        try:
+            return EmailStr.validate(value)
+        except Exception as e:
+            raise ValueError(_EMAIL_ERROR) from e
 
-        pattern = re.compile("^[a-z0-9._]+$")
-        match = pattern.fullmatch(username)
-        if match is None:
-            raise ValueError(
-                "The username validation was not succesful,"
-                " the username can only contain alfanumerical chars underscores and dots."
-            )
-        return username
 
+def username_validation(username: str) -> str:
+    """Username validator function.
 
-class BaseUser(BaseUsername):
-    """Class for representing and validate the users email and username."""
+    Args:
+        username (str): username to validate.
 
-    email: EmailStr = Field(..., description="User email")
+    Raises:
+        ValueError: Raised when username contains different chars form: alfanumerical,
+         underscores and dots.
 
-    @validator("email")
-    def email_validation(cls, email: str) -> str:
-        """Email validator function.
+    Returns:
+        str: validated username.
+    """
+    # Stripping the allowed chars from a valid username leaves nothing behind,
+    # non ASCII usernames are never valid.
+    if not username or not username.isascii() or username.strip(_USERNAME_CHARS):
+        raise ValueError(_USERNAME_ERROR)
+    return username
 
-        Args:
-            email (str): email to validate.
 
-        Raises:
-            ValueError: Raised when unvalid email is provided.
+def roles_validation(roles: List[Role]) -> List[Role]:
+    """Roles validator function.
 
-        Returns:
-            str: validated email.
-        """
-        try:
-            return EmailStr.validate(email)
-        except Exception as e:
-            raise ValueError(
-                "The email validation was not succesful, the email may be invalid."
-            ) from e
+    Args:
+        roles (List[Role]): roles to validate.
 
+    Raises:
+        ValueError: Raised when unvalid roles are provided.
 
-class BaseUserRoles(BaseModel):
-    """Class for representing and validate the user roles."""
+    Returns:
+        List[Role]: validated roles
+    """
+    if not roles:
+        raise ValueError(_ROLES_ERROR)
+    return roles
 
-    roles: List[Role] = Field(..., description="Collection of the user roles.")
 
-    @validator("roles")
-    def roles_validation(cls, roles: List[Role]) -> List[Role]:
-        """Roles validator function.
+class BaseUsername(BaseModel):
+    """Class for representing and validating the users username."""
 
-        Args:
-            roles (List[Role]): roles to validate.
+    username: str = Field(..., description="User username")
 
-        Raises:
-            ValueError: Raised when unvalid roles are provided.
+    _username_validation = validator("username", allow_reuse=True)(username_validation)
 
-        Returns:
-            List[Role]: validated roles
-        """
-        if len(roles) == 0:
-            raise ValueError(
-                "The roles validation was not succesful, at least a role must be present."
-            )
-        return roles
+
+class BaseUser(BaseUsername):
+    """Class for representing and validate the users email and username."""
+
+    # The email is validated once by its type, no further validator is required.
+    email: FastEmailStr = Field(..., description="User email")
+
+
+class BaseUserRoles(BaseModel):
+    """Class for representing and validate the user roles."""
+
+    roles: List[Role] = Field(..., description="Collection of the user roles.")
+
+    _roles_validation = validator("roles", allow_reuse=True)(roles_validation)
 
 
 class UserRegistration(BaseUser):
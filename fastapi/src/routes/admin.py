@@ -0,0 +1,191 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from src.core.auth import require_admin_async
+from src.core.settings import SettingsStore
+from src.db.monitoring import CommandMonitor
+from src.helpers.dependencies import provide
+from src.middleware.profiling import ProfileStore
+from src.models.admin import DbStats, LogLevels, LogLevelUpdate, ProfileSummary
+from src.models.commons import BaseMessage, HttpExceptionMessage
+from src.models.user import Role
+from src.services.logger.interfaces.i_logger import ILogger
+
+# Every endpoint here is limited to the users having the admin role.
+router = APIRouter(dependencies=[Depends(require_admin_async)])
+
+# Exceptions raised by the require_admin function, shared by all the endpoints.
+ADMIN_RESPONSES = {
+    status.HTTP_401_UNAUTHORIZED: {
+        "model": HttpExceptionMessage,
+        "description": "Unauthorized",
+    },
+    status.HTTP_403_FORBIDDEN: {
+        "model": HttpExceptionMessage,
+        "description": f"Forbidden access, {Role.ADMIN} role required",
+    },
+}
+
+
+@router.get(
+    "/log/levels",
+    response_model=LogLevels,
+    responses=ADMIN_RESPONSES,
+    description="Current level of each configured logger.",
+)
+async def get_log_levels(loggers: ILogger = Depends(provide(ILogger))):
+    # pylint: disable=missing-function-docstring
+    return LogLevels(levels=loggers.levels())
+
+
+@router.put(
+    "/log/levels/{logger_name}",
+    response_model=LogLevels,
+    responses={
+        **ADMIN_RESPONSES,
+        status.HTTP_404_NOT_FOUND: {
+            "model": HttpExceptionMessage,
+            "description": "The logger is not configured",
+        },
+    },
+    description=(
+        "Change the level of a configured logger, effective immediately and kept "
+        "until the next configuration reload."
+    ),
+)
+def set_log_level(
+    logger_name: str,
+    update: LogLevelUpdate,
+    logger: ILogger = Depends(provide(ILogger)),
+):
+    # pylint: disable=missing-function-docstring
+    try:
+        logger.set_level(logger_name, update.level)
+    except KeyError as e:
+        msg = f"The logger {logger_name} is not configured"
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=msg) from e
+
+    logger.get("routes").warning("Level of the %s logger set to %s.", logger_name, update.level)
+    return LogLevels(levels=logger.levels())
+
+
+@router.post(
+    "/log/reload",
+    response_model=BaseMessage,
+    responses={
+        **ADMIN_RESPONSES,
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": HttpExceptionMessage,
+            "description": "The configuration file is not valid, nothing has been changed",
+        },
+    },
+    description=(
+        "Apply again the logging configuration file, levels and handlers are swapped "
+        "without losing records."
+    ),
+)
+def reload_log_config(logger: ILogger = Depends(provide(ILogger))):
+    # pylint: disable=missing-function-docstring
+    try:
+        logger.reload()
+    except Exception as e:
+        msg = f"Invalid logging configuration: {e}"
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=msg) from e
+
+    logger.get("routes").warning("Logging configuration reloaded.")
+    return BaseMessage(message="OK")
+
+
+@router.post(
+    "/settings/reload",
+    response_model=BaseMessage,
+    responses={
+        **ADMIN_RESPONSES,
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": HttpExceptionMessage,
+            "description": "The settings are not valid, nothing has been changed",
+        },
+    },
+    description=(
+        "Read again the environment and the configuration files, the JWT secret, "
+        "algorithm and lifetimes apply from the next request. The services built on "
+        "startup, as the database client, keep their settings until a restart."
+    ),
+)
+def reload_settings(
+    loggers: ILogger = Depends(provide(ILogger)),
+    settings_store: SettingsStore = Depends(provide(SettingsStore)),
+):
+    # pylint: disable=missing-function-docstring
+    try:
+        settings_store.reload()
+    except Exception as e:
+        msg = f"Invalid settings: {e}"
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=msg) from e
+
+    loggers.get("routes").warning("Settings reloaded.")
+    return BaseMessage(message="OK")
+
+
+@router.get(
+    "/db/stats",
+    response_model=DbStats,
+    responses=ADMIN_RESPONSES,
+    description=(
+        "MongoDB commands timings by command and collection, and the slow filter shapes "
+        "with their plan when explained. Counted since the application startup."
+    ),
+)
+async def get_db_stats(command_monitor: CommandMonitor = Depends(provide(CommandMonitor))):
+    # pylint: disable=missing-function-docstring
+    return DbStats.parse_obj(command_monitor.stats())
+
+
+@router.get(
+    "/profiles",
+    response_model=List[ProfileSummary],
+    responses=ADMIN_RESPONSES,
+    description=(
+        "Latest request profiles, newest first. Send the X-Profile header as admin "
+        "to profile a request, its id is returned in the X-Profile-Id header."
+    ),
+)
+async def get_profiles(profile_store: ProfileStore = Depends(provide(ProfileStore))):
+    # pylint: disable=missing-function-docstring
+    return [
+        ProfileSummary.parse_obj(profile.dict(exclude={"content"}))
+        for profile in profile_store.profiles()
+    ]
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    response_class=Response,
+    responses={
+        **ADMIN_RESPONSES,
+        status.HTTP_200_OK: {
+            "content": {"text/html": {}, "application/octet-stream": {}},
+            "description": "Pyinstrument HTML report, or pstats file for the cProfile fallback.",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "model": HttpExceptionMessage,
+            "description": "The profile does not exist or has already been dropped",
+        },
+    },
+    description="Download a stored profile.",
+)
+async def get_profile(
+    profile_id: str,
+    profile_store: ProfileStore = Depends(provide(ProfileStore)),
+):
+    # pylint: disable=missing-function-docstring
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        msg = f"The profile {profile_id} does not exist"
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=msg)
+
+    return Response(
+        content=profile.content,
+        media_type=profile.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{profile.filename}"'},
+    )
@@ -1,6 +1,3 @@
-from datetime import timedelta
-from os import environ
-
 from jose.exceptions import JWTError
 from pydantic import BaseModel
 
@@ -10,12 +7,15 @@ from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from src.core import auth
 from src.core.exceptions import DecodeTokenError, ValidateTokenError
-from src.db.collections import user as db_user
-from src.helpers.container import CONTAINER
+from src.core.settings import SettingsStore
+from src.core.tracing import TRACER
+from src.helpers.dependencies import provide
 from src.models.auth import AuthMessage
 from src.models.commons import HttpExceptionMessage
 from src.models.user import UserLogin
 from src.services.logger.interfaces.i_logger import ILogger
+from src.services.users.interfaces.i_user_repository import IUserRepository
+from src.services.users.models.user_record import UserRecord
 
 # Router instantiation.
 router = APIRouter()
@@ -41,21 +41,26 @@ router = APIRouter()
 )
 async def login(
     request_form: OAuth2PasswordRequestForm = Depends(),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
+    settings_store: SettingsStore = Depends(provide(SettingsStore)),
 ):
     # pylint: disable=missing-function-docstring
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
+    settings = settings_store.current
     response: BaseModel
     status_code: int
 
     # Query to get the requested user.
-    user_res = await db_user.User.find_one(db_user.User.username == request_form.username)
+    with TRACER.span("login.find_user"):
+        user_res = await repository.find_by_username(request_form.username, UserRecord)
 
     msg = "Invalid username or password"
     # Search if user exists in DB.
     # The user does not exists.
 
     if user_res is None:
-        logger.warning("routes", f"{request_form.username} user not found in database.")
+        logger.warning("%s user not found in database.", request_form.username)
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail=msg)
 
     # A projecton is not made because the password is required to check if the user has th
@@ -65,47 +70,34 @@ async def login(
 
     # Check if the input password match the stored one,
     # but before doing so the password to check must be hashed, and then compared.
-    if not auth.verify_password(
+    if not await auth.verify_password_async(
         # request_form.password, DB_USERS[request_form.username]["password"]
         request_form.password,
         user_res.password,
     ):
-        logger.warning("routes", f"Wrong password for {request_form.username}.")
+        logger.warning("Wrong password for %s.", request_form.username)
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail=msg)
 
     # The user exists.
-    # Converting expriation times to timedelta.
-    try:
-        access_timedelta = timedelta(minutes=auth.JWT_CONFIG["access_expiration"])
-        refresh_timedelta = timedelta(minutes=auth.JWT_CONFIG["refresh_expiration"])
-    except KeyError as e:
-        msg = "An error occured while retriving the tokens expiration times"
-        logger.error("routes", f"{msg}: {e}")
-        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
-
     # Generating access and refresh tokens.
     try:
         access_token = auth.create_token(
             user_projection.dict(),
-            access_timedelta,
+            settings.jwt.access_delta,
             False,
-            environ["SECRET_KEY"],
-            auth.JWT_CONFIG["algorithm"],
+            settings.signing_key,
+            settings.jwt.algorithm,
         )
         refresh_token = auth.create_token(
             user_projection.dict(),
-            refresh_timedelta,
+            settings.jwt.refresh_delta,
             True,
-            environ["SECRET_KEY"],
-            auth.JWT_CONFIG["algorithm"],
+            settings.signing_key,
+            settings.jwt.algorithm,
         )
-    except KeyError as e:
-        msg = "An error occured while retriving the secret or the algorithm to encode the tokens"
-        logger.error("routes", f"{msg}: {e}")
-        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
     except JWTError as e:
         msg = "An error occured while encoding the tokens"
-        logger.error("routes", f"{msg}: {e}")
+        logger.error("%s: %s", msg, e)
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
 
     response = AuthMessage(
@@ -113,7 +105,7 @@ async def login(
     )
     status_code = status.HTTP_200_OK
 
-    logger.info("routes", f"Successfully generated token for {user_projection.username}")
+    logger.info("Successfully generated token for %s", user_projection.username)
     return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
 
 
@@ -146,9 +138,13 @@ async def login(
 )
 async def refresh(
     refresh_token: str | None = Header(default=None),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
+    settings_store: SettingsStore = Depends(provide(SettingsStore)),
 ):
     # pylint: disable=missing-function-docstring
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
+    settings = settings_store.current
     response: BaseModel
     status_code: int
     decoded_token: dict
@@ -157,23 +153,24 @@ async def refresh(
     # Decode token.
     try:
         decoded_token = auth.decode_token(refresh_token)
-        logger.debug("routes", f"Decoded token {decoded_token}")
+        logger.debug("Decoded token %s", decoded_token)
     except DecodeTokenError as e:
-        logger.warning("routes", e.loggable)
+        logger.warning(e.loggable)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.msg) from e
 
     # Validate the token.
     try:
         _ = auth.valid_refresh_token(decoded_token)
     except ValidateTokenError as e:
-        logger.warning("routes", e.loggable)
+        logger.warning(e.loggable)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.msg) from e
 
     # If username not in db raise exception.
-    user_res = await db_user.User.find_one(db_user.User.username == decoded_token["username"])
+    with TRACER.span("refresh.find_user"):
+        user_res = await repository.find_by_username(decoded_token["username"], UserRecord)
 
     if user_res is None:
-        logger.warning("routes", f"{decoded_token.get('username')} user not found in database.")
+        logger.warning("%s user not found in database.", decoded_token.get("username"))
         msg = "The token contains informations of an unexisting user."
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail=msg)
 
@@ -184,38 +181,25 @@ async def refresh(
         email=user_res.email, username=user_res.username, roles=user_res.roles
     )
 
-    # Converting expriation times to timedelta.
-    try:
-        access_timedelta = timedelta(minutes=auth.JWT_CONFIG["access_expiration"])
-        refresh_timedelta = timedelta(minutes=auth.JWT_CONFIG["refresh_expiration"])
-    except KeyError as e:
-        msg = "An error occured while retriving the tokens expiration times"
-        logger.error("routes", f"{msg}: {e}")
-        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
-
     # Generating access and refresh tokens.
     try:
         new_access_token = auth.create_token(
             user_projection.dict(),
-            access_timedelta,
+            settings.jwt.access_delta,
             False,
-            environ["SECRET_KEY"],
-            auth.JWT_CONFIG["algorithm"],
+            settings.signing_key,
+            settings.jwt.algorithm,
         )
         new_refresh_token = auth.create_token(
             user_projection.dict(),
-            refresh_timedelta,
+            settings.jwt.refresh_delta,
             True,
-            environ["SECRET_KEY"],
-            auth.JWT_CONFIG["algorithm"],
+            settings.signing_key,
+            settings.jwt.algorithm,
         )
-    except KeyError as e:
-        msg = "An error occured while retriving the secret or the algorithm to encode the tokens"
-        logger.error("routes", f"{msg}: {e}")
-        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
     except JWTError as e:
         msg = "An error occured while encoding the tokens"
-        logger.error("routes", f"{msg}: {e}")
+        logger.error("%s: %s", msg, e)
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
 
     # Generate new token pair.
@@ -226,5 +210,5 @@ async def refresh(
     )
     status_code = status.HTTP_200_OK
 
-    logger.info("routes", f"Successfully refreshed token for {user_projection.username}")
+    logger.info("Successfully refreshed token for %s", user_projection.username)
     return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
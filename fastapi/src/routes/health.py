@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from src.core.health import HealthChecker
+from src.helpers.dependencies import provide
+from src.models.commons import BaseMessage
+from src.models.health import Readiness
+
+router = APIRouter()
+
+
+@router.get(
+    "/live",
+    response_model=BaseMessage,
+    status_code=status.HTTP_200_OK,
+    description=(
+        "Liveness probe, the process is up and its event loop answers. "
+        "Dependencies are not checked, a restart would not fix them."
+    ),
+)
+async def live():
+    # pylint: disable=missing-function-docstring
+    return BaseMessage(message="OK")
+
+
+@router.get(
+    "/ready",
+    response_model=Readiness,
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": Readiness,
+            "description": "At least a check is over its threshold, stop sending traffic",
+        },
+    },
+    description=(
+        "Readiness probe: cached MongoDB ping latency, MongoDB pool wait queue, "
+        "password hashing backlog and event loop lag against the thresholds "
+        "in configs/core/health.yaml."
+    ),
+)
+async def ready(health_checker: HealthChecker = Depends(provide(HealthChecker))):
+    # pylint: disable=missing-function-docstring
+    checks = health_checker.readiness()
+    response = Readiness(ready=all(check["ok"] for check in checks.values()), checks=checks)
+    status_code = status.HTTP_200_OK if response.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
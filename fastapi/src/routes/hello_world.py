@@ -1,10 +1,9 @@
-from os import environ
-
 from jose import jwt
 
 from fastapi import APIRouter, Depends, status
 from src.core.auth import OAUTH2_SCHEME
-from src.helpers.container import CONTAINER
+from src.core.settings import SettingsStore
+from src.helpers.dependencies import provide
 from src.models.commons import BaseMessage
 from src.services.logger.interfaces.i_logger import ILogger
 
@@ -12,14 +11,18 @@ router = APIRouter()
 
 
 @router.get("/", response_model=BaseMessage, status_code=status.HTTP_200_OK)
-async def root():
+async def root(loggers: ILogger = Depends(provide(ILogger))):
     # pylint: disable=missing-function-docstring
-    log = CONTAINER.get(ILogger)
-    log.info("some", "Hello world")
+    log = loggers.get("some")
+    log.info("Hello world")
     return BaseMessage(message="Hello, world! (Simple message type)")
 
 
 @router.get("/test-auth")
-async def test_auth(token: str = Depends(OAUTH2_SCHEME)):
+async def test_auth(
+    token: str = Depends(OAUTH2_SCHEME),
+    settings_store: SettingsStore = Depends(provide(SettingsStore)),
+):
     # pylint: disable=missing-function-docstring
-    return jwt.decode(token, environ["SECRET_KEY"], algorithms="HS256")
+    settings = settings_store.current
+    return jwt.decode(token, settings.signing_key, algorithms=settings.jwt.algorithm)
@@ -0,0 +1,22 @@
+from typing import Final
+
+from fastapi import APIRouter, Depends, Response, status
+from src.helpers.dependencies import provide
+from src.services.metrics.interfaces.i_metrics import IMetrics
+
+# Prometheus text exposition format, the charset is added by the response.
+PROMETHEUS_MEDIA_TYPE: Final[str] = "text/plain; version=0.0.4"
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"content": {PROMETHEUS_MEDIA_TYPE: {}}}},
+    description="Application metrics in the Prometheus text exposition format.",
+)
+async def metrics(registry: IMetrics = Depends(provide(IMetrics))):
+    # pylint: disable=missing-function-docstring
+    return Response(content=registry.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -1,19 +1,23 @@
 from datetime import datetime
 from typing import List, Tuple
 
-from beanie.odm.enums import SortDirection
-from beanie.operators import All
 from pydantic import BaseModel
-from pymongo.errors import DuplicateKeyError
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
-from src.core.auth import hash_password, is_admin, is_authorized, require_admin
-from src.db.collections.user import User as UserCollection
-from src.helpers.container import CONTAINER
+from src.core.auth import (
+    hash_password_async,
+    is_admin_async,
+    is_authorized_async,
+    require_admin_async,
+)
+from src.core.exceptions import DuplicateUserError
+from src.helpers.dependencies import provide
+from src.helpers.responses import NEGOTIATED_CONTENT, negotiated_response
 from src.models.commons import BaseMessage, HttpExceptionMessage
 from src.models.user import (
+    BaseUserRoles,
     CurrentUserDetails,
     Role,
     UpdateUserDetails,
@@ -22,7 +26,10 @@ from src.models.user import (
     UserRegistration,
     UserRegistrationAdmin,
 )
+from src.services.logger.enums.level import LogLevel
 from src.services.logger.interfaces.i_logger import ILogger
+from src.services.users.interfaces.i_user_repository import IUserRepository
+from src.services.users.models.user_record import UserRecord
 
 # Router instantiation.
 router = APIRouter()
@@ -46,37 +53,38 @@ router = APIRouter()
         "to let the use chose the roles use the /register-admin endpoint"
     ),
 )
-async def register(user_registration: UserRegistration):
+async def register(
+    user_registration: UserRegistration,
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
+):
     # pylint: disable=missing-function-docstring
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
     status_code: int
     response: BaseModel
     now_date = datetime.utcnow()
 
     # Document creation.
     logger.info(
-        "routes",
-        f"Document creation for user having {user_registration.username} as username.",
+        "Document creation for user having %s as username.", user_registration.username
     )
-    user = UserCollection(
+    user = UserRecord(
         email=user_registration.email,
         username=user_registration.username,
-        password=hash_password(user_registration.password),
-        roles=[Role.USER.value],
+        password=await hash_password_async(user_registration.password),
+        roles=[Role.USER],
         creation=now_date,
         last_update=now_date,
     )
 
     # Saving the document to db.
     try:
-        await user.insert()
-    except DuplicateKeyError as e:
-        logger.error("routes", str(e))
-        duplicates = dict(e.details).get("keyPattern")
-        msg = f"The following fields must be unique: {duplicates}"
-        raise HTTPException(status.HTTP_409_CONFLICT, detail=msg) from e
+        await repository.insert(user)
+    except DuplicateUserError as e:
+        logger.error("%s", e.loggable)
+        raise HTTPException(status.HTTP_409_CONFLICT, detail=e.msg) from e
     except Exception as e:
-        logger.error("routes", str(e))
+        logger.error("%s", e)
         print(e)
         msg = "An unknown exception occured, maybe bad db connection"
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
@@ -85,8 +93,7 @@ async def register(user_registration: UserRegistration):
     status_code = status.HTTP_201_CREATED
 
     logger.info(
-        "routes",
-        f"The user having username {user_registration.username} has been added to the db.",
+        "The user having username %s has been added to the db.", user_registration.username
     )
     return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
 
@@ -120,14 +127,16 @@ async def register(user_registration: UserRegistration):
         "limited to users having the admin role. "
         "This endpoint execution is limited to users having the admin role."
     ),
-    dependencies=[Depends(require_admin)],
+    dependencies=[Depends(require_admin_async)],
 )
 async def register_admin(
     user_registration: UserRegistrationAdmin,
-    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin),
+    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin_async),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
 ):
     # pylint: disable=missing-function-docstring
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
     status_code: int
     response: BaseModel
     now_date = datetime.utcnow()
@@ -142,16 +151,14 @@ async def register_admin(
 
     # Document creation.
     logger.info(
-        "routes",
-        (
-            f"Document creation for user having {user_registration.username}"
-            f" as username and roles {user_registration.roles}."
-        ),
+        "Document creation for user having %s as username and roles %s.",
+        user_registration.username,
+        user_registration.roles,
     )
-    user = UserCollection(
+    user = UserRecord(
         email=user_registration.email,
         username=user_registration.username,
-        password=hash_password(user_registration.password),
+        password=await hash_password_async(user_registration.password),
         roles=user_registration.roles,
         creation=now_date,
         last_update=now_date,
@@ -159,14 +166,12 @@ async def register_admin(
 
     # Saving the document to db.
     try:
-        await user.insert()
-    except DuplicateKeyError as e:
-        logger.error("routes", str(e))
-        duplicates = dict(e.details).get("keyPattern")
-        msg = f"The following fields must be unique: {duplicates}"
-        raise HTTPException(status.HTTP_409_CONFLICT, detail=msg) from e
+        await repository.insert(user)
+    except DuplicateUserError as e:
+        logger.error("%s", e.loggable)
+        raise HTTPException(status.HTTP_409_CONFLICT, detail=e.msg) from e
     except Exception as e:
-        logger.error("routes", str(e))
+        logger.error("%s", e)
         msg = "An unknown exception occured, maybe bad db connection"
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
 
@@ -174,11 +179,9 @@ async def register_admin(
     status_code = status.HTTP_201_CREATED
 
     logger.info(
-        "routes",
-        (
-            f"The user having username {user_registration.username}"
-            f" and roles {user_registration.roles} has been succesully added to the db."
-        ),
+        "The user having username %s and roles %s has been succesully added to the db.",
+        user_registration.username,
+        user_registration.roles,
     )
     return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
 
@@ -187,6 +190,7 @@ async def register_admin(
     "/all",
     response_model=List[UserPartialDetails | UserPartialDetailsAdmin],
     responses={
+        status.HTTP_200_OK: NEGOTIATED_CONTENT,
         status.HTTP_401_UNAUTHORIZED: {
             "model": HttpExceptionMessage,
             # Exception raised by the require_admin function (see Endpoint.DEPENDENCIES).
@@ -206,15 +210,18 @@ async def register_admin(
         "Get all users with parial details from the db. "
         "If needed is possible to limit returned entities and skip the required amount"
     ),
-    dependencies=[Depends(is_admin)],
+    dependencies=[Depends(is_admin_async)],
 )
 async def get_all_users(
     limit: int | None = None,
     skip: int | None = None,
-    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin),
+    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin_async),
+    accept: str | None = Header(default=None),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
 ):
     # pylint: disable=missing-function-docstring
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
     status_code: int
     response: BaseModel
     projection: BaseModel
@@ -229,29 +236,18 @@ async def get_all_users(
     else:
         projection = UserPartialDetailsAdmin
 
-    logger.info(
-        "routes",
-        f"Returning the users in the db: limit={limit} and skip={skip}.",
-    )
+    logger.info("Returning the users in the db: limit=%s and skip=%s.", limit, skip)
 
     try:
-        response = await UserCollection.find_all(
-            projection_model=projection,
-            limit=limit,
-            skip=skip,
-            sort=[("username", SortDirection.ASCENDING)],
-        ).to_list()
+        response = await repository.find_many(projection, skip, limit)
     except Exception as e:
-        logger.error("routes", f"An unknown exception occured while fetcthing the users: {e}")
+        logger.error("An unknown exception occured while fetcthing the users: %s", e)
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR) from e
 
     status_code = status.HTTP_200_OK
 
-    logger.info(
-        "routes",
-        "Success returning all the users.",
-    )
-    return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
+    logger.info("Success returning all the users.")
+    return negotiated_response(accept, status_code, response)
 
 
 @router.get(
@@ -274,11 +270,15 @@ async def get_all_users(
         },
     },
     description="Get the total number of users in the database",
-    dependencies=[Depends(is_authorized)],
+    dependencies=[Depends(is_authorized_async)],
 )
-async def get_users_count(is_authorized_result: Tuple[bool, dict] = Depends(is_authorized)):
+async def get_users_count(
+    is_authorized_result: Tuple[bool, dict] = Depends(is_authorized_async),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
+):
     # pylint: disable=missing-function-docstring
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
     status_code: int
     response: int
 
@@ -289,26 +289,20 @@ async def get_users_count(is_authorized_result: Tuple[bool, dict] = Depends(is_a
             detail="The provided token may be expired or invalid.",
         )
 
-    logger.info(
-        "routes",
-        "Returning the total number of users document in the db.",
-    )
+    logger.info("Returning the total number of users document in the db.")
 
     try:
-        response = await UserCollection.find_all().count()
+        response = await repository.count()
     except Exception as e:
         logger.error(
-            "routes",
-            "An unknown exception occured while fetcthing the total number of users documents: {e}",
+            "An unknown exception occured while fetcthing the total number of users documents: %s",
+            e,
         )
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR) from e
 
     status_code = status.HTTP_200_OK
 
-    logger.info(
-        "routes",
-        "Success returning the total number of users documents in the db.",
-    )
+    logger.info("Success returning the total number of users documents in the db.")
     return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
 
 
@@ -316,6 +310,7 @@ async def get_users_count(is_authorized_result: Tuple[bool, dict] = Depends(is_a
     "/username/{username}",
     response_model=List[UserPartialDetails | UserPartialDetailsAdmin],
     responses={
+        status.HTTP_200_OK: NEGOTIATED_CONTENT,
         status.HTTP_401_UNAUTHORIZED: {
             "model": HttpExceptionMessage,
             # Exception raised by the require_admin function (see Endpoint.DEPENDENCIES).
@@ -330,13 +325,17 @@ async def get_users_count(is_authorized_result: Tuple[bool, dict] = Depends(is_a
         "Get user parial details from the db given the username."
         " To get full details run admin endpoint."
     ),
-    dependencies=[Depends(is_admin)],
+    dependencies=[Depends(is_admin_async)],
 )
 async def get_user_by_username(
-    username: str, is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin)
+    username: str,
+    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin_async),
+    accept: str | None = Header(default=None),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
 ):
     # pylint: disable=missing-function-docstring
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
     status_code: int
     response: BaseModel
     projection: BaseModel
@@ -351,33 +350,25 @@ async def get_user_by_username(
     else:
         projection = UserPartialDetailsAdmin
 
-    logger.info(
-        "routes",
-        f"Returning the in the db: username={username}.",
-    )
+    logger.info("Returning the in the db: username=%s.", username)
 
     try:
-        response = await UserCollection.find_one(
-            UserCollection.username == username,
-            projection_model=projection,
-        )
+        response = await repository.find_by_username(username, projection)
     except Exception as e:
-        logger.error("routes", f"An unknown exception occured while fetcthing the user: {e}")
+        logger.error("An unknown exception occured while fetcthing the user: %s", e)
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR) from e
 
     status_code = status.HTTP_200_OK
 
-    logger.info(
-        "routes",
-        "Success returning the serched user.",
-    )
-    return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
+    logger.info("Success returning the serched user.")
+    return negotiated_response(accept, status_code, response)
 
 
 @router.get(
     "/me",
     response_model=CurrentUserDetails,
     responses={
+        status.HTTP_200_OK: NEGOTIATED_CONTENT,
         status.HTTP_401_UNAUTHORIZED: {
             "model": HttpExceptionMessage,
             "description": "Unauthorized",
@@ -388,10 +379,12 @@ async def get_user_by_username(
         },
     },
     description="Get current user complete details.",
-    dependencies=[Depends(is_authorized)],
+    dependencies=[Depends(is_authorized_async)],
 )
 async def get_current_user(
-    is_authorized_result: Tuple[bool, dict] = Depends(is_authorized),
+    is_authorized_result: Tuple[bool, dict] = Depends(is_authorized_async),
+    accept: str | None = Header(default=None),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
 ):
     # pylint: disable=missing-function-docstring
 
@@ -404,11 +397,11 @@ async def get_current_user(
 
     # Decoded token is in is_authorized_result[1]
     status_code = status.HTTP_200_OK
-    response = await UserCollection.find_one(
-        UserCollection.username == is_authorized_result[1]["username"]
-    ).project(CurrentUserDetails)
+    response = await repository.find_by_username(
+        is_authorized_result[1]["username"], CurrentUserDetails
+    )
 
-    return JSONResponse(status_code=status_code, content=jsonable_encoder(response))
+    return negotiated_response(accept, status_code, response)
 
 
 @router.put(
@@ -437,51 +430,46 @@ async def get_current_user(
         },
     },
     description="Update user given the username in path and user with updated fields in body.",
-    dependencies=[Depends(is_admin)],
+    dependencies=[Depends(is_admin_async)],
 )
 async def put_user_by_username(
     username: str,
     updated_user: UpdateUserDetails,
-    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin),
+    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin_async),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
 ):
     # pylint: disable=missing-function-docstring
 
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
 
     # Check if user is authorized.
     if not is_admin_result[0]:
-        logger.info("routes", "The user is not authenticated.")
+        logger.info("The user is not authenticated.")
         raise HTTPException(status.HTTP_401_UNAUTHORIZED)
 
     # Check if user is not admin that the user in the decoded token
     # is equal to the given one in the endpoint path.
     if not is_admin_result[1] and username != is_admin_result[2]["username"]:
-        logger.info("routes", "The user has not right to update a different user.")
+        logger.info("The user has not right to update a different user.")
         raise HTTPException(status.HTTP_403_FORBIDDEN)
 
-    to_update = await UserCollection.find_one(UserCollection.username == username)
-
-    if to_update is None:
-        raise HTTPException(status.HTTP_404_NOT_FOUND)
-
-    to_update.email = updated_user.email
-    to_update.username = updated_user.username
-    to_update.roles = updated_user.roles
-    to_update.last_update = datetime.utcnow()
-
     try:
-        await to_update.save()
-    except DuplicateKeyError as e:
-        logger.error("routes", str(e))
-        duplicates = dict(e.details).get("keyPattern")
-        msg = f"The following fields must be unique: {duplicates}"
-        raise HTTPException(status.HTTP_409_CONFLICT, detail=msg) from e
+        updated = await repository.update(username, updated_user, datetime.utcnow())
+    except DuplicateUserError as e:
+        logger.error("%s", e.loggable)
+        raise HTTPException(status.HTTP_409_CONFLICT, detail=e.msg) from e
     except Exception as e:
-        logger.error("routes", str(e))
+        logger.error("%s", e)
         msg = "An unknown exception occured, maybe bad db connection"
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
 
-    logger.info("routes", f"Succesful update for {username} to {updated_user.json()}")
+    if not updated:
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+
+    # Serializing the whole model is not free, do it only when the line is written.
+    if logger.is_enabled_for(LogLevel.INFO):
+        logger.info("Succesful update for %s to %s", username, updated_user.json())
 
     return JSONResponse(status.HTTP_200_OK)
 
@@ -512,37 +500,37 @@ async def put_user_by_username(
         },
     },
     description="Update user given the username in path and user with updated fields in body.",
-    dependencies=[Depends(is_admin)],
+    dependencies=[Depends(is_admin_async)],
 )
 async def delete_user_by_username(
     username: str,
-    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin),
+    is_admin_result: Tuple[bool, bool, dict] = Depends(is_admin_async),
+    loggers: ILogger = Depends(provide(ILogger)),
+    repository: IUserRepository = Depends(provide(IUserRepository)),
 ):
     # pylint: disable=missing-function-docstring
 
-    logger = CONTAINER.get(ILogger)
+    logger = loggers.get("routes")
 
     # Check if user is authorized.
     if not is_admin_result[0]:
-        logger.info("routes", "The user is not authenticated.")
+        logger.info("The user is not authenticated.")
         raise HTTPException(status.HTTP_401_UNAUTHORIZED)
 
     # Check if user is not admin that the user in the decoded token
     # is equal to the given one in the endpoint path.
     if not is_admin_result[1] and username != is_admin_result[2]["username"]:
-        logger.info("routes", "The user has not right to update a different user.")
+        logger.info("The user has not right to update a different user.")
         raise HTTPException(status.HTTP_403_FORBIDDEN)
 
-    to_delete = await UserCollection.find_one(UserCollection.username == username)
+    to_delete = await repository.find_by_username(username, BaseUserRoles)
 
     if to_delete is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND)
 
     # If the user to delete is admin and the last one return 406.
     if Role.ADMIN in to_delete.roles:
-        admin_count = await UserCollection.find_many(
-            All(UserCollection.roles, [Role.ADMIN.value])
-        ).count()
+        admin_count = await repository.count(Role.ADMIN)
         if admin_count == 1:
             raise HTTPException(
                 status.HTTP_406_NOT_ACCEPTABLE,
@@ -550,12 +538,12 @@ async def delete_user_by_username(
             )
 
     try:
-        await to_delete.delete()
+        await repository.delete(username)
     except Exception as e:
-        logger.error("routes", str(e))
+        logger.error("%s", e)
         msg = "An unknown exception occured, maybe bad db connection"
         raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=msg) from e
 
-    logger.info("routes", f"Succesful deletion for {username}")
+    logger.info("Succesful deletion for %s", username)
 
     return JSONResponse(status.HTTP_200_OK)
@@ -0,0 +1,308 @@
+"""Production server: a supervisor process and a worker process for each CPU.
+
+The supervisor imports the application and parses the settings and the configuration
+files once, binds the socket, then forks the workers: they start with the application
+already loaded and share the socket. Each worker serves with uvloop and httptools when
+installed (uvicorn[standard]), the asyncio loop and h11 otherwise.
+
+On SIGTERM or SIGINT the workers stop accepting connections, complete the requests in
+progress for up to graceful_timeout seconds, then run the shutdown of the application.
+A worker dying is replaced, a worker failing its startup stops the server.
+
+Run from the fastapi directory, the environment of the application set, with:
+    $ python -m src.server --port 8000
+"""
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from argparse import ArgumentParser
+from importlib.util import find_spec
+from math import ceil
+from os.path import join
+from typing import Final, Optional, Set
+
+from pydantic import BaseModel, Field
+from uvicorn import Config, Server
+
+from src.helpers.config import load_yaml_model
+
+# Exit status of a worker whose application startup failed, as uvicorn's.
+STARTUP_FAILURE: Final[int] = 3
+# Connections a MongoDB client opens to each server to monitor it, outside of its pool.
+MONITORING_CONNECTIONS: Final[int] = 2
+# Seconds between two checks of the workers by the supervisor.
+_REAP_INTERVAL: Final[float] = 0.2
+# Seconds given to the workers beyond the graceful timeout before they are killed.
+_KILL_DELAY: Final[float] = 5
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class ServerConfig(BaseModel):
+    """Production server configuration."""
+
+    host: str = "0.0.0.0"
+    port: int = Field(8000, ge=0, le=65535)
+    # Worker processes, when missing WEB_CONCURRENCY or else the available CPUs.
+    workers: Optional[int] = Field(None, ge=1)
+    backlog: int = Field(2048, ge=1)
+    timeout_keep_alive: int = Field(5, ge=1)
+    # Seconds the requests in progress are given to complete on shutdown.
+    graceful_timeout: int = Field(30, ge=1)
+    # MongoDB connections of the whole server, split among the workers: the workers are
+    # capped to those it can hold.
+    db_max_connections: Optional[int] = Field(None, ge=1 + MONITORING_CONNECTIONS)
+    access_log: bool = False
+
+
+def available_cpus() -> int:
+    """
+    Return the CPUs the process may use: its CPU affinity, limited by the CPU quota of
+    its cgroup (e.g. the CPU limit of a container).
+
+    Returns:
+        int: the CPUs, at least 1.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        # cgroup v2, "<quota> <period>" in microseconds or "max <period>".
+        with open("/sys/fs/cgroup/cpu.max", encoding="utf-8") as cpu_max_stream:
+            quota, period = cpu_max_stream.read().split()
+        if quota != "max":
+            cpus = min(cpus, ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+
+def worker_count(config: ServerConfig) -> int:
+    """
+    Return the worker processes to start: the configured workers, then WEB_CONCURRENCY
+    when set, the available CPUs otherwise.
+
+    Args:
+        config (ServerConfig): the server configuration.
+
+    Returns:
+        int: the workers.
+    """
+    if config.workers is not None:
+        return config.workers
+    if environ_workers := os.environ.get("WEB_CONCURRENCY"):
+        return max(1, int(environ_workers))
+    return available_cpus()
+
+
+def max_workers(max_connections: int) -> int:
+    """
+    Return the workers the MongoDB connection budget can hold, each of them needing a
+    pool of 1 connection at least and its monitoring connections.
+
+    Args:
+        max_connections (int): MongoDB connections of the whole server.
+
+    Returns:
+        int: the workers.
+    """
+    return max_connections // (1 + MONITORING_CONNECTIONS)
+
+
+def worker_pool_size(max_connections: int, workers: int) -> int:
+    """
+    Return the MongoDB pool size of each worker, so that the connections of all the
+    workers, monitoring included, stay within the budget.
+
+    Args:
+        max_connections (int): MongoDB connections of the whole server.
+        workers (int): worker processes, max_workers(max_connections) at most.
+
+    Raises:
+        ValueError: when the budget can not hold the workers.
+
+    Returns:
+        int: the pool size, at least 1.
+    """
+    if workers > max_workers(max_connections):
+        raise ValueError(
+            f"{max_connections} MongoDB connections can not hold {workers} workers,"
+            f" each needs {1 + MONITORING_CONNECTIONS} at least"
+        )
+    return max_connections // workers - MONITORING_CONNECTIONS
+
+
+def preload() -> None:
+    """
+    Import the application, then parse the settings and the configuration files of the
+    middlewares before the workers are forked. Only configuration is built here, the
+    services starting threads (logging, tracing, hashing) are built by each worker.
+    """
+    # pylint: disable=import-outside-toplevel
+    import src.app  # pylint: disable=unused-import
+    from src.core.hashing import HashingPoolConfig
+    from src.core.settings import SettingsStore
+    from src.helpers.container import CONTAINER
+    from src.middleware.compression import CompressionConfig
+    from src.middleware.concurrency import ConcurrencyConfig
+    from src.middleware.profiling import ProfilingConfig
+
+    for interface in (
+        SettingsStore,
+        HashingPoolConfig,
+        ProfilingConfig,
+        CompressionConfig,
+        ConcurrencyConfig,
+    ):
+        CONTAINER.get(interface)
+
+
+class Supervisor:
+    """Fork the workers on a shared socket, replace the dead ones and stop them all."""
+
+    def __init__(self, config: Config, workers: int, graceful_timeout: float) -> None:
+        self._config = config
+        self._workers = workers
+        self._graceful_timeout = graceful_timeout
+        self._pids: Set[int] = set()
+        self._stopping = False
+        self.exit_code = 0
+
+    def run(self) -> None:
+        """Serve until SIGTERM or SIGINT, then stop the workers gracefully."""
+        sock = self._config.bind_socket()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._handle_stop)
+        for _ in range(self._workers):
+            self._spawn(sock)
+        while not self._stopping:
+            self._reap(sock)
+            time.sleep(_REAP_INTERVAL)
+        self._stop()
+        sock.close()
+
+    def _handle_stop(self, signum: int, _frame) -> None:
+        logger.info("Received %s, stopping the workers.", signal.Signals(signum).name)
+        self._stopping = True
+
+    def _spawn(self, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid:
+            self._pids.add(pid)
+            return
+        # Worker process, it handles the stop signals itself. In a process group of its
+        # own, a Ctrl+C reaches the supervisor only: a second signal would force the exit.
+        exit_code = 1
+        try:
+            os.setpgid(0, 0)
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            server = Server(self._config)
+            server.run(sockets=[sock])
+            exit_code = 0 if server.started else STARTUP_FAILURE
+        finally:
+            os._exit(exit_code)  # pylint: disable=protected-access
+
+    def _reap(self, sock: socket.socket) -> None:
+        while self._pids:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            self._pids.discard(pid)
+            exit_code = os.waitstatus_to_exitcode(status)
+            if exit_code == STARTUP_FAILURE:
+                logger.error("Worker %s failed its startup, stopping the server.", pid)
+                self.exit_code = STARTUP_FAILURE
+                self._stopping = True
+                return
+            if not self._stopping:
+                logger.warning("Worker %s exited with %s, starting a new one.", pid, exit_code)
+                self._spawn(sock)
+
+    def _stop(self) -> None:
+        for pid in self._pids:
+            os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self._graceful_timeout + _KILL_DELAY
+        while self._pids and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                time.sleep(_REAP_INTERVAL)
+            else:
+                self._pids.discard(pid)
+        for pid in self._pids:
+            logger.error("Worker %s did not stop in time, killing it.", pid)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self._pids.clear()
+
+
+def main() -> None:
+    # pylint: disable=missing-function-docstring
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--host", help="bind address, overrides the configuration")
+    parser.add_argument("--port", type=int, help="bind port, overrides the configuration")
+    parser.add_argument("--workers", type=int, help="worker processes, default the CPUs")
+    args = parser.parse_args()
+
+    server_config = load_yaml_model(
+        ServerConfig, join(os.environ["CONFIGS_DIR"], "server", "server.yaml")
+    )
+    overrides = {
+        key: value
+        for key, value in (("host", args.host), ("port", args.port), ("workers", args.workers))
+        if value is not None
+    }
+    server_config = server_config.copy(update=overrides)
+    workers = worker_count(server_config)
+    # Read by the settings of each worker, the settings are parsed just below.
+    if (budget := server_config.db_max_connections) is not None:
+        if workers > max_workers(budget):
+            logger.warning(
+                "%s MongoDB connections hold %s workers at most, starting %s instead of %s.",
+                budget,
+                max_workers(budget),
+                max_workers(budget),
+                workers,
+            )
+            workers = max_workers(budget)
+        os.environ["DB_MAX_POOL_SIZE"] = str(worker_pool_size(budget, workers))
+
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    preload()
+    # pylint: disable=import-outside-toplevel
+    from src.app import fastapi_app
+
+    config = Config(
+        fastapi_app,
+        host=server_config.host,
+        port=server_config.port,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        backlog=server_config.backlog,
+        timeout_keep_alive=server_config.timeout_keep_alive,
+        timeout_graceful_shutdown=server_config.graceful_timeout,
+        access_log=server_config.access_log,
+    )
+    config.load()
+    logger.info(
+        "Starting %s workers on %s:%s (%s, %s), MongoDB pool of %s connections each.",
+        workers,
+        server_config.host,
+        server_config.port,
+        loop,
+        http,
+        os.environ.get("DB_MAX_POOL_SIZE", "100"),
+    )
+    supervisor = Supervisor(config, workers, server_config.graceful_timeout)
+    supervisor.run()
+    sys.exit(supervisor.exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+from pydantic_yaml import YamlStrEnum
+
+
+class LogFormatter(YamlStrEnum):
+    # Lines built with the logging format string.
+    TEXT = "text"
+    # One JSON object per line.
+    JSON = "json"
@@ -0,0 +1,10 @@
+from pydantic_yaml import YamlStrEnum
+
+
+class OverflowPolicy(YamlStrEnum):
+    # Wait for the background writer to make room.
+    BLOCK = "block"
+    # Discard the oldest queued record.
+    DROP_OLDEST = "drop-oldest"
+    # Discard the incoming debug records, wait for the others.
+    DROP_DEBUG = "drop-debug"
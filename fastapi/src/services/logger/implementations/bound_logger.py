@@ -0,0 +1,61 @@
+import logging
+from logging import Logger
+from typing import Callable, Dict, Final
+
+from src.services.logger.enums.level import LogLevel
+
+LEVELS: Final[Dict[LogLevel, int]] = {
+    LogLevel.NOTSET: logging.NOTSET,
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+}
+
+
+class BoundLogger:
+    """
+    Implementation of the IBoundLogger interface over a logging.Logger.
+
+    The log methods are the bound methods of the wrapped logger, so a call costs
+    the same as calling logging directly: a cached level check and nothing else
+    when the level is disabled.
+    """
+
+    __slots__ = ("_logger", "debug", "info", "warning", "error", "critical")
+
+    debug: Callable[..., None]
+    info: Callable[..., None]
+    warning: Callable[..., None]
+    error: Callable[..., None]
+    critical: Callable[..., None]
+
+    def __init__(self, logger: Logger) -> None:
+        """
+        Bind a new logger.
+
+        Args:
+            logger (Logger): the logger to write to.
+        """
+        self._logger = logger
+        self.debug = logger.debug
+        self.info = logger.info
+        self.warning = logger.warning
+        self.error = logger.error
+        self.critical = logger.critical
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Say if a statement with the given level would be logged.
+
+        Args:
+            level (LogLevel): level to check.
+
+        Returns:
+            bool: True if the level is enabled.
+        """
+        return self._logger.isEnabledFor(LEVELS[level])
+
+    def __repr__(self) -> str:
+        return f"BoundLogger({self._logger.name!r})"
@@ -0,0 +1,45 @@
+import json
+import logging
+from datetime import datetime, timezone
+from logging import LogRecord
+
+from src.core.context import REQUEST_ID
+
+# orjson is optional, it is just faster than json.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Filter adding the current request id to the records as "request_id".
+    It must run in the caller context, so it belongs to the handler enqueuing the records.
+    """
+
+    def filter(self, record: LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = REQUEST_ID.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter writing each record as a single line JSON object."""
+
+    def format(self, record: LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str)
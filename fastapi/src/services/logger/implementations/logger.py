@@ -1,34 +1,49 @@
+import atexit
 import logging
 import sys
-from logging import Logger, getLogger
-from logging.handlers import TimedRotatingFileHandler
-from os import environ
-from os import mkdir as os_mkdir
+from logging import Handler, Logger, getLogger
+from os import environ, makedirs
 from os.path import exists as os_path_exists
+from os.path import getmtime as os_path_getmtime
 from os.path import isfile as os_path_isfile
 from os.path import join as os_path_join
-from typing import Dict, Final, Optional
+from queue import Queue
+from threading import Event, RLock, Thread
+from typing import Dict, Final, Optional, Tuple
 
 from yaml import safe_load
 
+from src.services.logger.enums.formatter import LogFormatter
 from src.services.logger.enums.level import LogLevel
-from src.services.logger.models.configuration import TimedRotatingFileConfig
-
-DEFAULT_LOG_FILE: Final[str] = os_path_join(environ["LOGGING_DIR"], "default.log")
+from src.services.logger.enums.overflow import OverflowPolicy
+from src.services.logger.implementations.bound_logger import BoundLogger
+from src.services.logger.implementations.file_handler import BatchTimedRotatingFileHandler
+from src.services.logger.implementations.formatters import JsonFormatter, RequestIdFilter
+from src.services.logger.implementations.queue_handler import (
+    BackgroundListener,
+    BoundedQueueHandler,
+)
+from src.services.logger.implementations.throttle import ThrottleFilter
+from src.services.logger.models.configuration import ThrottleConfig, TimedRotatingFileConfig
+
+DEFAULT_LOG_FILE: Final[str] = "default.log"
 DEFAULT_LOG_LEVEL: Final[str] = LogLevel.DEBUG
 DEFAULT_LOG_FORMAT: Final[str] = logging.Formatter("%(levelname)s-%(message)s")
 DEFAULT_CONFIG_KEY: Final[str] = "default"
 DEFAULT_CONFIG_VALUE: Final[str] = None
 DEFAULT_CONFIG_VALUE_TYPE: Final[str] = type(DEFAULT_CONFIG_VALUE)
-
-if not os_path_exists(environ["LOGGING_DIR"]):
-    os_mkdir(environ["LOGGING_DIR"])
+DEFAULT_QUEUE_SIZE: Final[int] = 10000
+DEFAULT_OVERFLOW: Final[OverflowPolicy] = OverflowPolicy.BLOCK
+DEFAULT_BATCH_SIZE: Final[int] = 64
 
 
 class TimedLogger:
     """
     Implementation of the ILogger interface using
     the already existing logging facility.
+
+    The callers only enqueue the records, file writes and rotations are done
+    by a background listener for each logger, so logging never blocks on disk.
     """
 
     # Private attributes.
@@ -36,19 +51,36 @@ class TimedLogger:
     _avaiable_configs: Optional[Dict[str, TimedRotatingFileConfig | DEFAULT_CONFIG_VALUE_TYPE]] = (
         None
     )
-
-    def __init__(self, config_file_path: Optional[str] = None) -> None:
+    # Queued handler and background listener attached to each logger.
+    _listeners: Dict[str, Tuple[Logger, BoundedQueueHandler, BackgroundListener]]
+    _bound_loggers: Dict[str, BoundLogger]
+    _config_file_path: Optional[str] = None
+    _watcher: Optional[Thread] = None
+
+    def __init__(
+        self, config_file_path: Optional[str] = None, logging_dir: Optional[str] = None
+    ) -> None:
         """
         Create a new CdrtLogger with an empty list of avaiable loggers.
         If no configurations is passed, the default configuration is applied.
 
         Args:
             config_file_path (Optional[str], optional): _description_. Defaults to None.
+            logging_dir (Optional[str], optional): directory of the log files, created when
+                missing. Defaults to None, the LOGGING_DIR environment variable.
         """
 
+        self._logging_dir = logging_dir if logging_dir is not None else environ["LOGGING_DIR"]
+        makedirs(self._logging_dir, exist_ok=True)
         # self._avaiable_loggers = []
         self._avaiable_configs = {}
         self._avaiable_configs.setdefault(DEFAULT_CONFIG_KEY, DEFAULT_CONFIG_VALUE)
+        self._listeners = {}
+        self._bound_loggers = {}
+        self._lock = RLock()
+        self._watch_stop = Event()
+        # Queued records must reach the files even if shutdown is never called explicitly.
+        atexit.register(self.shutdown)
         if config_file_path is not None:
             self.file_config(config_file_path)
         # Fallback, if configuration file is none.
@@ -92,23 +124,107 @@ class TimedLogger:
         # Reading all the configurations.
         configurations: dict = {}
         try:
-            with open(config_file_path, "r") as config_file_sream:
-                configurations = safe_load(config_file_sream)
+            configurations = self._read_configurations(config_file_path)
         except Exception as e:
             print(e)
             sys.exit()
 
-        # Adding the configurations to the avaiable configurations.
-        for k, v in configurations.items():
-            self._avaiable_configs[k] = TimedRotatingFileConfig.parse_obj(v)
-            new_logger = getLogger(k)
-            self._apply_custom_timed_config(new_logger, self._avaiable_configs[k])
+        self._config_file_path = config_file_path
+        self._apply_configurations(configurations)
 
         # Fallback, if the configuration file was empty then apply a default configuration.
         if len(configurations.keys()) == 0:
             new_logger = getLogger(DEFAULT_CONFIG_KEY)
             self._apply_default_config(new_logger)
 
+    def reload(self, config_file_path: Optional[str] = None) -> None:
+        """
+        Read again the configuration file and swap levels and handlers of the live loggers.
+        The whole file is validated before touching any logger, then each logger swaps its
+        handler at once and the old one is drained, so no record is lost nor duplicated.
+
+        Args:
+            config_file_path (Optional[str], optional): absolute path of the configuration file.
+                Defaults to the last configuration file used.
+
+        Raises:
+            FileNotFoundError: when no configuration file is available.
+        """
+        config_file_path = config_file_path or self._config_file_path
+        if config_file_path is None:
+            raise FileNotFoundError
+
+        configurations = self._read_configurations(config_file_path)
+        self._config_file_path = config_file_path
+        self._apply_configurations(configurations)
+
+    def set_level(self, logger_name: str, level: LogLevel) -> None:
+        """
+        Change the level of a configured logger, effective immediately.
+
+        Args:
+            logger_name (str): the logger name.
+            level (LogLevel): the new level.
+
+        Raises:
+            KeyError: when the logger is not configured.
+        """
+        with self._lock:
+            if logger_name not in self._avaiable_configs:
+                raise KeyError(logger_name)
+            getLogger(logger_name).setLevel(self._log_level_mapper(level))
+            if self._avaiable_configs[logger_name] is not None:
+                self._avaiable_configs[logger_name].level = level
+
+    def levels(self) -> Dict[str, LogLevel]:
+        """
+        Return the current level of each configured logger.
+
+        Returns:
+            Dict[str, LogLevel]: levels by logger name.
+        """
+        return {
+            logger_name: LogLevel(logging.getLevelName(getLogger(logger_name).level))
+            for logger_name in list(self._listeners)
+        }
+
+    def watch(self, interval: float) -> None:
+        """
+        Reload the configuration file in background each time it changes.
+
+        Args:
+            interval (float): seconds between two checks of the file.
+        """
+        if self._watcher is not None or self._config_file_path is None:
+            return
+        self._watch_stop.clear()
+        self._watcher = Thread(
+            target=self._watch_config_file, args=(interval,), name="log-config-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def get(self, logger_name: str) -> BoundLogger:
+        """
+        Return the bound logger for the given name, cached after the first call.
+        Names without a configuration are bound to the root logger.
+
+        Args:
+            logger_name (str): the logger name to use.
+
+        Returns:
+            BoundLogger: the bound logger.
+        """
+        try:
+            return self._bound_loggers[logger_name]
+        except KeyError:
+            pass
+
+        if logger_name in self._avaiable_configs:
+            bound_logger = BoundLogger(getLogger(logger_name))
+        else:
+            bound_logger = BoundLogger(getLogger())
+        return self._bound_loggers.setdefault(logger_name, bound_logger)
+
     def debug(self, logger_name: str, message: str) -> None:
         """
         Print a debug level log statement with the specified logger.
@@ -117,11 +233,7 @@ class TimedLogger:
             logger_name (str): the logger name to use.
             message (str): the message to log.
         """
-        if logger_name in self._avaiable_configs.keys():
-            logger = logging.getLogger(logger_name)
-            logger.debug(message)
-        else:
-            logging.debug(message)
+        self.get(logger_name).debug(message)
 
     def info(self, logger_name: str, message: str) -> None:
         """
@@ -131,11 +243,7 @@ class TimedLogger:
             logger_name (str): the logger name to use.
             message (str): the message to log.
         """
-        if logger_name in self._avaiable_configs.keys():
-            logger = logging.getLogger(logger_name)
-            logger.info(message)
-        else:
-            logging.info(message)
+        self.get(logger_name).info(message)
 
     def warning(self, logger_name: str, message: str) -> None:
         """
@@ -145,11 +253,7 @@ class TimedLogger:
             logger_name (str): the logger name to use.
             message (str): the message to log.
         """
-        if logger_name in self._avaiable_configs.keys():
-            logger = logging.getLogger(logger_name)
-            logger.warning(message)
-        else:
-            logging.warning(message)
+        self.get(logger_name).warning(message)
 
     def error(self, logger_name: str, message: str) -> None:
         """
@@ -159,11 +263,7 @@ class TimedLogger:
             logger_name (str): the logger name to use.
             message (str): the message to log.
         """
-        if logger_name in self._avaiable_configs.keys():
-            logger = logging.getLogger(logger_name)
-            logger.error(message)
-        else:
-            logging.error(message)
+        self.get(logger_name).error(message)
 
     def critical(self, logger_name: str, message: str) -> None:
         """
@@ -173,13 +273,143 @@ class TimedLogger:
             logger_name (str): the logger name to use.
             message (str): the message to log.
         """
-        if logger_name in self._avaiable_configs.keys():
-            logger = logging.getLogger(logger_name)
-            logger.critical(message)
-        else:
-            logging.critical(message)
+        self.get(logger_name).critical(message)
+
+    def shutdown(self) -> None:
+        """
+        Stop the background writers, the queued records are written before returning.
+        """
+        self._watch_stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+        with self._lock:
+            while self._listeners:
+                _, attachment = self._listeners.popitem()
+                self._detach(attachment)
 
     # Private methods.
+    @staticmethod
+    def _read_configurations(config_file_path: str) -> Dict[str, TimedRotatingFileConfig]:
+        """
+        Read and validate all the configurations in the given file.
+
+        Args:
+            config_file_path (str): absolute path of the configuration file.
+
+        Returns:
+            Dict[str, TimedRotatingFileConfig]: configurations by logger name.
+        """
+        with open(config_file_path, "r", encoding="utf-8") as config_file_sream:
+            configurations = safe_load(config_file_sream) or {}
+        return {k: TimedRotatingFileConfig.parse_obj(v) for k, v in configurations.items()}
+
+    def _apply_configurations(self, configurations: Dict[str, TimedRotatingFileConfig]) -> None:
+        """
+        Apply the given configurations to their loggers.
+
+        Args:
+            configurations (Dict[str, TimedRotatingFileConfig]): configurations by logger name.
+        """
+        with self._lock:
+            # Adding the configurations to the avaiable configurations.
+            for k, v in configurations.items():
+                self._avaiable_configs[k] = v
+                new_logger = getLogger(k)
+                self._apply_custom_timed_config(new_logger, v)
+
+            # Names may move from the root logger to their own one.
+            self._bound_loggers.clear()
+
+    def _watch_config_file(self, interval: float) -> None:
+        """
+        Poll the configuration file modification time and reload it when it changes.
+
+        Args:
+            interval (float): seconds between two checks of the file.
+        """
+        last_mtime = os_path_getmtime(self._config_file_path)
+        while not self._watch_stop.wait(interval):
+            try:
+                mtime = os_path_getmtime(self._config_file_path)
+                if mtime == last_mtime:
+                    continue
+                last_mtime = mtime
+                self.reload()
+            except Exception as e:  # pylint: disable=broad-except
+                # A broken file must not stop the watcher nor touch the live configuration.
+                logging.error("Logging configuration reload failed: %s", e)
+
+    @staticmethod
+    def _detach(attachment: Tuple[Logger, BoundedQueueHandler, BackgroundListener]) -> None:
+        """
+        Detach a queued handler from its logger and drain its queue.
+
+        Args:
+            attachment (Tuple[Logger, BoundedQueueHandler, BackgroundListener]): logger,
+                queued handler and listener to detach.
+        """
+        attached_logger, queue_handler, listener = attachment
+        # Pending suppression summaries are written too.
+        for log_filter in queue_handler.filters:
+            if isinstance(log_filter, ThrottleFilter):
+                log_filter.stop()
+        # Detach first, nobody would consume the records enqueued after the stop.
+        attached_logger.removeHandler(queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    def _attach_queued_handler(
+        self,
+        new_logger: Logger,
+        handler: Handler,
+        queue_size: int,
+        overflow: OverflowPolicy,
+        batch_size: int,
+        throttle: Optional[ThrottleConfig] = None,
+    ) -> None:
+        """
+        Attach the given handler to the logger through a bounded queue,
+        the handler is then run by a background listener.
+
+        Args:
+            new_logger (Logger): logger to configure.
+            handler (Handler): handler doing the actual I/O.
+            queue_size (int): maximum number of queued records.
+            overflow (OverflowPolicy): policy to apply when the queue is full.
+            batch_size (int): maximum records written at once.
+            throttle (Optional[ThrottleConfig], optional): sampling and rate limiting.
+                Defaults to None.
+        """
+        queue: Queue = Queue(maxsize=queue_size)
+        queue_handler = BoundedQueueHandler(queue, overflow)
+        # Throttled records are dropped before paying anything else.
+        if throttle is not None:
+            queue_handler.addFilter(ThrottleFilter(throttle, queue_handler.handle))
+        # The request id lives in the caller context, it is read before enqueuing.
+        queue_handler.addFilter(RequestIdFilter())
+        listener = BackgroundListener(
+            queue, handler, respect_handler_level=True, batch_size=batch_size
+        )
+
+        with self._lock:
+            previous = self._listeners.get(new_logger.name)
+            self._listeners[new_logger.name] = (new_logger, queue_handler, listener)
+            # A single assignment, each record goes to exactly one of the two handlers.
+            new_logger.handlers = [
+                h for h in new_logger.handlers if previous is None or h is not previous[1]
+            ] + [queue_handler]
+            # The previous listener is drained before the new one starts writing,
+            # the two never write nor rotate the same file at the same time.
+            if previous is not None:
+                self._detach(previous)
+            listener.start()
+            for log_filter in queue_handler.filters:
+                if isinstance(log_filter, ThrottleFilter):
+                    log_filter.start()
+
     def _apply_default_config(self, new_logger: Logger) -> None:
         """
         Apply a default configuration to the given logger.
@@ -188,11 +418,13 @@ class TimedLogger:
             new_logger (Logger): to handle logger.
         """
         new_logger.setLevel(self._log_level_mapper(DEFAULT_LOG_LEVEL))
-        handler = TimedRotatingFileHandler(DEFAULT_LOG_FILE)
+        handler = BatchTimedRotatingFileHandler(os_path_join(self._logging_dir, DEFAULT_LOG_FILE))
         fmt = DEFAULT_LOG_FORMAT
         handler.setFormatter(fmt)
 
-        new_logger.addHandler(handler)
+        self._attach_queued_handler(
+            new_logger, handler, DEFAULT_QUEUE_SIZE, DEFAULT_OVERFLOW, DEFAULT_BATCH_SIZE
+        )
 
     def _apply_custom_timed_config(
         self, new_logger: Logger, config: TimedRotatingFileConfig
@@ -205,8 +437,8 @@ class TimedLogger:
             config (TimedRotatingFileConfig): logger configurations.
         """
         new_logger.setLevel(self._log_level_mapper(config.level))
-        handler = TimedRotatingFileHandler(
-            os_path_join(environ["LOGGING_DIR"], config.filename),
+        handler = BatchTimedRotatingFileHandler(
+            os_path_join(self._logging_dir, config.filename),
             config.when,
             config.interval,
             config.backup_count,
@@ -216,7 +448,18 @@ class TimedLogger:
             config.atTime,
             config.errors,
         )
-        fmt = logging.Formatter(config.format)
+        fmt: logging.Formatter
+        if config.formatter == LogFormatter.JSON:
+            fmt = JsonFormatter()
+        else:
+            fmt = logging.Formatter(config.format)
         handler.setFormatter(fmt)
 
-        new_logger.addHandler(handler)
+        self._attach_queued_handler(
+            new_logger,
+            handler,
+            config.queue_size,
+            config.overflow,
+            config.batch_size,
+            config.throttle,
+        )
@@ -0,0 +1,148 @@
+import logging
+from logging import Handler, LogRecord
+from logging.handlers import QueueHandler, QueueListener
+from queue import Empty, Full, Queue
+from typing import List
+
+from src.services.logger.enums.overflow import OverflowPolicy
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler writing to a bounded queue, when the queue is full
+    the given overflow policy decides what to do with the record.
+    """
+
+    dropped: int
+
+    def __init__(self, queue: Queue, overflow: OverflowPolicy = OverflowPolicy.BLOCK) -> None:
+        """
+        Create a new handler enqueuing the records in the given queue.
+
+        Args:
+            queue (Queue): bounded queue read by the background writer.
+            overflow (OverflowPolicy, optional): policy to apply when the queue is full.
+                Defaults to OverflowPolicy.BLOCK.
+        """
+        super().__init__(queue)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """
+        The queue lives in this process, so the record is handed over as it is and
+        formatted by the background writer, the caller pays only for the enqueue.
+        Arguments are then formatted later: do not mutate objects passed as lazy arguments.
+
+        Args:
+            record (LogRecord): record to prepare.
+
+        Returns:
+            LogRecord: the same record.
+        """
+        return record
+
+    def enqueue(self, record: LogRecord) -> None:
+        """
+        Enqueue the record applying the overflow policy when the queue is full.
+
+        Args:
+            record (LogRecord): record to enqueue.
+        """
+        try:
+            self.queue.put_nowait(record)
+            return
+        except Full:
+            pass
+
+        match self.overflow:
+            case OverflowPolicy.DROP_OLDEST:
+                while True:
+                    try:
+                        self.queue.get_nowait()
+                        self.queue.task_done()
+                        self.dropped += 1
+                    except Empty:
+                        pass
+                    try:
+                        self.queue.put_nowait(record)
+                        return
+                    except Full:
+                        continue
+            case OverflowPolicy.DROP_DEBUG if record.levelno <= logging.DEBUG:
+                self.dropped += 1
+            case _:
+                self.queue.put(record)
+
+
+class BackgroundListener(QueueListener):
+    """
+    QueueListener handing the records to its handlers in batches, the handlers
+    providing handle_batch get all the records available at once (up to batch_size).
+    When stopping it waits for room in a full queue.
+    """
+
+    def __init__(
+        self,
+        queue: Queue,
+        *handlers: Handler,
+        respect_handler_level: bool = False,
+        batch_size: int = 1,
+    ) -> None:
+        """
+        Create a new listener for the given queue.
+
+        Args:
+            queue (Queue): queue to consume.
+            handlers (Handler): handlers to run.
+            respect_handler_level (bool, optional): skip the records under the handler level.
+                Defaults to False.
+            batch_size (int, optional): maximum records for each batch. Defaults to 1.
+        """
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = max(1, batch_size)
+
+    def handle_batch(self, records: List[LogRecord]) -> None:
+        """
+        Run the handlers with the given records.
+
+        Args:
+            records (List[LogRecord]): records to handle.
+        """
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            selected = records
+            if self.respect_handler_level:
+                selected = [record for record in records if record.levelno >= handler.level]
+            if hasattr(handler, "handle_batch"):
+                handler.handle_batch(selected)
+            else:
+                for record in selected:
+                    handler.handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        """
+        Enqueue the stop sentinel, the records already queued are written before stopping.
+        """
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        """
+        Consume the queue until the sentinel, grouping the available records in batches.
+        """
+        queue = self.queue
+        stop = False
+        while not stop:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size and batch[-1] is not self._sentinel:
+                try:
+                    batch.append(self.dequeue(False))
+                except Empty:
+                    break
+
+            stop = batch[-1] is self._sentinel
+            records = batch[:-1] if stop else batch
+            if records:
+                self.handle_batch(records)
+            for _ in batch:
+                queue.task_done()
@@ -0,0 +1,179 @@
+import logging
+from logging import LogRecord
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Callable, Dict, Final, Hashable, List, Optional, Tuple
+
+from src.services.logger.implementations.bound_logger import LEVELS
+from src.services.logger.models.configuration import ThrottleConfig
+
+SUMMARY_ATTRIBUTE: Final[str] = "throttle_summary"
+_OVERFLOW_TEMPLATE: Final[str] = "<other messages>"
+
+
+class _TemplateState:
+    """Sampling and token bucket state of a single message template."""
+
+    __slots__ = ("levelno", "seen", "tokens", "updated", "suppressed")
+
+    def __init__(self, levelno: int, tokens: float, now: float) -> None:
+        self.levelno = levelno
+        self.seen = 0
+        self.tokens = tokens
+        self.updated = now
+        self.suppressed = 0
+
+
+class ThrottleFilter(logging.Filter):
+    """
+    Filter sampling and rate limiting the records for each logger and message template.
+    The dropped records are counted and periodically replaced by a summary record,
+    emitted by a timer thread once started so a template going quiet is summarized too.
+    """
+
+    def __init__(
+        self,
+        config: ThrottleConfig,
+        emit_summary: Callable[[LogRecord], None],
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """
+        Create a new throttle.
+
+        Args:
+            config (ThrottleConfig): throttle configuration.
+            emit_summary (Callable[[LogRecord], None]): called with the summary records.
+            clock (Callable[[], float], optional): seconds clock. Defaults to monotonic.
+        """
+        super().__init__()
+        self._max_levelno = LEVELS[config.max_level]
+        # Sampling keeps one record every period, starting from the first one.
+        self._sample_period = max(1, round(1 / config.sample_rate))
+        self._rate = config.rate
+        self._burst = config.burst
+        self._summary_interval = config.summary_interval
+        self._max_templates = config.max_templates
+        self._emit_summary = emit_summary
+        self._clock = clock
+        self._states: Dict[Hashable, _TemplateState] = {}
+        self._lock = Lock()
+        self._next_summary = clock() + config.summary_interval
+        self._timer: Optional[Thread] = None
+        self._timer_stop = Event()
+
+    def filter(self, record: LogRecord) -> bool:
+        if record.levelno > self._max_levelno or getattr(record, SUMMARY_ATTRIBUTE, False):
+            return True
+
+        now = self._clock()
+        key = (record.name, record.levelno, record.msg)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                if len(self._states) >= self._max_templates:
+                    key = (record.name, record.levelno, _OVERFLOW_TEMPLATE)
+                    state = self._states.get(key)
+                if state is None:
+                    state = _TemplateState(record.levelno, self._burst, now)
+                    self._states[key] = state
+            admitted = self._admit(state, now)
+            if not admitted:
+                state.suppressed += 1
+            summary_due = now >= self._next_summary
+
+        if summary_due:
+            self.flush(now)
+        return admitted
+
+    def start(self) -> None:
+        """
+        Start emitting the due summaries in background.
+        """
+        if self._timer is not None:
+            return
+        self._timer_stop.clear()
+        self._timer = Thread(target=self._flush_when_due, name="log-throttle-summary", daemon=True)
+        self._timer.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background summaries, the pending ones are emitted.
+        """
+        self._timer_stop.set()
+        if self._timer is not None:
+            self._timer.join()
+            self._timer = None
+        self.flush()
+
+    def flush(self, now: float | None = None) -> None:
+        """
+        Emit a summary record for each template having suppressed records.
+
+        Args:
+            now (float | None, optional): current clock value. Defaults to None.
+        """
+        if now is None:
+            now = self._clock()
+
+        suppressed: List[Tuple[Hashable, int, int]] = []
+        with self._lock:
+            self._next_summary = now + self._summary_interval
+            for key, state in list(self._states.items()):
+                if state.suppressed:
+                    suppressed.append((key, state.levelno, state.suppressed))
+                    state.suppressed = 0
+                elif state.tokens >= self._burst:
+                    # Idle templates are forgotten, they start again with a full bucket.
+                    del self._states[key]
+
+        for (name, _, template), levelno, count in suppressed:
+            summary = logging.LogRecord(
+                name,
+                levelno,
+                __file__,
+                0,
+                "%d similar messages suppressed: %s",
+                (count, template),
+                None,
+            )
+            setattr(summary, SUMMARY_ATTRIBUTE, True)
+            # The summary does not belong to the request which triggered it.
+            summary.request_id = None
+            self._emit_summary(summary)
+
+    def _flush_when_due(self) -> None:
+        """
+        Emit the summaries every interval, even when no other record is logged.
+        """
+        while True:
+            with self._lock:
+                remaining = self._next_summary - self._clock()
+            if self._timer_stop.wait(min(self._summary_interval, max(remaining, 0.01))):
+                return
+            now = self._clock()
+            if now >= self._next_summary:
+                self.flush(now)
+
+    def _admit(self, state: _TemplateState, now: float) -> bool:
+        """
+        Apply sampling and token bucket to a record of the given template.
+
+        Args:
+            state (_TemplateState): template state, updated in place.
+            now (float): current clock value.
+
+        Returns:
+            bool: True if the record must be kept.
+        """
+        state.seen += 1
+        if (state.seen - 1) % self._sample_period:
+            return False
+
+        if self._rate is None:
+            return True
+        state.tokens = min(self._burst, state.tokens + (now - state.updated) * self._rate)
+        state.updated = now
+        if state.tokens < 1:
+            return False
+        state.tokens -= 1
+        return True
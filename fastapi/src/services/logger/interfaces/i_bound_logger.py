@@ -0,0 +1,68 @@
+from typing import Any, Protocol, runtime_checkable
+
+from src.services.logger.enums.level import LogLevel
+
+
+@runtime_checkable
+class IBoundLogger(Protocol):
+    """
+    Interface of a logger bound to a name. Messages accept %-style lazy arguments,
+    formatted only when the level is enabled.
+    """
+
+    def is_enabled_for(level: LogLevel) -> bool:
+        """
+        Say if a statement with the given level would be logged,
+        useful to skip building expensive arguments.
+
+        Args:
+            level (LogLevel): level to check.
+
+        Returns:
+            bool: True if the level is enabled.
+        """
+
+    def debug(message: str, *args: Any) -> None:
+        """
+        Print a debug level log statement.
+
+        Args:
+            message (str): the message to log, %-style format string.
+            args (Any): the message arguments.
+        """
+
+    def info(message: str, *args: Any) -> None:
+        """
+        Print an info level log statement.
+
+        Args:
+            message (str): the message to log, %-style format string.
+            args (Any): the message arguments.
+        """
+
+    def warning(message: str, *args: Any) -> None:
+        """
+        Print a warning level log statement.
+
+        Args:
+            message (str): the message to log, %-style format string.
+            args (Any): the message arguments.
+        """
+
+    def error(message: str, *args: Any) -> None:
+        """
+        Print an error level log statement.
+
+        Args:
+            message (str): the message to log, %-style format string.
+            args (Any): the message arguments.
+        """
+
+    def critical(message: str, *args: Any) -> None:
+        """
+        Print critical level log statement.
+
+        Args:
+            message (str): the message to log, %-style format string.
+            args (Any): the message arguments.
+        """
@@ -1,4 +1,7 @@
-from typing import Protocol, runtime_checkable
+from typing import Dict, Optional, Protocol, runtime_checkable
+
+from src.services.logger.enums.level import LogLevel
+from src.services.logger.interfaces.i_bound_logger import IBoundLogger
 
 
 @runtime_checkable
@@ -15,6 +18,52 @@ class ILogger(Protocol):
             config_file_path (str): absolute path of the configuration file.
         """
 
+    def reload(config_file_path: Optional[str] = None) -> None:
+        """
+        Apply again the configuration file to the live loggers, no record is lost.
+
+        Args:
+            config_file_path (Optional[str], optional): absolute path of the configuration file.
+                Defaults to the last configuration file used.
+        """
+
+    def set_level(logger_name: str, level: LogLevel) -> None:
+        """
+        Change the level of a configured logger, effective immediately.
+
+        Args:
+            logger_name (str): the logger name.
+            level (LogLevel): the new level.
+        """
+
+    def levels() -> Dict[str, LogLevel]:
+        """
+        Return the current level of each configured logger.
+
+        Returns:
+            Dict[str, LogLevel]: levels by logger name.
+        """
+
+    def watch(interval: float) -> None:
+        """
+        Reload the configuration file in background each time it changes.
+
+        Args:
+            interval (float): seconds between two checks of the file.
+        """
+
+    def get(logger_name: str) -> IBoundLogger:
+        """
+        Return the bound logger for the given name, prefer it in the hot paths:
+        it accepts lazy %-style arguments and is resolved once.
+
+        Args:
+            logger_name (str): the logger name to use.
+
+        Returns:
+            IBoundLogger: the bound logger.
+        """
+
     def debug(logger_name: str, message: str) -> None:
         """
         Print a debug level log statement with the specified logger.
@@ -59,3 +108,8 @@ class ILogger(Protocol):
             logger_name (str): the logger name to use.
             message (str): the message to log.
         """
+
+    def shutdown() -> None:
+        """
+        Release the logging resources, pending records are written before returning.
+        """
@@ -1,15 +1,42 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from src.services.logger.enums.formatter import LogFormatter
 from src.services.logger.enums.level import LogLevel
+from src.services.logger.enums.overflow import OverflowPolicy
+
+
+class ThrottleConfig(BaseModel):
+    # Records are throttled for each logger and message template (the format string
+    # before the lazy arguments are applied), records above max_level are always kept.
+    max_level: Optional[LogLevel] = LogLevel.ERROR
+    # Fraction of the records kept, e.g. 0.1 keeps one record every ten.
+    sample_rate: Optional[float] = Field(1.0, gt=0, le=1)
+    # Token bucket: records per second allowed and maximum burst, no limit when rate is unset.
+    rate: Optional[float] = Field(None, gt=0)
+    burst: Optional[int] = Field(10, ge=1)
+    # Seconds between two "N similar messages suppressed" summaries.
+    summary_interval: Optional[float] = Field(60, gt=0)
+    # Templates tracked separately, the exceeding ones share a single bucket.
+    max_templates: Optional[int] = Field(1024, ge=1)
 
 
 class BaseLogConfig(BaseModel):
     # This format string has the same syntax as the
-    # default python logging format string.
-    format: str
+    # default python logging format string, "%(request_id)s" is available too.
+    # It is not used by the json formatter.
+    format: Optional[str] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    formatter: Optional[LogFormatter] = LogFormatter.TEXT
     level: Optional[LogLevel] = LogLevel.NOTSET
+    # Records are written by a background thread, the caller only enqueues them.
+    # When the queue is full the overflow policy is applied.
+    queue_size: Optional[int] = 10000
+    overflow: Optional[OverflowPolicy] = OverflowPolicy.BLOCK
+    # Maximum records written with a single write by the background writer.
+    batch_size: Optional[int] = 64
+    # Sampling and rate limiting, disabled when unset.
+    throttle: Optional[ThrottleConfig] = None
 
 
 class BaseFileLogConfig(BaseLogConfig):
@@ -0,0 +1,299 @@
+import math
+from bisect import bisect_left
+from threading import Lock, local
+from time import perf_counter
+from typing import Callable, Dict, Final, Generic, Iterator, List, Sequence, Tuple, TypeVar
+
+# Request latencies, in seconds.
+DEFAULT_BUCKETS: Final[Tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+T = TypeVar("T")
+
+
+class _Shards:
+    """
+    Values of a single metric split by thread.
+
+    Each thread only writes its own list, so the writes need no lock and never
+    contend. Readers sum all the lists, a concurrent write may be seen by the next
+    read only, which is fine for metrics scraped every few seconds.
+    """
+
+    __slots__ = ("_size", "_local", "_shards", "_lock")
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = local()
+        self._shards: List[List[float]] = []
+        # Taken once for each thread, when its list is created.
+        self._lock = Lock()
+
+    def get(self) -> List[float]:
+        """
+        Return the values owned by the calling thread.
+
+        Returns:
+            List[float]: the calling thread values.
+        """
+        try:
+            return self._local.values
+        except AttributeError:
+            values = [0.0] * self._size
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def sum(self) -> List[float]:
+        """
+        Return the values summed over all the threads,
+        the lists of the ended threads are kept so the counters never go back.
+
+        Returns:
+            List[float]: the summed values.
+        """
+        totals = [0.0] * self._size
+        with self._lock:
+            shards = list(self._shards)
+        for values in shards:
+            for i, value in enumerate(values):
+                totals[i] += value
+        return totals
+
+
+class Counter:
+    """Implementation of the ICounter interface."""
+
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            amount (float, optional): non negative increment. Defaults to 1.
+        """
+        self._shards.get()[0] += amount
+
+    def samples(self) -> Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        """
+        Return the exposition samples: name suffix, extra labels and value.
+
+        Returns:
+            Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]: the samples.
+        """
+        yield "_total", (), self._shards.sum()[0]
+
+
+class Gauge:
+    """Implementation of the IGauge interface."""
+
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increment the gauge.
+
+        Args:
+            amount (float, optional): the increment. Defaults to 1.
+        """
+        self._shards.get()[0] += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """
+        Decrement the gauge.
+
+        Args:
+            amount (float, optional): the decrement. Defaults to 1.
+        """
+        self._shards.get()[0] -= amount
+
+    def samples(self) -> Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        """
+        Return the exposition samples: name suffix, extra labels and value.
+
+        Returns:
+            Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]: the samples.
+        """
+        yield "", (), self._shards.sum()[0]
+
+
+class _Timer:
+    """Context manager observing the elapsed time in a histogram."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: "Histogram") -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self, *_) -> None:
+        self._histogram.observe(perf_counter() - self._start)
+
+
+class Histogram:
+    """
+    Implementation of the IHistogram interface.
+
+    Each thread keeps a count for each bucket plus the sum of the observations,
+    the cumulative counts are only computed when rendering.
+    """
+
+    __slots__ = ("_buckets", "_shards")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self._buckets = tuple(buckets)
+        # One count for each bucket, one for +Inf and the sum.
+        self._shards = _Shards(len(self._buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): the observed value, seconds for durations.
+        """
+        values = self._shards.get()
+        values[bisect_left(self._buckets, value)] += 1
+        values[-1] += value
+
+    def time(self) -> _Timer:
+        """
+        Observe the time spent in the with block, in seconds.
+
+        Returns:
+            _Timer: the timer.
+        """
+        return _Timer(self)
+
+    def samples(self) -> Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        """
+        Return the exposition samples: name suffix, extra labels and value.
+
+        Returns:
+            Iterator[Tuple[str, Tuple[Tuple[str, str], ...], float]]: the samples.
+        """
+        values = self._shards.sum()
+        cumulative = 0.0
+        for bound, count in zip(self._buckets + (math.inf,), values):
+            cumulative += count
+            yield "_bucket", (("le", format_value(bound)),), cumulative
+        # Count from the same snapshot of the buckets, so it always equals the +Inf bucket.
+        yield "_count", (), cumulative
+        yield "_sum", (), values[-1]
+
+
+class MetricFamily(Generic[T]):
+    """Implementation of the IMetricFamily interface."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        label_names: Sequence[str],
+        factory: Callable[[], T],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.label_names = tuple(label_names)
+        self._factory = factory
+        self._metrics: Dict[Tuple[str, ...], T] = {}
+        self._lock = Lock()
+
+    def labels(self, *label_values: str) -> T:
+        """
+        Return the metric for the given label values, created on first use.
+
+        Args:
+            label_values (str): one value for each label name, in the same order.
+
+        Raises:
+            ValueError: when the number of values does not match the label names.
+
+        Returns:
+            T: the metric.
+        """
+        try:
+            return self._metrics[label_values]
+        except KeyError:
+            pass
+
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"{self.name} expects the labels {self.label_names}")
+        with self._lock:
+            return self._metrics.setdefault(label_values, self._factory())
+
+    def render(self) -> Iterator[str]:
+        """
+        Return the family lines in the Prometheus text exposition format.
+
+        Returns:
+            Iterator[str]: the exposition lines.
+        """
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.metric_type}"
+        with self._lock:
+            metrics = list(self._metrics.items())
+        for label_values, metric in metrics:
+            labels = tuple(zip(self.label_names, label_values))
+            for suffix, extra_labels, value in metric.samples():
+                sample_labels = _format_labels(labels + extra_labels)
+                yield f"{self.name}{suffix}{sample_labels} {format_value(value)}"
+
+
+def format_value(value: float) -> str:
+    """
+    Format a sample value as required by the exposition format.
+
+    Args:
+        value (float): the value.
+
+    Returns:
+        str: the formatted value.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,126 @@
+from threading import Lock
+from typing import Callable, Dict, Optional, Sequence
+
+from src.services.metrics.implementations.metric import (
+    DEFAULT_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricFamily,
+)
+
+
+class MetricsRegistry:
+    """
+    Implementation of the IMetrics interface.
+
+    The metrics are only updated in the hot paths, the exposition text is built
+    when scraped.
+    """
+
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = Lock()
+
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> MetricFamily[Counter]:
+        """
+        Register a counter family.
+
+        Args:
+            name (str): metric name, without the _total suffix.
+            documentation (str): metric help text.
+            label_names (Sequence[str], optional): label names. Defaults to ().
+
+        Returns:
+            MetricFamily[Counter]: the counter family.
+        """
+        return self._register(name, documentation, "counter", label_names, Counter)
+
+    def gauge(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> MetricFamily[Gauge]:
+        """
+        Register a gauge family.
+
+        Args:
+            name (str): metric name.
+            documentation (str): metric help text.
+            label_names (Sequence[str], optional): label names. Defaults to ().
+
+        Returns:
+            MetricFamily[Gauge]: the gauge family.
+        """
+        return self._register(name, documentation, "gauge", label_names, Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> MetricFamily[Histogram]:
+        """
+        Register a histogram family.
+
+        Args:
+            name (str): metric name.
+            documentation (str): metric help text.
+            label_names (Sequence[str], optional): label names. Defaults to ().
+            buckets (Optional[Sequence[float]], optional): bucket upper bounds.
+                Defaults to DEFAULT_BUCKETS.
+
+        Returns:
+            MetricFamily[Histogram]: the histogram family.
+        """
+        bounds = tuple(sorted(buckets if buckets is not None else DEFAULT_BUCKETS))
+        return self._register(
+            name, documentation, "histogram", label_names, lambda: Histogram(bounds)
+        )
+
+    def render(self) -> str:
+        """
+        Return all the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: the exposition text.
+        """
+        with self._lock:
+            families = list(self._families.values())
+        lines = [line for family in families for line in family.render()]
+        return "\n".join(lines) + "\n"
+
+    # Private methods.
+    def _register(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        label_names: Sequence[str],
+        factory: Callable,
+    ) -> MetricFamily:
+        """
+        Register a new family, or return the one already registered with the same name.
+
+        Args:
+            name (str): metric name.
+            documentation (str): metric help text.
+            metric_type (str): exposition type.
+            label_names (Sequence[str]): label names.
+            factory (Callable): builds a metric for new label values.
+
+        Raises:
+            ValueError: when the name is already registered with a different type or labels.
+
+        Returns:
+            MetricFamily: the family.
+        """
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(name, documentation, metric_type, label_names, factory)
+                self._families[name] = family
+            elif family.metric_type != metric_type or family.label_names != tuple(label_names):
+                raise ValueError(f"The metric {name} is already registered differently")
+            return family
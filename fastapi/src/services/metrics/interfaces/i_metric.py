@@ -0,0 +1,84 @@
+from typing import ContextManager, Protocol, TypeVar, runtime_checkable
+
+T = TypeVar("T", covariant=True)
+
+
+@runtime_checkable
+class IMetricFamily(Protocol[T]):
+    """
+    Interface of a group of metrics sharing name and label names,
+    one metric for each combination of label values.
+    """
+
+    def labels(*label_values: str) -> T:
+        """
+        Return the metric for the given label values, created on first use.
+        Resolve it once outside the hot paths when the values are known in advance.
+
+        Args:
+            label_values (str): one value for each label name, in the same order.
+
+        Returns:
+            T: the metric.
+        """
+
+
+@runtime_checkable
+class ICounter(Protocol):
+    """
+    Interface of a monotonic counter.
+    """
+
+    def inc(amount: float = 1) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            amount (float, optional): non negative increment. Defaults to 1.
+        """
+
+
+@runtime_checkable
+class IGauge(Protocol):
+    """
+    Interface of a value going up and down, like the requests in flight.
+    """
+
+    def inc(amount: float = 1) -> None:
+        """
+        Increment the gauge.
+
+        Args:
+            amount (float, optional): the increment. Defaults to 1.
+        """
+
+    def dec(amount: float = 1) -> None:
+        """
+        Decrement the gauge.
+
+        Args:
+            amount (float, optional): the decrement. Defaults to 1.
+        """
+
+
+@runtime_checkable
+class IHistogram(Protocol):
+    """
+    Interface of a histogram counting the observations in cumulative buckets.
+    """
+
+    def observe(value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): the observed value, seconds for durations.
+        """
+
+    def time() -> ContextManager[None]:
+        """
+        Observe the time spent in the with block, in seconds.
+
+        Returns:
+            ContextManager[None]: the timer.
+        """
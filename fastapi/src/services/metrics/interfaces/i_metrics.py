@@ -0,0 +1,74 @@
+from typing import Optional, Protocol, Sequence, runtime_checkable
+
+from src.services.metrics.interfaces.i_metric import (
+    ICounter,
+    IGauge,
+    IHistogram,
+    IMetricFamily,
+)
+
+
+@runtime_checkable
+class IMetrics(Protocol):
+    """
+    Interface where the application metrics are registered and exposed.
+    Registering twice the same name returns the already registered family.
+    """
+
+    def counter(
+        name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> IMetricFamily[ICounter]:
+        """
+        Register a counter family.
+
+        Args:
+            name (str): metric name.
+            documentation (str): metric help text.
+            label_names (Sequence[str], optional): label names. Defaults to ().
+
+        Returns:
+            IMetricFamily[ICounter]: the counter family.
+        """
+
+    def gauge(
+        name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> IMetricFamily[IGauge]:
+        """
+        Register a gauge family.
+
+        Args:
+            name (str): metric name.
+            documentation (str): metric help text.
+            label_names (Sequence[str], optional): label names. Defaults to ().
+
+        Returns:
+            IMetricFamily[IGauge]: the gauge family.
+        """
+
+    def histogram(
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> IMetricFamily[IHistogram]:
+        """
+        Register a histogram family.
+
+        Args:
+            name (str): metric name.
+            documentation (str): metric help text.
+            label_names (Sequence[str], optional): label names. Defaults to ().
+            buckets (Optional[Sequence[float]], optional): bucket upper bounds.
+                Defaults to the request latency buckets.
+
+        Returns:
+            IMetricFamily[IHistogram]: the histogram family.
+        """
+
+    def render() -> str:
+        """
+        Return all the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: the exposition text.
+        """
@@ -0,0 +1,10 @@
+from pydantic_yaml import YamlStrEnum
+
+
+class SpanExporterKind(YamlStrEnum):
+    # Spans are propagated but not exported.
+    NONE = "none"
+    # One JSON object per span appended to a local file.
+    JSONL = "jsonl"
+    # OTLP/HTTP JSON posted to a collector.
+    OTLP = "otlp"
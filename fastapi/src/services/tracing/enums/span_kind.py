@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class SpanKind(str, Enum):
+    # Work done inside the application.
+    INTERNAL = "internal"
+    # A request served by the application.
+    SERVER = "server"
+    # A request sent by the application, e.g. a MongoDB command.
+    CLIENT = "client"
@@ -0,0 +1,156 @@
+import json
+from os.path import join
+from typing import Any, Dict, Final, List, Optional, Sequence
+from urllib.request import Request, urlopen
+
+from src.services.tracing.enums.exporter import SpanExporterKind
+from src.services.tracing.enums.span_kind import SpanKind
+from src.services.tracing.implementations.span import Span
+from src.services.tracing.interfaces.i_span_exporter import ISpanExporter
+from src.services.tracing.models.configuration import TracingConfig
+
+# OTLP span kinds and status codes.
+_OTLP_KINDS: Final[Dict[SpanKind, int]] = {
+    SpanKind.INTERNAL: 1,
+    SpanKind.SERVER: 2,
+    SpanKind.CLIENT: 3,
+}
+_OTLP_STATUS_OK: Final[int] = 1
+_OTLP_STATUS_ERROR: Final[int] = 2
+
+
+class JsonLinesSpanExporter:
+    """
+    Implementation of the ISpanExporter interface appending each span as a JSON line
+    to a local file, easy to grep by trace_id or to load in a notebook.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        # pylint: disable=consider-using-with
+        self._stream = open(file_path, "a", encoding="utf-8")
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """
+        Write the spans and flush, with a single write.
+
+        Args:
+            spans (Sequence[Span]): the spans.
+        """
+        lines = [json.dumps(span.to_dict(), default=str) + "\n" for span in spans]
+        self._stream.write("".join(lines))
+        self._stream.flush()
+
+    def shutdown(self) -> None:
+        """
+        Close the file.
+        """
+        self._stream.close()
+
+
+class OtlpHttpSpanExporter:
+    """
+    Implementation of the ISpanExporter interface posting the spans in the OTLP/HTTP
+    JSON encoding, understood by the OpenTelemetry collector, Jaeger and Tempo.
+    """
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float) -> None:
+        """
+        Args:
+            endpoint (str): collector base url, the spans are posted to <endpoint>/v1/traces.
+            service_name (str): reported as the service.name resource attribute.
+            timeout (float): seconds to wait for the collector.
+        """
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self._timeout = timeout
+        self._resource = {"attributes": [_otlp_attribute("service.name", service_name)]}
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """
+        Post the spans to the collector.
+
+        Args:
+            spans (Sequence[Span]): the spans.
+
+        Raises:
+            URLError: when the collector is not reachable or answers with an error.
+        """
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [
+                        {"scope": {"name": "src"}, "spans": [_otlp_span(s) for s in spans]}
+                    ],
+                }
+            ]
+        }
+        request = Request(
+            self.url,
+            data=json.dumps(payload, default=str).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urlopen(request, timeout=self._timeout) as response:
+            response.read()
+
+    def shutdown(self) -> None:
+        """
+        Nothing to release, each export opens its own connection.
+        """
+
+
+def build_span_exporter(config: TracingConfig, logging_dir: str) -> Optional[ISpanExporter]:
+    """Build the exporter selected by the configuration.
+
+    Args:
+        config (TracingConfig): the tracing configuration.
+        logging_dir (str): directory of the JSON lines file.
+
+    Returns:
+        Optional[ISpanExporter]: the exporter, None when the spans are not exported.
+    """
+    match config.exporter:
+        case SpanExporterKind.JSONL:
+            return JsonLinesSpanExporter(join(logging_dir, config.filename))
+        case SpanExporterKind.OTLP:
+            return OtlpHttpSpanExporter(
+                config.otlp_endpoint, config.service_name, config.otlp_timeout
+            )
+    return None
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Encode an attribute as an OTLP key value, the ints are strings in OTLP JSON."""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    """Encode a span in the OTLP JSON format."""
+    attributes: List[Dict[str, Any]] = [
+        _otlp_attribute(key, value)
+        for key, value in span.attributes.items()
+        if value is not None
+    ]
+    otlp_span = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _OTLP_KINDS[span.kind],
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time),
+        "attributes": attributes,
+        "status": (
+            {"code": _OTLP_STATUS_OK}
+            if span.error is None
+            else {"code": _OTLP_STATUS_ERROR, "message": span.error}
+        ),
+    }
+    if span.parent_id is not None:
+        otlp_span["parentSpanId"] = span.parent_id
+    return otlp_span
@@ -0,0 +1,101 @@
+from queue import Empty, Full, Queue
+from threading import Thread
+from time import monotonic
+from typing import Final, List
+
+from src.services.logger.interfaces.i_bound_logger import IBoundLogger
+from src.services.tracing.implementations.span import Span
+from src.services.tracing.interfaces.i_span_exporter import ISpanExporter
+
+_SENTINEL: Final = object()
+
+
+class BatchSpanProcessor:
+    """
+    Queue the finished spans and export them in batches from a background thread,
+    ending a span never waits for the exporter I/O.
+    """
+
+    def __init__(
+        self,
+        exporter: ISpanExporter,
+        logger: IBoundLogger,
+        queue_size: int,
+        batch_size: int,
+        export_interval: float,
+    ) -> None:
+        """
+        Start the export thread.
+
+        Args:
+            exporter (ISpanExporter): where the spans go.
+            logger (IBoundLogger): logger of the export failures.
+            queue_size (int): finished spans waiting for the exporter at most.
+            batch_size (int): spans exported at once at most.
+            export_interval (float): seconds a partial batch waits for more spans.
+        """
+        self._exporter = exporter
+        self._logger = logger
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._export_interval = export_interval
+        # Spans lost because the queue was full.
+        self.dropped = 0
+        self._thread = Thread(target=self._export_forever, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        """
+        Queue a finished span, dropped when the exporter can not keep up.
+
+        Args:
+            span (Span): the span.
+        """
+        try:
+            self._queue.put_nowait(span)
+        except Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        """
+        Export the queued spans and stop the thread and the exporter.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_SENTINEL)
+            self._thread.join()
+        self._exporter.shutdown()
+
+    # Private methods.
+    def _export_forever(self) -> None:
+        """
+        Group the finished spans in batches until the sentinel.
+        """
+        while True:
+            batch: List[Span] = []
+            item = self._queue.get()
+            deadline = monotonic() + self._export_interval
+            while item is not _SENTINEL:
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - monotonic()))
+                except Empty:
+                    break
+
+            if batch:
+                self._export(batch)
+            if item is _SENTINEL:
+                return
+
+    def _export(self, batch: List[Span]) -> None:
+        """
+        Export a batch, the failures are logged and the spans lost.
+
+        Args:
+            batch (List[Span]): the spans.
+        """
+        try:
+            self._exporter.export(batch)
+        except Exception as e:  # pylint: disable=broad-except
+            self._logger.warning("Export of %d spans failed: %s", len(batch), e)
@@ -0,0 +1,180 @@
+from contextvars import ContextVar, Token
+from random import getrandbits
+from time import time_ns
+from typing import Any, Callable, Dict, Final, Optional
+
+from src.services.tracing.enums.span_kind import SpanKind
+
+# Span of the code being run, set by the spans used as context managers.
+CURRENT_SPAN: Final[ContextVar[Optional["NonRecordingSpan"]]] = ContextVar(
+    "current_span", default=None
+)
+
+
+def new_trace_id() -> str:
+    """Return a random W3C trace id, 32 hex digits."""
+    return f"{getrandbits(128):032x}"
+
+
+def new_span_id() -> str:
+    """Return a random W3C span id, 16 hex digits."""
+    return f"{getrandbits(64):016x}"
+
+
+class NonRecordingSpan:
+    """
+    Span carrying only the trace context: a remote parent or a trace not sampled.
+    Entered it becomes the current span, so its children follow its sampling decision.
+    """
+
+    __slots__ = ("trace_id", "span_id", "sampled", "_token")
+
+    def __init__(self, trace_id: str, span_id: str, sampled: bool = False) -> None:
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+        self._token: Optional[Token] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Nothing is recorded."""
+
+    def update_name(self, name: str) -> None:
+        """Nothing is recorded."""
+
+    def set_error(self, description: str) -> None:
+        """Nothing is recorded."""
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Nothing is recorded."""
+
+    def end(self) -> None:
+        """Nothing is recorded."""
+
+    def __enter__(self) -> "NonRecordingSpan":
+        self._token = CURRENT_SPAN.set(self)
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        CURRENT_SPAN.reset(self._token)
+
+
+class _NoopSpan(NonRecordingSpan):
+    """Shared span of the children of a trace not sampled, it does not even become current."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        pass
+
+
+# Returned for every span not recorded below a trace not sampled, nothing is allocated.
+NOOP_SPAN: Final[NonRecordingSpan] = _NoopSpan("0" * 32, "0" * 16)
+
+
+class Span(NonRecordingSpan):
+    """
+    Span recording name, timing, attributes and outcome of an operation.
+    Once ended it is handed to the span processor.
+    """
+
+    __slots__ = (
+        "name",
+        "kind",
+        "parent_id",
+        "attributes",
+        "start_time",
+        "end_time",
+        "error",
+        "_on_end",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        kind: SpanKind,
+        attributes: Optional[Dict[str, Any]],
+        on_end: Callable[["Span"], None],
+    ) -> None:
+        """
+        Start a new span.
+
+        Args:
+            name (str): span name.
+            trace_id (str): trace id.
+            parent_id (Optional[str]): parent span id, None for the root span.
+            kind (SpanKind): span kind.
+            attributes (Optional[Dict[str, Any]]): initial attributes, the dict is kept.
+            on_end (Callable[[Span], None]): called once when the span ends.
+        """
+        super().__init__(trace_id, new_span_id(), True)
+        self.name = name
+        self.kind = kind
+        self.parent_id = parent_id
+        self.attributes = attributes if attributes is not None else {}
+        # Unix epoch nanoseconds, as OTLP wants them.
+        self.start_time = time_ns()
+        self.end_time: Optional[int] = None
+        # Error description, None when the operation succeeded.
+        self.error: Optional[str] = None
+        self._on_end = on_end
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Span duration in milliseconds, None until ended."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def update_name(self, name: str) -> None:
+        self.name = name
+
+    def set_error(self, description: str) -> None:
+        self.error = description
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.error = str(exception) or type(exception).__name__
+        self.attributes["exception.type"] = type(exception).__name__
+
+    def end(self) -> None:
+        if self.end_time is not None:
+            return
+        self.end_time = time_ns()
+        self._on_end(self)
+
+    def __enter__(self) -> "Span":
+        self._token = CURRENT_SPAN.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], _: Any) -> None:
+        CURRENT_SPAN.reset(self._token)
+        if exc is not None:
+            self.record_exception(exc)
+        self.end()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the span as a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: the span.
+        """
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind.value,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
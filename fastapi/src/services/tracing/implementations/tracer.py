@@ -0,0 +1,113 @@
+import random
+from typing import Any, Dict, Optional
+
+from src.services.tracing.enums.span_kind import SpanKind
+from src.services.tracing.implementations.processor import BatchSpanProcessor
+from src.services.tracing.implementations.span import (
+    CURRENT_SPAN,
+    NOOP_SPAN,
+    NonRecordingSpan,
+    Span,
+    new_span_id,
+    new_trace_id,
+)
+from src.services.tracing.models.configuration import TracingConfig
+
+
+class Tracer:
+    """
+    Implementation of the ITracer interface.
+
+    The sampling decision is taken once at the root span, below a trace not sampled
+    every span is the same shared no-op span: an unsampled request costs one
+    context variable set and reset.
+    """
+
+    def __init__(self, config: TracingConfig, processor: Optional[BatchSpanProcessor]) -> None:
+        """
+        Args:
+            config (TracingConfig): the tracing configuration.
+            processor (Optional[BatchSpanProcessor]): receives the finished spans,
+                when None the spans are propagated but not recorded.
+        """
+        self.config = config
+        self._processor = processor
+        self._recording = config.enabled and processor is not None
+
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+    ) -> NonRecordingSpan:
+        """
+        Start a child of the current span, or a new sampled or not trace when there is none.
+        Use it as a context manager to make it current and end it.
+
+        Args:
+            name (str): span name, e.g. "auth.verify_password".
+            attributes (Optional[Dict[str, Any]], optional): initial attributes.
+                Defaults to None.
+            kind (SpanKind, optional): span kind. Defaults to SpanKind.INTERNAL.
+
+        Returns:
+            NonRecordingSpan: the span, a Span when recorded.
+        """
+        if not self._recording:
+            return NOOP_SPAN
+
+        parent = CURRENT_SPAN.get()
+        if parent is None:
+            if random.random() >= self.config.sample_rate:
+                return NonRecordingSpan(new_trace_id(), new_span_id())
+            return Span(name, new_trace_id(), None, kind, attributes, self._processor.on_end)
+        if not parent.sampled:
+            return NOOP_SPAN
+        return Span(
+            name,
+            parent.trace_id,
+            parent.span_id,
+            kind,
+            attributes,
+            self._processor.on_end,
+        )
+
+    def current_span(self) -> Optional[NonRecordingSpan]:
+        """
+        Return the current span.
+
+        Returns:
+            Optional[NonRecordingSpan]: the span, None outside of any trace.
+        """
+        return CURRENT_SPAN.get()
+
+    def continue_trace(self, traceparent: Optional[str]) -> Optional[NonRecordingSpan]:
+        """
+        Parse a W3C traceparent header, the returned span is the remote parent
+        to enter before starting the local spans.
+
+        Args:
+            traceparent (Optional[str]): header value, "00-<trace id>-<span id>-<flags>".
+
+        Returns:
+            Optional[NonRecordingSpan]: the remote parent, None if missing or malformed.
+        """
+        if not traceparent or not self._recording:
+            return None
+        parts = traceparent.strip().lower().split("-")
+        if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+            return None
+        try:
+            flags = int(parts[3], 16)
+            if not int(parts[1], 16) or not int(parts[2], 16):
+                return None
+        except ValueError:
+            return None
+        return NonRecordingSpan(parts[1], parts[2], bool(flags & 0x01))
+
+    def shutdown(self) -> None:
+        """
+        Export the finished spans and stop the exporter.
+        """
+        if self._processor is not None:
+            self._processor.shutdown()
@@ -0,0 +1,53 @@
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ISpan(Protocol):
+    """
+    Interface of a timed operation of a trace. Used as a context manager the span
+    is the current one until the block exits, then it is ended.
+    The spans not sampled accept the same calls and record nothing.
+    """
+
+    trace_id: str
+    span_id: str
+    # The trace is recorded, the children spans are recorded too.
+    sampled: bool
+
+    def set_attribute(key: str, value: Any) -> None:
+        """
+        Set an attribute of the span.
+
+        Args:
+            key (str): attribute name, e.g. "http.route".
+            value (Any): str, bool, int or float value.
+        """
+
+    def update_name(name: str) -> None:
+        """
+        Rename the span, e.g. once the route of the request is known.
+
+        Args:
+            name (str): the new name.
+        """
+
+    def set_error(description: str) -> None:
+        """
+        Mark the span as failed.
+
+        Args:
+            description (str): what went wrong.
+        """
+
+    def record_exception(exception: BaseException) -> None:
+        """
+        Mark the span as failed because of the given exception.
+
+        Args:
+            exception (BaseException): the exception.
+        """
+
+    def end() -> None:
+        """
+        End the span, only needed for the spans not used as context managers.
+        """
@@ -0,0 +1,24 @@
+from typing import Protocol, Sequence, runtime_checkable
+
+from src.services.tracing.implementations.span import Span
+
+
+@runtime_checkable
+class ISpanExporter(Protocol):
+    """
+    Interface sending the finished spans somewhere, always called by the
+    same background thread.
+    """
+
+    def export(spans: Sequence[Span]) -> None:
+        """
+        Export a batch of finished spans.
+
+        Args:
+            spans (Sequence[Span]): the spans, in the order they ended.
+        """
+
+    def shutdown() -> None:
+        """
+        Release the exporter resources.
+        """
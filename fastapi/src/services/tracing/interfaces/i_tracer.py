@@ -0,0 +1,57 @@
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
+
+from src.services.tracing.enums.span_kind import SpanKind
+from src.services.tracing.interfaces.i_span import ISpan
+
+
+@runtime_checkable
+class ITracer(Protocol):
+    """
+    Interface creating the spans of the traces. The current span is kept in a context
+    variable, it follows the request across the awaits and into the executors
+    copying the context.
+    """
+
+    def span(
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+    ) -> ISpan:
+        """
+        Start a child of the current span, or a new sampled or not trace when there is none.
+        Use it as a context manager to make it current and end it.
+
+        Args:
+            name (str): span name, e.g. "auth.verify_password".
+            attributes (Optional[Dict[str, Any]], optional): initial attributes.
+                Defaults to None.
+            kind (SpanKind, optional): span kind. Defaults to SpanKind.INTERNAL.
+
+        Returns:
+            ISpan: the span.
+        """
+
+    def current_span() -> Optional[ISpan]:
+        """
+        Return the current span.
+
+        Returns:
+            Optional[ISpan]: the span, None outside of any trace.
+        """
+
+    def continue_trace(traceparent: Optional[str]) -> Optional[ISpan]:
+        """
+        Parse a W3C traceparent header, the returned span is the remote parent
+        to enter before starting the local spans.
+
+        Args:
+            traceparent (Optional[str]): header value.
+
+        Returns:
+            Optional[ISpan]: the remote parent, None if missing or malformed.
+        """
+
+    def shutdown() -> None:
+        """
+        Export the finished spans and stop the exporter.
+        """
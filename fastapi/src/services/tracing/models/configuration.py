@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+
+from src.services.tracing.enums.exporter import SpanExporterKind
+
+
+class TracingConfig(BaseModel):
+    """Tracing configuration."""
+
+    enabled: bool = True
+    # Reported as service.name to the collector.
+    service_name: str = "fastapi-auth-template"
+    # Fraction of the traces recorded, decided once at the root span. A trace continued
+    # from a traceparent header follows the caller decision.
+    sample_rate: float = Field(1.0, ge=0, le=1)
+    exporter: SpanExporterKind = SpanExporterKind.JSONL
+    # JSON lines file, relative to LOGGING_DIR.
+    filename: str = "traces.jsonl"
+    # Spans are posted to <otlp_endpoint>/v1/traces.
+    otlp_endpoint: str = "http://localhost:4318"
+    otlp_timeout: float = Field(5, gt=0)
+    # Finished spans waiting for the exporter, the exceeding ones are dropped.
+    queue_size: int = Field(10000, ge=1)
+    batch_size: int = Field(512, ge=1)
+    # Seconds a partial batch waits for more spans before being exported.
+    export_interval: float = Field(2, gt=0)
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class DatabaseBackend(str, Enum):
+    # MongoDB, configured by the DB_ variables.
+    MONGO = "mongo"
+    # In-process stand-in of the MongoDB users collection, for tests and benchmarks.
+    MEMORY = "memory"
+    # Embedded SQLite database file, for single-node and edge deployments.
+    SQLITE = "sqlite"
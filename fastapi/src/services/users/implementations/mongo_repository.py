@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Type
+
+from beanie.odm.enums import SortDirection
+from beanie.odm.queries.update import UpdateResponse
+from beanie.operators import All
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import DuplicateKeyError
+
+from src.core.exceptions import DuplicateUserError
+from src.core.settings import Settings
+from src.db.collections.user import User as UserCollection
+from src.db.connection import build_client
+from src.db.memory import MemoryClient
+from src.db.monitoring import CommandMonitor
+from src.models.user import Role, UpdateUserDetails
+from src.services.tracing.interfaces.i_tracer import ITracer
+from src.services.users.interfaces.i_user_repository import P
+from src.services.users.models.user_record import UserRecord
+
+
+class MongoUserRepository:
+    """
+    Implementation of the IUserRepository interface on the MongoDB users collection
+    through beanie, or on its in-process stand-in when DB_BACKEND is memory.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        tracer: ITracer,
+        command_monitor: CommandMonitor,
+        listeners: Sequence[Any],
+    ) -> None:
+        """
+        Args:
+            settings (Settings): the database settings.
+            tracer (ITracer): traces the initialization.
+            command_monitor (CommandMonitor): explains the slow queries.
+            listeners (Sequence[Any]): further command and pool listeners.
+        """
+        self._settings = settings
+        self._tracer = tracer
+        self._command_monitor = command_monitor
+        self._listeners = listeners
+        self._client: Optional[AsyncIOMotorClient | MemoryClient] = None
+
+    async def connect(self) -> None:
+        if self._client is not None:
+            return
+        # Index builds and checks make most of the startup time.
+        with self._tracer.span("db.init_beanie"):
+            self._client = await build_client(
+                self._settings, self._command_monitor, self._listeners
+            )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def ping(self) -> None:
+        await self._client.admin.command("ping")
+
+    async def find_by_username(self, username: str, projection: Type[P]) -> Optional[P]:
+        return await UserCollection.find_one(
+            UserCollection.username == username, projection_model=projection
+        )
+
+    async def find_many(
+        self, projection: Type[P], skip: Optional[int], limit: Optional[int]
+    ) -> List[P]:
+        return await UserCollection.find_all(
+            projection_model=projection,
+            skip=skip,
+            limit=limit,
+            sort=[("username", SortDirection.ASCENDING)],
+        ).to_list()
+
+    async def count(self, role: Optional[Role] = None) -> int:
+        if role is None:
+            return await UserCollection.find_all().count()
+        return await UserCollection.find_many(All(UserCollection.roles, [role.value])).count()
+
+    async def insert(self, user: UserRecord) -> None:
+        try:
+            await UserCollection(**user.dict()).insert()
+        except DuplicateKeyError as e:
+            raise _duplicate_user_error(e) from e
+
+    async def update(
+        self, username: str, details: UpdateUserDetails, last_update: datetime
+    ) -> bool:
+        # A single round trip, the document is not read before.
+        changes = {
+            **details.dict(include={"email", "username", "roles"}),
+            "last_update": last_update,
+        }
+        try:
+            result = await UserCollection.find_one(UserCollection.username == username).update(
+                {"$set": changes}, response_type=UpdateResponse.UPDATE_RESULT
+            )
+        except DuplicateKeyError as e:
+            raise _duplicate_user_error(e) from e
+        return result.matched_count > 0
+
+    async def delete(self, username: str) -> bool:
+        result = await UserCollection.find_one(UserCollection.username == username).delete()
+        return result is not None and result.deleted_count > 0
+
+
+def _duplicate_user_error(error: DuplicateKeyError) -> DuplicateUserError:
+    """Describe the fields of the violated unique index."""
+    duplicates = dict(error.details or {}).get("keyPattern")
+    return DuplicateUserError(
+        loggable=str(error), msg=f"The following fields must be unique: {duplicates}"
+    )
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Final, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from src.core.exceptions import DuplicateUserError
+from src.db.memory import DEFAULT_USERS
+from src.models.user import Role, UpdateUserDetails
+from src.services.users.interfaces.i_user_repository import P
+from src.services.users.models.user_record import UserRecord
+
+T = TypeVar("T")
+
+_COLUMNS: Final[Tuple[str, ...]] = (
+    "email",
+    "username",
+    "password",
+    "roles",
+    "creation",
+    "last_update",
+)
+_INSERT: Final[str] = (
+    f"INSERT INTO users ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+)
+# The unique indexes have the names MongoDB gives to the ones built by beanie.
+_SCHEMA: Final[str] = """
+CREATE TABLE users (
+    email TEXT NOT NULL,
+    username TEXT NOT NULL,
+    password TEXT NOT NULL,
+    roles TEXT NOT NULL,
+    creation TEXT NOT NULL,
+    last_update TEXT NOT NULL
+);
+CREATE UNIQUE INDEX email_1 ON users (email);
+CREATE UNIQUE INDEX username_1 ON users (username);
+"""
+
+
+class SqliteUserRepository:
+    """
+    Implementation of the IUserRepository interface on an embedded SQLite database file,
+    for single-node and edge deployments.
+
+    The connection is used by a single dedicated thread, so the event loop never waits
+    for the disk and the statements never race; SQLite serializes the writes anyway.
+    A new database is seeded with the users of mongo-init.js, as MongoDB is.
+    """
+
+    def __init__(self, database_path: str) -> None:
+        """
+        Args:
+            database_path (str): database file, created when missing.
+        """
+        self.database_path = database_path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._connection: Optional[sqlite3.Connection] = None
+
+    async def connect(self) -> None:
+        if self._connection is None:
+            await self._run(self._connect)
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+
+    async def ping(self) -> None:
+        await self._run(self._fetch_one, "SELECT 1", ())
+
+    async def find_by_username(self, username: str, projection: Type[P]) -> Optional[P]:
+        columns = _projected_columns(projection)
+        row = await self._run(
+            self._fetch_one, f"SELECT {columns} FROM users WHERE username = ?", (username,)
+        )
+        return None if row is None else projection.parse_obj(_from_row(row))
+
+    async def find_many(
+        self, projection: Type[P], skip: Optional[int], limit: Optional[int]
+    ) -> List[P]:
+        columns = _projected_columns(projection)
+        # As for MongoDB, a limit of 0 means no limit, -1 is SQLite no limit.
+        rows = await self._run(
+            self._fetch_all,
+            f"SELECT {columns} FROM users ORDER BY username LIMIT ? OFFSET ?",
+            (limit or -1, skip or 0),
+        )
+        return [projection.parse_obj(_from_row(row)) for row in rows]
+
+    async def count(self, role: Optional[Role] = None) -> int:
+        if role is None:
+            row = await self._run(self._fetch_one, "SELECT COUNT(*) AS n FROM users", ())
+        else:
+            row = await self._run(
+                self._fetch_one,
+                "SELECT COUNT(*) AS n FROM users"
+                " WHERE EXISTS (SELECT 1 FROM json_each(users.roles) WHERE value = ?)",
+                (role.value,),
+            )
+        return row["n"]
+
+    async def insert(self, user: UserRecord) -> None:
+        await self._run(self._insert, [user.dict()])
+
+    async def update(
+        self, username: str, details: UpdateUserDetails, last_update: datetime
+    ) -> bool:
+        changes = _to_row({**details.dict(), "last_update": last_update})
+        updated = await self._run(
+            self._write,
+            "UPDATE users SET email = ?, username = ?, roles = ?, last_update = ?"
+            " WHERE username = ?",
+            (
+                changes["email"],
+                changes["username"],
+                changes["roles"],
+                changes["last_update"],
+                username,
+            ),
+        )
+        return updated > 0
+
+    async def delete(self, username: str) -> bool:
+        deleted = await self._run(self._write, "DELETE FROM users WHERE username = ?", (username,))
+        return deleted > 0
+
+    # Private methods, the synchronous ones run in the SQLite thread.
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run the function in the SQLite thread.
+
+        Args:
+            func (Callable[..., T]): the function.
+            *args (Any): its arguments.
+
+        Returns:
+            T: its result.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> None:
+        """Open the database, creating and seeding it when new."""
+        # Autocommit, every statement is its own transaction.
+        connection = sqlite3.connect(self.database_path, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection = connection
+        exists = self._fetch_one(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'", ()
+        )
+        if exists is None:
+            connection.executescript(_SCHEMA)
+            self._insert(DEFAULT_USERS)
+
+    def _fetch_one(self, sql: str, parameters: Tuple[Any, ...]) -> Optional[sqlite3.Row]:
+        """Run a query and return the first row."""
+        return self._connection.execute(sql, parameters).fetchone()
+
+    def _fetch_all(self, sql: str, parameters: Tuple[Any, ...]) -> List[sqlite3.Row]:
+        """Run a query and return all the rows."""
+        return self._connection.execute(sql, parameters).fetchall()
+
+    def _write(self, sql: str, parameters: Tuple[Any, ...]) -> int:
+        """Run a statement and return the changed rows, as MongoDB unique errors are raised."""
+        try:
+            return self._connection.execute(sql, parameters).rowcount
+        except sqlite3.IntegrityError as e:
+            raise _duplicate_user_error(e) from e
+
+    def _insert(self, users: Iterable[Dict[str, Any]]) -> None:
+        """Insert the users, one statement each."""
+        for user in users:
+            row = _to_row(user)
+            self._write(_INSERT, tuple(row[column] for column in _COLUMNS))
+
+
+def _projected_columns(projection: Type[Any]) -> str:
+    """Return the stored columns read by the projection model."""
+    return ", ".join(column for column in _COLUMNS if column in projection.__fields__)
+
+
+def _to_row(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode the roles as a JSON array and the dates in ISO format, which sort as dates."""
+    row = dict(user)
+    if "roles" in row:
+        row["roles"] = json.dumps([Role(role).value for role in row["roles"]])
+    for column in ("creation", "last_update"):
+        if isinstance(row.get(column), datetime):
+            row[column] = row[column].isoformat()
+    return row
+
+
+def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Decode a row, the projection model parses the dates."""
+    user = dict(row)
+    if "roles" in user:
+        user["roles"] = json.loads(user["roles"])
+    return user
+
+
+def _duplicate_user_error(error: sqlite3.IntegrityError) -> DuplicateUserError:
+    """Describe the fields of the violated unique index as MongoDB does.
+
+    SQLite reports them as "UNIQUE constraint failed: users.<field>".
+    """
+    fields = [name.split(".")[-1] for name in str(error).split(":")[-1].split(",")]
+    duplicates = {field.strip(): 1 for field in fields}
+    return DuplicateUserError(
+        loggable=str(error), msg=f"The following fields must be unique: {duplicates}"
+    )
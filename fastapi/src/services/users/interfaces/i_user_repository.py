@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import List, Optional, Protocol, Type, TypeVar, runtime_checkable
+
+from pydantic import BaseModel
+
+from src.models.user import Role, UpdateUserDetails
+from src.services.users.models.user_record import UserRecord
+
+P = TypeVar("P", bound=BaseModel)
+
+
+@runtime_checkable
+class IUserRepository(Protocol):
+    """
+    Interface storing the users, the routes only know this one. Every implementation
+    enforces unique usernames and emails and sorts the users by username.
+    """
+
+    async def connect() -> None:
+        """
+        Open the storage and build the indexes, called once at startup.
+        """
+
+    async def close() -> None:
+        """
+        Release the storage.
+        """
+
+    async def ping() -> None:
+        """
+        Round trip to the storage, raising when it is not reachable.
+        """
+
+    async def find_by_username(username: str, projection: Type[P]) -> Optional[P]:
+        """
+        Return the user having the given username.
+
+        Args:
+            username (str): the username.
+            projection (Type[P]): model of the returned user, only its fields are read.
+
+        Returns:
+            Optional[P]: the user, None when missing.
+        """
+
+    async def find_many(projection: Type[P], skip: Optional[int], limit: Optional[int]) -> List[P]:
+        """
+        Return a page of users sorted by username.
+
+        Args:
+            projection (Type[P]): model of the returned users, only its fields are read.
+            skip (Optional[int]): users to skip, None for none.
+            limit (Optional[int]): users to return at most, None or 0 for all.
+
+        Returns:
+            List[P]: the users.
+        """
+
+    async def count(role: Optional[Role] = None) -> int:
+        """
+        Count the users.
+
+        Args:
+            role (Optional[Role], optional): count only the users having it. Defaults to None.
+
+        Returns:
+            int: the users.
+        """
+
+    async def insert(user: UserRecord) -> None:
+        """
+        Store a new user.
+
+        Args:
+            user (UserRecord): the user.
+
+        Raises:
+            DuplicateUserError: when the username or the email are taken.
+        """
+
+    async def update(username: str, details: UpdateUserDetails, last_update: datetime) -> bool:
+        """
+        Replace username, email and roles of a user.
+
+        Args:
+            username (str): current username of the user.
+            details (UpdateUserDetails): the new details.
+            last_update (datetime): update date.
+
+        Raises:
+            DuplicateUserError: when the new username or email are taken by another user.
+
+        Returns:
+            bool: True if the user was found.
+        """
+
+    async def delete(username: str) -> bool:
+        """
+        Delete a user.
+
+        Args:
+            username (str): username of the user.
+
+        Returns:
+            bool: True if the user was found.
+        """
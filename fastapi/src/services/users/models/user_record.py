@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+from src.models.user import Role
+
+
+class UserRecord(BaseModel):
+    """Stored user, the only projection carrying the password hash."""
+
+    email: str
+    username: str
+    password: str
+    roles: List[Role]
+    creation: datetime
+    last_update: datetime
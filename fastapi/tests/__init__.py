@@ -1,18 +1,32 @@
 from json import loads as json_loads
 from os import environ
+from os.path import splitext
 from typing import Any, Final
 
+environ["SECRET_KEY"] = "test-secret-key"
+# The tests run on the in-process users collection, set DB_BACKEND=mongo to use MongoDB.
+environ.setdefault("DB_BACKEND", "memory")
+
+# Name of the pytest-xdist worker running the tests (gw0, gw1...), empty without xdist.
+WORKER: Final[str] = environ.get("PYTEST_XDIST_WORKER", "")
+# Each worker gets a database of its own before the application is imported: a users
+# collection on MongoDB, a file on SQLite; the in-process collection is per process anyway.
+if WORKER:
+    environ["DB_USERS_COLLECTION"] = f"{environ.get('DB_USERS_COLLECTION', 'users')}_{WORKER}"
+    _root, _extension = splitext(
+        environ.get("DB_SQLITE_PATH", f"{environ.get('DB_NAME', 'test')}.sqlite3")
+    )
+    environ["DB_SQLITE_PATH"] = f"{_root}_{WORKER}{_extension}"
+
+# pylint: disable=wrong-import-position
 import typesentry
 from httpx import AsyncClient
 
 from src.app import fastapi_app
-from src.db.connection import build_client as build_db_client
 from src.models.auth import AuthMessage
 
 BASE_URL: Final[str] = "http://"
 
-environ["SECRET_KEY"] = "test-secret-key"
-
 _TC: Final[typesentry.Config] = typesentry.Config()
 IS_TYPED: Final[Any] = _TC.is_type
 
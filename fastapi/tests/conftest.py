@@ -0,0 +1,78 @@
+import asyncio
+from os import environ
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from src.db.collections.user import User as UserCollection
+from src.db.memory import DEFAULT_USERS
+from src.helpers.container import CONTAINER
+from src.services.users.enums.backend import DatabaseBackend
+from src.services.users.interfaces.i_user_repository import IUserRepository
+from src.services.users.models.user_record import UserRecord
+from tests import BASE_URL, WORKER, admin_login, fastapi_app, user_login
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """A single loop for the whole session, the database clients are bound to it."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def repository():
+    """The connected user repository of the application, holding the default users."""
+    instance = CONTAINER.get(IUserRepository)
+    await instance.connect()
+    # The collection of an xdist worker starts empty on MongoDB.
+    for user in DEFAULT_USERS:
+        if await instance.find_by_username(user["username"], UserRecord) is None:
+            await instance.insert(UserRecord.parse_obj(user))
+    yield instance
+    if WORKER and environ["DB_BACKEND"] == DatabaseBackend.MONGO:
+        await UserCollection.get_motor_collection().drop()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(repository):
+    """Client of the application, shared by the whole session."""
+    # pylint: disable=redefined-outer-name,unused-argument
+    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="session")
+async def admin_tokens(repository):
+    """Tokens of the admin, a login costs a bcrypt verification."""
+    # pylint: disable=redefined-outer-name,unused-argument
+    return await admin_login()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def user_tokens(repository):
+    """Tokens of the user, a login costs a bcrypt verification."""
+    # pylint: disable=redefined-outer-name,unused-argument
+    return await user_login()
+
+
+@pytest_asyncio.fixture
+async def restore_users(repository):
+    """
+    Put the users back as they were before the test, whatever the test did or where
+    it failed: the added and changed users are deleted, the removed and changed ones
+    are inserted again.
+    """
+    # pylint: disable=redefined-outer-name
+    before = {user.username: user for user in await repository.find_many(UserRecord, None, None)}
+    yield
+    after = {user.username: user for user in await repository.find_many(UserRecord, None, None)}
+    # Deleting first releases the usernames and the emails taken by the test.
+    for username, user in after.items():
+        if before.get(username) != user:
+            await repository.delete(username)
+    for username, user in before.items():
+        if after.get(username) != user:
+            await repository.insert(user)
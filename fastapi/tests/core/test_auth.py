@@ -17,7 +17,6 @@ from src.core.auth import (
     verify_password,
 )
 from src.models.user import Role
-from tests import admin_login, build_db_client, user_login
 
 PLAIN_PASSWORD: Final[str] = "test-pwd"
 USER: Final[dict] = {"username": "mariorossi", "password": "secure-hashed-pwd"}
@@ -111,24 +110,18 @@ def test_has_bad_roles():
 
 
 @pytest.mark.asyncio
-async def test_is_athorized():
+async def test_is_athorized(user_tokens):
     """Test if given a token the user is authorized, should return authorized=True"""
-    await build_db_client()
-    login_response = await user_login()
-
-    authorized, decoded_token = is_authorized(login_response.access_token)
+    authorized, decoded_token = is_authorized(user_tokens.access_token)
 
     assert authorized
     assert not decoded_token["is_refresh"]
 
 
 @pytest.mark.asyncio
-async def test_is_admin():
+async def test_is_admin(admin_tokens):
     """Test if a given user is admin, should return admin=True"""
-    await build_db_client()
-    login_response = await admin_login()
-
-    authorized, admin, decoded_token = is_admin(login_response.access_token)
+    authorized, admin, decoded_token = is_admin(admin_tokens.access_token)
 
     assert authorized
     assert admin
@@ -136,12 +129,9 @@ async def test_is_admin():
 
 
 @pytest.mark.asyncio
-async def test_require_admin():
+async def test_require_admin(admin_tokens):
     """Test admin required"""
-    await build_db_client()
-    login_response = await admin_login()
-
-    require_admin(login_response.access_token)
+    require_admin(admin_tokens.access_token)
 
     # The require_admin function does not return anything, but if an exception is raised,
     # test fail, if it complete everything then everything ok whith admin login.
@@ -149,13 +139,10 @@ async def test_require_admin():
 
 
 @pytest.mark.asyncio
-async def test_require_admin_fail():
+async def test_require_admin_fail(user_tokens):
     """Test admin required fail"""
-    await build_db_client()
-    login_response = await user_login()
-
     try:
-        require_admin(login_response.access_token)
+        require_admin(user_tokens.access_token)
     except Exception as e:
         # pylint: disable=no-member
         assert e.status_code == 403
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.hashing import HashingPool, HashingPoolConfig
+from src.core.health import HealthChecker, HealthConfig
+from src.core.loop_monitor import EventLoopMonitor, LoopMonitorConfig
+from src.db.monitoring import PoolMonitor
+from src.services.metrics.implementations.registry import MetricsRegistry
+
+
+class PingingRepository:
+    """Stand-in for the user repository, answering the pings."""
+
+    async def ping(self) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+
+class SilentLogger:
+    """Bound logger discarding everything."""
+
+    def warning(self, *_) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+
+@pytest.mark.asyncio
+async def test_readiness():
+    """Test the instance is ready until a check goes over its threshold"""
+    pool_monitor = PoolMonitor()
+    checker = HealthChecker(
+        HealthConfig(max_pool_wait_queue=1),
+        EventLoopMonitor(LoopMonitorConfig(), SilentLogger(), MetricsRegistry()),
+        HashingPool(HashingPoolConfig(workers=1)),
+        pool_monitor,
+        SilentLogger(),
+    )
+    assert not checker.readiness()["mongo_ping_ms"]["ok"]
+
+    await checker.start(PingingRepository())
+    try:
+        # The ping runs in its own task, wait for the first result.
+        for _ in range(100):
+            if checker.readiness()["mongo_ping_ms"]["value"] is not None:
+                break
+            await asyncio.sleep(0.01)
+        assert all(check["ok"] for check in checker.readiness().values())
+
+        pool_monitor.connection_check_out_started(None)
+        pool_monitor.connection_check_out_started(None)
+        checks = checker.readiness()
+        assert not checks["mongo_pool_wait_queue"]["ok"]
+        assert checks["mongo_pool_wait_queue"]["value"] == 2
+    finally:
+        await checker.stop()
+
+
+@pytest.mark.asyncio
+async def test_hashing_backlog():
+    """Test the hashes beyond the pool threads are counted as backlog"""
+    pool = HashingPool(HashingPoolConfig(workers=2))
+    tasks = [asyncio.create_task(pool.run(time.sleep, 0.05)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+
+    assert pool.backlog == 3
+    await asyncio.gather(*tasks)
+    assert pool.backlog == 0
+    pool.shutdown()
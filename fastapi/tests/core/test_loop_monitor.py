@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.loop_monitor import EventLoopMonitor, LoopMonitorConfig
+from src.services.metrics.implementations.registry import MetricsRegistry
+
+
+class RecordingLogger:
+    """Bound logger keeping the formatted warnings."""
+
+    def __init__(self) -> None:
+        self.warnings = []
+
+    def warning(self, message: str, *args) -> None:
+        # pylint: disable=missing-function-docstring
+        self.warnings.append(message % args)
+
+
+def block_the_loop():
+    """Blocking call, as bcrypt or a synchronous read would be"""
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_detected():
+    """Test a blocking call is measured as lag and its stack captured"""
+    logger = RecordingLogger()
+    registry = MetricsRegistry()
+    config = LoopMonitorConfig(interval=0.02, block_threshold=0.1, capture_stacks=True)
+    monitor = EventLoopMonitor(config, logger, registry)
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        assert monitor.blocks == 0
+
+        block_the_loop()
+        await asyncio.sleep(0.1)
+    finally:
+        await monitor.stop()
+
+    assert monitor.blocks == 1
+    assert "event_loop_blocks_total 1" in registry.render().splitlines()
+    assert "block_the_loop" in monitor.last_block_stack
+    assert len(logger.warnings) == 1
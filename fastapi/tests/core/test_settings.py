@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import pytest
+from jose import jwt
+from pydantic import ValidationError
+
+from src.core.settings import SettingsStore, load_settings
+
+
+def test_derived_values():
+    settings = load_settings()
+
+    assert settings.jwt.access_delta == timedelta(minutes=settings.jwt.access_expiration)
+    assert settings.jwt.refresh_delta == timedelta(minutes=settings.jwt.refresh_expiration)
+    # Tokens signed with the prepared key verify with the plain secret.
+    token = jwt.encode({"a": 1}, settings.signing_key, algorithm=settings.jwt.algorithm)
+    secret = settings.secret_key.get_secret_value()
+    assert jwt.decode(token, secret, algorithms=settings.jwt.algorithm) == {"a": 1}
+    assert settings.mongo_url.startswith(f"mongodb://{settings.db_username}:")
+    # The secrets are not shown.
+    assert secret not in repr(settings)
+    with pytest.raises(TypeError):
+        settings.db_name = "other"
+
+
+def test_reload(monkeypatch):
+    store = SettingsStore(load_settings())
+    before = store.current
+    secret = before.secret_key.get_secret_value()
+
+    monkeypatch.setenv("SECRET_KEY", "rotated-secret-key")
+    after = store.reload()
+    assert store.current is after
+    assert after.secret_key.get_secret_value() == "rotated-secret-key"
+    # The previous settings are untouched, a reader holding them keeps a consistent view.
+    assert before.secret_key.get_secret_value() == secret
+
+    monkeypatch.setenv("LOGGING_WATCH_INTERVAL", "-1")
+    with pytest.raises(ValidationError):
+        store.reload()
+    assert store.current is after
@@ -0,0 +1,83 @@
+from datetime import datetime
+
+import pytest
+from pymongo import IndexModel, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from src.db.memory import MemoryClient, matches
+
+
+def build_collection():
+    """Users collection with unique usernames and three documents."""
+    collection = MemoryClient()["test"]["users"]
+    collection.load(
+        [
+            {"username": "carl", "roles": ["user"], "creation": datetime(2022, 1, 3)},
+            {"username": "anna", "roles": ["admin", "user"], "creation": datetime(2022, 1, 1)},
+            {"username": "bob", "roles": ["user"], "creation": datetime(2022, 1, 2)},
+        ]
+    )
+    return collection
+
+
+def test_matches():
+    document = {"username": "anna", "roles": ["admin", "user"]}
+    assert matches(document, {})
+    assert matches(document, {"username": "anna", "roles": "admin"})
+    assert matches(document, {"roles": {"$all": ["admin", "user"]}})
+    assert not matches(document, {"roles": {"$all": ["admin", "guest"]}})
+    assert matches(document, {"$and": [{"username": {"$in": ["anna", "bob"]}}, {"roles": "user"}]})
+    assert matches(document, {"username": {"$regex": "^an"}})
+    assert not matches(document, {"username": {"$ne": "anna"}})
+
+
+@pytest.mark.asyncio
+async def test_find_sort_skip_limit_projection():
+    collection = build_collection()
+
+    found = await collection.find(
+        {}, projection={"username": 1}, sort=[("creation", 1)], skip=1, limit=1
+    ).to_list(None)
+
+    assert [document["username"] for document in found] == ["bob"]
+    assert set(found[0]) == {"_id", "username"}
+    assert await collection.count_documents({"roles": {"$all": ["user"]}}) == 3
+    assert (await collection.find_one({"username": "anna"}))["roles"] == ["admin", "user"]
+
+
+@pytest.mark.asyncio
+async def test_unique_index():
+    collection = build_collection()
+    await collection.create_indexes([IndexModel([("username", 1)], unique=True)])
+
+    with pytest.raises(DuplicateKeyError) as error:
+        await collection.insert_one({"username": "anna", "roles": []})
+    assert error.value.details["keyPattern"] == {"username": 1}
+
+    with pytest.raises(BulkWriteError) as bulk_error:
+        await collection.insert_many([{"username": "anna"}, {"username": "dan"}], ordered=False)
+    assert bulk_error.value.details["nInserted"] == 1
+    # Updating to a taken username is refused too, the old one is released on update.
+    with pytest.raises(DuplicateKeyError):
+        await collection.update_one({"username": "bob"}, {"$set": {"username": "carl"}})
+    await collection.update_one({"username": "bob"}, {"$set": {"username": "bobby"}})
+    await collection.insert_one({"username": "bob"})
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete():
+    collection = build_collection()
+
+    updated = await collection.find_one_and_update(
+        {"username": "new"},
+        {"$set": {"roles": ["user"]}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    assert updated["username"] == "new" and updated["roles"] == ["user"]
+    # The returned documents are copies.
+    updated["roles"].append("admin")
+    assert (await collection.find_one({"username": "new"}))["roles"] == ["user"]
+
+    assert (await collection.delete_many({"roles": "user"})).deleted_count == 4
+    assert await collection.count_documents({}) == 0
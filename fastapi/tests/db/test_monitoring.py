@@ -0,0 +1,84 @@
+from datetime import timedelta
+from typing import List
+
+from pymongo.monitoring import CommandStartedEvent, CommandSucceededEvent
+
+from src.db.monitoring import CommandMonitor, MonitoringConfig, command_shape
+from src.services.metrics.implementations.registry import MetricsRegistry
+
+CONNECTION_ID = ("localhost", 27017)
+
+
+class RecordingLogger:
+    """Bound logger keeping the formatted warnings."""
+
+    def __init__(self) -> None:
+        self.warnings: List[str] = []
+
+    def warning(self, message: str, *args) -> None:
+        # pylint: disable=missing-function-docstring
+        self.warnings.append(message % args)
+
+    def error(self, message: str, *args) -> None:
+        # pylint: disable=missing-function-docstring
+        raise AssertionError(message % args)
+
+
+class ExplainingClient:
+    """Stand-in for the pymongo client, returning a fixed plan."""
+
+    def __getitem__(self, _):
+        return self
+
+    def command(self, *_, **__):
+        # pylint: disable=missing-function-docstring
+        plan = {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}
+        return {"queryPlanner": {"winningPlan": plan}}
+
+
+def run_command(monitor: CommandMonitor, request_id: int, command: dict, milliseconds: int):
+    """Feed the monitor with the events of a completed command."""
+    command_name = next(iter(command))
+    monitor.started(CommandStartedEvent(command, "test", request_id, CONNECTION_ID, request_id))
+    monitor.succeeded(
+        CommandSucceededEvent(
+            timedelta(milliseconds=milliseconds),
+            {"ok": 1},
+            command_name,
+            request_id,
+            CONNECTION_ID,
+            request_id,
+        )
+    )
+
+
+def test_command_shape():
+    """Test filter values are redacted, keys and operators kept"""
+    command = {
+        "find": "users",
+        "filter": {"username": "john", "roles": {"$in": ["admin", "user"]}, "$or": [{"a": 1}]},
+    }
+    assert command_shape("find", command) == (
+        '{"$or": [{"a": "?"}], "roles": {"$in": "?"}, "username": "?"}'
+    )
+    assert command_shape("ping", {"ping": 1}) is None
+
+
+def test_slow_commands():
+    """Test timings are aggregated and slow shapes logged and explained"""
+    logger = RecordingLogger()
+    monitor = CommandMonitor(
+        MonitoringConfig(slow_threshold_ms=50, explain=True), logger, MetricsRegistry()
+    )
+    monitor.attach(ExplainingClient())
+
+    run_command(monitor, 1, {"find": "users", "filter": {"username": "john"}}, 10)
+    run_command(monitor, 2, {"find": "users", "filter": {"username": "jane"}}, 200)
+    monitor._explainer.shutdown(wait=True)  # pylint: disable=protected-access
+
+    stats = monitor.stats()
+    assert stats["operations"][0]["count"] == 2
+    assert stats["operations"][0]["slow"] == 1
+    assert stats["slow_queries"][0]["shape"] == '{"username": "?"}'
+    assert stats["slow_queries"][0]["plan"] == "FETCH <- IXSCAN"
+    assert "jane" not in " ".join(logger.warnings)
@@ -0,0 +1,41 @@
+import random
+from datetime import datetime, timedelta
+
+from src.db.seed import build_users
+from src.models.user import CurrentUserDetails, Role
+
+HASHES = ["hash.0", "hash.1", "hash.2"]
+
+
+def test_build_users_are_valid_and_unique():
+    now = datetime.utcnow()
+    documents = build_users(0, 5_000, "seed.", HASHES, now, 30, random.Random(0))
+
+    assert len({document["username"] for document in documents}) == 5_000
+    assert len({document["email"] for document in documents}) == 5_000
+    for document in documents[:200]:
+        details = CurrentUserDetails.parse_obj(document)
+        assert details.username.startswith("seed.")
+        assert details.email == document["email"]
+
+
+def test_build_users_spread():
+    now = datetime.utcnow()
+    documents = build_users(10, 5_010, "seed.", HASHES, now, 30, random.Random(0))
+
+    admins = sum(Role.ADMIN.value in document["roles"] for document in documents)
+    assert 0 < admins < 250
+    assert all(
+        now - timedelta(days=30) <= document["creation"] <= document["last_update"] <= now
+        for document in documents
+    )
+    # The password hashes are taken from the pool by index.
+    assert documents[0]["password"] == HASHES[10 % len(HASHES)]
+    assert documents[0]["username"].endswith(".10")
+
+
+def test_build_users_reproducible():
+    now = datetime.utcnow()
+    assert build_users(0, 100, "", HASHES, now, 30, random.Random(7)) == build_users(
+        0, 100, "", HASHES, now, 30, random.Random(7)
+    )
@@ -0,0 +1,26 @@
+from src.db.tracing import CommandTracer
+from src.services.tracing.implementations.processor import BatchSpanProcessor
+from src.services.tracing.implementations.tracer import Tracer
+from src.services.tracing.models.configuration import TracingConfig
+from tests.db.test_monitoring import run_command
+from tests.services.tracing.test_tracer import ListExporter, SilentLogger
+
+
+def test_command_spans():
+    """Test the commands of a traced request are its children, the others are ignored"""
+    exporter = ListExporter()
+    tracer = Tracer(
+        TracingConfig(), BatchSpanProcessor(exporter, SilentLogger(), 100, 10, 0.01)
+    )
+    command_tracer = CommandTracer(tracer)
+
+    run_command(command_tracer, 1, {"find": "users", "filter": {"username": "john"}}, 1)
+    with tracer.span("request") as request:
+        run_command(command_tracer, 2, {"find": "users", "filter": {"username": "john"}}, 1)
+    tracer.shutdown()
+
+    command, _ = exporter.spans
+    assert command.name == "mongo.find"
+    assert command.parent_id == request.span_id
+    assert command.attributes["db.mongodb.collection"] == "users"
+    assert command.attributes["db.statement"] == '{"username": "?"}'
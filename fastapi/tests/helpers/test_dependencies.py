@@ -0,0 +1,61 @@
+import pytest
+
+from src.core.settings import Settings, SettingsStore
+from src.helpers.container import CONTAINER
+from src.helpers.dependencies import provide, request_span
+from src.services.logger.interfaces.i_logger import ILogger
+from src.services.users.interfaces.i_user_repository import IUserRepository
+from tests import fastapi_app
+
+
+@pytest.mark.asyncio
+async def test_provide_singleton(monkeypatch):
+    """Test a singleton is resolved once, then kept by the dependency"""
+    assert provide(ILogger) is provide(ILogger)
+    dependency = provide(ILogger)
+    logger = await dependency()
+    assert logger is CONTAINER.get(ILogger)
+
+    def fail(interface):
+        raise AssertionError(f"{interface} resolved again")
+
+    monkeypatch.setattr(CONTAINER, "get", fail)
+    assert await dependency() is logger
+
+
+@pytest.mark.asyncio
+async def test_provide_not_singleton(monkeypatch):
+    """Test the other bindings are resolved on each call, the settings follow a reload"""
+    dependency = provide(Settings)
+    store = CONTAINER.get(SettingsStore)
+    before = await dependency()
+    assert before is store.current
+
+    monkeypatch.setattr(store, "current", store.current.copy())
+    assert await dependency() is store.current
+    assert await dependency() is not before
+
+
+@pytest.mark.asyncio
+async def test_provide_override(client):
+    """Test a binding can be replaced for the routes with the dependency overrides"""
+
+    class EmptyRepository:
+        # pylint: disable=missing-function-docstring
+        async def find_by_username(self, username, projection):
+            return None
+
+    fastapi_app.dependency_overrides[provide(IUserRepository)] = EmptyRepository
+    try:
+        response = await client.post(
+            "/auth/login", data={"username": "admin", "password": "admin"}
+        )
+    finally:
+        fastapi_app.dependency_overrides.clear()
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_request_span():
+    """Test there is no span outside of a request"""
+    assert await request_span() is None
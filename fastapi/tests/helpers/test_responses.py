@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import msgpack
+
+from src.helpers.responses import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    ROLE_CODES,
+    negotiated_response,
+    wants_msgpack,
+)
+from src.models.user import Role, UserPartialDetailsAdmin
+
+CREATION = datetime(2022, 8, 5, 17, 35)
+
+
+def test_wants_msgpack():
+    """Test MessagePack is returned only when preferred over JSON"""
+    assert wants_msgpack(MSGPACK_MEDIA_TYPE)
+    assert wants_msgpack("application/x-msgpack, application/json;q=0.5")
+    assert not wants_msgpack(None)
+    assert not wants_msgpack("*/*")
+    assert not wants_msgpack(f"{JSON_MEDIA_TYPE}, {MSGPACK_MEDIA_TYPE}")
+    assert not wants_msgpack(f"{MSGPACK_MEDIA_TYPE};q=0.1, */*")
+
+
+def test_msgpack_response():
+    """Test the MessagePack encoding of the user models"""
+    user = UserPartialDetailsAdmin(
+        username="admin",
+        email="admin@email.com",
+        roles=[Role.ADMIN],
+        creation=CREATION,
+        last_update=CREATION,
+    )
+
+    response = negotiated_response(MSGPACK_MEDIA_TYPE, 200, [user])
+
+    assert response.media_type == MSGPACK_MEDIA_TYPE
+    assert response.headers["vary"] == "Accept"
+    decoded = msgpack.unpackb(response.body, timestamp=3)
+    assert decoded == [
+        {
+            "username": "admin",
+            "email": "admin@email.com",
+            "roles": [ROLE_CODES[Role.ADMIN]],
+            "creation": CREATION.replace(tzinfo=timezone.utc),
+            "last_update": CREATION.replace(tzinfo=timezone.utc),
+        }
+    ]
+
+
+def test_json_response():
+    """Test JSON is the default encoding"""
+    response = negotiated_response(None, 200, {"message": "OK"})
+
+    assert response.media_type == JSON_MEDIA_TYPE
+    assert response.body == b'{"message":"OK"}'
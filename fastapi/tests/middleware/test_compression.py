@@ -0,0 +1,90 @@
+import gzip
+
+import pytest
+from httpx import AsyncClient
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from src.middleware.compression import CompressionConfig, CompressionMiddleware
+from tests import BASE_URL
+
+LARGE_BODY: str = "x" * 4096
+
+app = FastAPI()
+app.add_middleware(
+    CompressionMiddleware,
+    config=CompressionConfig(minimum_size=1024, excluded_paths=["/excluded"]),
+)
+
+
+@app.get("/large")
+async def large():
+    # pylint: disable=missing-function-docstring
+    return PlainTextResponse(LARGE_BODY)
+
+
+@app.get("/small")
+async def small():
+    # pylint: disable=missing-function-docstring
+    return JSONResponse({"message": "OK"})
+
+
+@app.get("/excluded")
+async def excluded():
+    # pylint: disable=missing-function-docstring
+    return PlainTextResponse(LARGE_BODY)
+
+
+@app.get("/binary")
+async def binary():
+    # pylint: disable=missing-function-docstring
+    return PlainTextResponse(LARGE_BODY, media_type="application/octet-stream")
+
+
+@app.get("/stream")
+async def stream():
+    # pylint: disable=missing-function-docstring
+    async def chunks():
+        for _ in range(4):
+            yield LARGE_BODY
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+@pytest.mark.asyncio
+async def test_gzip_compression():
+    """Test large bodies are compressed with gzip"""
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        response = await ac.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.text == LARGE_BODY
+
+
+@pytest.mark.asyncio
+async def test_brotli_compression():
+    """Test brotli is preferred when accepted"""
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        response = await ac.get("/large", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.text == LARGE_BODY
+
+
+@pytest.mark.asyncio
+async def test_compression_bypass():
+    """Test small, excluded and not matching bodies are not compressed"""
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        for path in ("/small", "/excluded", "/binary"):
+            response = await ac.get(path, headers={"Accept-Encoding": "gzip, br"})
+            assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_streaming_compression():
+    """Test streaming bodies are compressed chunk by chunk"""
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        async with ac.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            assert "content-length" not in response.headers
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    assert gzip.decompress(raw).decode() == LARGE_BODY * 4
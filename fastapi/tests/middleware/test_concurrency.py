@@ -0,0 +1,130 @@
+import asyncio
+from os import environ
+from os.path import join
+
+import pytest
+from httpx import AsyncClient
+from pydantic import ValidationError
+
+from fastapi import FastAPI
+from src.helpers.config import load_yaml_model
+from src.middleware.concurrency import (
+    SHED_MESSAGE,
+    AimdLimiter,
+    ConcurrencyConfig,
+    ConcurrencyLimitMiddleware,
+    RouteClassConfig,
+)
+from src.services.metrics.implementations.registry import MetricsRegistry
+from tests import BASE_URL
+
+AUTH = RouteClassConfig(
+    methods=["post"], paths=["/login"], target_latency=1, initial_limit=1, max_limit=4
+)
+READS = RouteClassConfig(target_latency=1, initial_limit=8, max_limit=16)
+
+registry = MetricsRegistry()
+release = asyncio.Event()
+app = FastAPI()
+app.add_middleware(
+    ConcurrencyLimitMiddleware,
+    metrics=registry,
+    config=ConcurrencyConfig(
+        retry_after=2, classes={"auth": AUTH, "reads": READS}, excluded_paths=["/health"]
+    ),
+)
+
+
+@app.post("/login")
+async def login():
+    # pylint: disable=missing-function-docstring
+    await release.wait()
+    return {"message": "OK"}
+
+
+@app.get("/health")
+async def health():
+    # pylint: disable=missing-function-docstring
+    await release.wait()
+    return {"message": "OK"}
+
+
+@app.get("/items")
+async def items():
+    # pylint: disable=missing-function-docstring
+    return []
+
+
+def test_config():
+    config = load_yaml_model(
+        ConcurrencyConfig, join(environ["CONFIGS_DIR"], "middleware", "concurrency.yaml")
+    )
+    assert list(config.classes) == ["auth", "writes", "reads"]
+    assert "/health/" in config.excluded_paths
+    with pytest.raises(ValidationError):
+        RouteClassConfig(target_latency=1, initial_limit=8, min_limit=16, max_limit=32)
+
+
+def test_limiter_backoff():
+    """Test a slow round decreases the limit once, down to the minimum"""
+    config = RouteClassConfig(target_latency=0.1, initial_limit=10, min_limit=5, max_limit=20)
+    limiter = AimdLimiter(config, backoff_ratio=0.5)
+    for _ in range(10):
+        assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+    # Started together, only the first slow request of the round counts.
+    limiter.release(0.0, 1.0)
+    limiter.release(0.0, 1.1)
+    assert limiter.limit == 5
+    assert limiter.in_flight == 8
+    # Started after the decrease, a new round.
+    limiter.release(1.0, 2.0)
+    assert limiter.limit == 5
+
+
+def test_limiter_increase():
+    """Test fast requests grow the limit in use, up to the maximum"""
+    config = RouteClassConfig(target_latency=0.1, initial_limit=2, max_limit=3)
+    limiter = AimdLimiter(config, backoff_ratio=0.5)
+    for _ in range(20):
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        limiter.release(0.0, 0.01)
+        limiter.release(0.0, 0.01)
+    assert limiter.limit == 3
+
+    # A limit mostly unused does not grow.
+    config = RouteClassConfig(target_latency=0.1, initial_limit=4, max_limit=8)
+    limiter = AimdLimiter(config, backoff_ratio=0.5)
+    for _ in range(20):
+        assert limiter.try_acquire()
+        limiter.release(0.0, 0.01)
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_shed_over_limit():
+    """Test a request over the limit of its class is rejected at once, the others pass"""
+    release.clear()
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        admitted = asyncio.create_task(ac.post("/login"))
+        excluded = asyncio.create_task(ac.get("/health"))
+        await asyncio.sleep(0.05)
+
+        rejected = await ac.post("/login")
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "2"
+        assert rejected.json() == {"detail": SHED_MESSAGE}
+        # Other classes and excluded paths have their own limits.
+        assert (await ac.get("/items")).status_code == 200
+
+        release.set()
+        assert (await admitted).status_code == 200
+        assert (await excluded).status_code == 200
+
+    lines = registry.render().splitlines()
+    assert 'http_requests_shed_total{route_class="auth"} 1' in lines
+    assert 'http_concurrency_in_flight{route_class="auth"} 0' in lines
+    # The admitted request used the whole limit and completed within the target.
+    assert 'http_concurrency_limit{route_class="auth"} 2' in lines
@@ -0,0 +1,37 @@
+import pytest
+from httpx import AsyncClient
+
+from fastapi import FastAPI
+from src.middleware.metrics import MetricsMiddleware
+from src.services.metrics.implementations.registry import MetricsRegistry
+from tests import BASE_URL
+
+registry = MetricsRegistry()
+app = FastAPI()
+app.add_middleware(MetricsMiddleware, metrics=registry)
+
+
+@app.get("/items/{item_id}")
+async def item(item_id: int):
+    # pylint: disable=missing-function-docstring
+    return {"item_id": item_id}
+
+
+@pytest.mark.asyncio
+async def test_route_templates():
+    """Test requests are labelled with the route template and status"""
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        await ac.get("/items/1")
+        await ac.get("/items/2")
+        await ac.get("/missing")
+
+    lines = registry.render().splitlines()
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2'
+        in lines
+    )
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="<unmatched>",status="404"} 1'
+        in lines
+    )
+    assert 'http_requests_in_flight{method="GET"} 0' in lines
@@ -0,0 +1,82 @@
+import marshal
+from typing import Callable
+
+import pytest
+from httpx import AsyncClient
+
+from fastapi import FastAPI
+from src.core.auth import is_admin_token
+from src.middleware.profiling import (
+    PROFILE_ID_HEADER,
+    ProfileStore,
+    ProfilingConfig,
+    ProfilingMiddleware,
+)
+from tests import BASE_URL
+
+
+def build_app(
+    config: ProfilingConfig,
+    store: ProfileStore,
+    authorize: Callable[[str], bool] = lambda token: token == "admin-token",
+) -> FastAPI:
+    """Application whose only admin token is 'admin-token', unless told otherwise"""
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, config=config, store=store, authorize=authorize)
+
+    @app.get("/")
+    async def root():
+        # pylint: disable=missing-function-docstring
+        return {"message": "OK"}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_admin_header():
+    """Test only the admins can ask for a profile"""
+    store = ProfileStore(10)
+    app = build_app(ProfilingConfig(), store)
+
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        response = await ac.get("/", headers={"X-Profile": "1"})
+        assert PROFILE_ID_HEADER not in response.headers
+        response = await ac.get(
+            "/", headers={"X-Profile": "1", "Authorization": "Bearer admin-token"}
+        )
+
+    profiles = store.profiles()
+    assert [profile.profile_id for profile in profiles] == [response.headers[PROFILE_ID_HEADER]]
+    assert profiles[0].path == "/"
+    assert profiles[0].status_code == 200
+    if profiles[0].media_type != "text/html":
+        assert isinstance(marshal.loads(profiles[0].content), dict)
+
+
+@pytest.mark.asyncio
+async def test_sampling_ring_buffer():
+    """Test sampled profiles are kept in a bounded buffer"""
+    store = ProfileStore(2)
+    app = build_app(ProfilingConfig(sample_rate=1.0), store)
+
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        ids = [(await ac.get("/")).headers[PROFILE_ID_HEADER] for _ in range(3)]
+
+    assert [profile.profile_id for profile in store.profiles()] == ids[:0:-1]
+    assert store.get(ids[0]) is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_token():
+    """Test an invalid token asking for a profile is served without profiling"""
+    store = ProfileStore(10)
+    app = build_app(ProfilingConfig(), store, authorize=is_admin_token)
+
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        response = await ac.get(
+            "/", headers={"X-Profile": "1", "Authorization": "Bearer not-a-token"}
+        )
+
+    assert response.status_code == 200
+    assert PROFILE_ID_HEADER not in response.headers
+    assert not store.profiles()
@@ -0,0 +1,33 @@
+import pytest
+from httpx import AsyncClient
+
+from fastapi import FastAPI
+from src.core.context import REQUEST_ID
+from src.middleware.request_id import REQUEST_ID_HEADER, RequestIdMiddleware
+from tests import BASE_URL
+
+app = FastAPI()
+app.add_middleware(RequestIdMiddleware)
+
+
+@app.get("/")
+async def root():
+    # pylint: disable=missing-function-docstring
+    return {"request_id": REQUEST_ID.get()}
+
+
+@pytest.mark.asyncio
+async def test_generated_request_id():
+    """Test a request id is generated and returned"""
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        response = await ac.get("/")
+    assert response.json()["request_id"] == response.headers[REQUEST_ID_HEADER]
+
+
+@pytest.mark.asyncio
+async def test_propagated_request_id():
+    """Test the incoming request id is kept"""
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        response = await ac.get("/", headers={REQUEST_ID_HEADER: "incoming-id"})
+    assert response.json()["request_id"] == "incoming-id"
+    assert response.headers[REQUEST_ID_HEADER] == "incoming-id"
@@ -0,0 +1,41 @@
+import pytest
+from httpx import AsyncClient
+
+from fastapi import FastAPI
+from src.middleware.tracing import TracingMiddleware
+from src.services.tracing.implementations.processor import BatchSpanProcessor
+from src.services.tracing.implementations.tracer import Tracer
+from src.services.tracing.models.configuration import TracingConfig
+from tests import BASE_URL
+from tests.services.tracing.test_tracer import ListExporter, SilentLogger
+
+
+@pytest.mark.asyncio
+async def test_request_span():
+    """Test each request gets a root span named after its route, with its children"""
+    exporter = ListExporter()
+    tracer = Tracer(
+        TracingConfig(), BatchSpanProcessor(exporter, SilentLogger(), 100, 10, 0.01)
+    )
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        # pylint: disable=missing-function-docstring
+        with tracer.span("lookup"):
+            return {"item_id": item_id}
+
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
+        await ac.get("/items/1", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+        await ac.get("/missing")
+    tracer.shutdown()
+
+    lookup, request, missing = exporter.spans
+    assert request.name == "GET /items/{item_id}"
+    assert request.trace_id == trace_id
+    assert request.attributes["http.status_code"] == 200
+    assert lookup.parent_id == request.span_id
+    assert missing.name == "GET <unmatched>"
+    assert missing.trace_id != trace_id
@@ -0,0 +1,45 @@
+import pytest
+from pydantic import EmailStr, ValidationError
+
+from src.models.user import BaseUser, BaseUsername, BaseUserRoles, FastEmailStr
+
+EMAILS = [
+    "user@email.com",
+    "First.Last+tag@Email.COM",
+    "user@sub-domain.example.org",
+    "Pretty Name <user@email.com>",
+    "ünicode@email.com",
+    "a@xn--bcher-kva.ch",
+    "a@mail.XN--bcher-kva.ch",
+]
+INVALID_EMAILS = ["user@email.test", "us..er@email.com", "user@localhost", "user@-email.com", ""]
+
+
+@pytest.mark.parametrize("email", EMAILS)
+def test_email_fast_path(email: str):
+    """Test the fast email validation returns the same normalized email of EmailStr"""
+    assert FastEmailStr.validate(email) == EmailStr.validate(email)
+
+
+@pytest.mark.parametrize("email", INVALID_EMAILS)
+def test_invalid_email(email: str):
+    """Test invalid emails are still rejected"""
+    with pytest.raises(ValidationError) as e:
+        BaseUser(username="user", email=email)
+    assert e.value.errors()[0]["msg"] == (
+        "The email validation was not succesful, the email may be invalid."
+    )
+
+
+def test_username_validation():
+    """Test username validation"""
+    assert BaseUsername(username="user.name_1").username == "user.name_1"
+    for username in ("", "User", "user name", "user\n", "usér"):
+        with pytest.raises(ValidationError):
+            BaseUsername(username=username)
+
+
+def test_roles_validation():
+    """Test at least a role is required"""
+    with pytest.raises(ValidationError):
+        BaseUserRoles(roles=[])
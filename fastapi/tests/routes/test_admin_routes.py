@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_reload_settings(client, admin_tokens, user_tokens):
+    """Test the settings reload, the tokens signed before stay valid with the same secret"""
+    response = await client.post(
+        "/admin/settings/reload",
+        headers={"Authorization": f"Bearer {user_tokens.access_token}"},
+    )
+    assert response.status_code == 403
+
+    response = await client.post(
+        "/admin/settings/reload",
+        headers={"Authorization": f"Bearer {admin_tokens.access_token}"},
+    )
+    assert response.status_code == 200
+    response = await client.get(
+        "/user/me", headers={"Authorization": f"Bearer {admin_tokens.access_token}"}
+    )
+    assert response.status_code == 200
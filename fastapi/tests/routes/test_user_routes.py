@@ -3,166 +3,129 @@ from json import JSONDecodeError
 from typing import List
 
 import pytest
-from httpx import AsyncClient
 from pydantic import parse_raw_as
 
-from src.db.collections.user import User
 from src.models.user import (
+    BaseUsername,
     CurrentUserDetails,
     UserPartialDetails,
     UserPartialDetailsAdmin,
 )
-from tests import (
-    BASE_URL,
-    IS_TYPED,
-    admin_login,
-    build_db_client,
-    fastapi_app,
-    user_login,
-)
+from src.services.users.models.user_record import UserRecord
+from tests import IS_TYPED
 
 
 @pytest.mark.asyncio
-async def test_register():
+@pytest.mark.usefixtures("restore_users")
+async def test_register(client):
     """Test user registration"""
 
-    # DB connection.
-    await build_db_client()
-
     # Endpoint test
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register",
-            json={
-                "username": "new_test_user",
-                "email": "new_test_user@email.com",
-                "password": "new_test_user",
-            },
-        )
+    response = await client.post(
+        "/user/register",
+        json={
+            "username": "new_test_user",
+            "email": "new_test_user@email.com",
+            "password": "new_test_user",
+        },
+    )
     assert response.status_code == 201
 
-    # Clearing environement.
-    await User.find_one(User.username == "new_test_user").delete()
-
 
 @pytest.mark.asyncio
-async def test_register_duplicate_email():
+@pytest.mark.usefixtures("restore_users")
+async def test_register_duplicate_email(client, repository):
     """Test user registration with duplicate email"""
 
-    # DB connection.
-    await build_db_client()
-
     # Add values to test the db.
     now_date = datetime.utcnow()
-    await User(
-        email="new_test_user@email.com",
-        username="new_test_user",
-        password="new_test_user",
-        roles=["user"],
-        creation=now_date,
-        last_update=now_date,
-    ).save()
+    await repository.insert(
+        UserRecord(
+            email="new_test_user@email.com",
+            username="new_test_user",
+            password="new_test_user",
+            roles=["user"],
+            creation=now_date,
+            last_update=now_date,
+        )
+    )
 
     # Endpoint test
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register",
-            json={
-                "username": "different_username",
-                "email": "new_test_user@email.com",
-                "password": "new_test_user",
-            },
-        )
+    response = await client.post(
+        "/user/register",
+        json={
+            "username": "different_username",
+            "email": "new_test_user@email.com",
+            "password": "new_test_user",
+        },
+    )
     assert response.status_code == 409
 
-    # Clearing environement.
-    await User.find_one(User.username == "new_test_user").delete()
-
 
 @pytest.mark.asyncio
-async def test_register_duplicate_username():
+@pytest.mark.usefixtures("restore_users")
+async def test_register_duplicate_username(client, repository):
     """Test user registration with duplicate username"""
 
-    # DB connection.
-    await build_db_client()
-
     # Add values to test the db.
     now_date = datetime.utcnow()
-    await User(
-        email="new_test_user@email.com",
-        username="new_test_user",
-        password="new_test_user",
-        roles=["user"],
-        creation=now_date,
-        last_update=now_date,
-    ).save()
+    await repository.insert(
+        UserRecord(
+            email="new_test_user@email.com",
+            username="new_test_user",
+            password="new_test_user",
+            roles=["user"],
+            creation=now_date,
+            last_update=now_date,
+        )
+    )
 
     # Endpoint test
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register",
-            json={
-                "username": "new_test_user",
-                "email": "different@email.com",
-                "password": "new_test_user",
-            },
-        )
+    response = await client.post(
+        "/user/register",
+        json={
+            "username": "new_test_user",
+            "email": "different@email.com",
+            "password": "new_test_user",
+        },
+    )
     assert response.status_code == 409
 
-    # Clearing environement.
-    await User.find_one(User.username == "new_test_user").delete()
-
 
 @pytest.mark.asyncio
-async def test_register_admin():
+@pytest.mark.usefixtures("restore_users")
+async def test_register_admin(client, admin_tokens):
     """Test admin registration"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register-roles",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "new_test_user_admin",
-                "email": "new_test_user_admin@email.com",
-                "password": "new_test_user_admin",
-                "roles": ["admin", "user"],
-            },
-        )
+    response = await client.post(
+        "/user/register-roles",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+        json={
+            "username": "new_test_user_admin",
+            "email": "new_test_user_admin@email.com",
+            "password": "new_test_user_admin",
+            "roles": ["admin", "user"],
+        },
+    )
     assert response.status_code == 201
 
-    # Clearing environement.
-    await User.find_one(User.username == "new_test_user_admin").delete()
-
 
 @pytest.mark.asyncio
-async def test_register_admin_wrong_roles():
+async def test_register_admin_wrong_roles(client, admin_tokens):
     """Test admin registration with bad roles"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register-roles",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "missing_role_user",
-                "email": "missing_role_user@email.com",
-                "password": "missing_role_user",
-                "roles": ["admina"],
-            },
-        )
+    response = await client.post(
+        "/user/register-roles",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+        json={
+            "username": "missing_role_user",
+            "email": "missing_role_user@email.com",
+            "password": "missing_role_user",
+            "roles": ["admina"],
+        },
+    )
     assert response.status_code == 422
 
     # Clearing environement.
@@ -170,26 +133,19 @@ async def test_register_admin_wrong_roles():
 
 
 @pytest.mark.asyncio
-async def test_register_admin_missing_roles():
+async def test_register_admin_missing_roles(client, admin_tokens):
     """Test admin registration with missing roles"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register-roles",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "missing_role_user",
-                "email": "missing_role_user@email.com",
-                "password": "missing_role_user",
-            },
-        )
+    response = await client.post(
+        "/user/register-roles",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+        json={
+            "username": "missing_role_user",
+            "email": "missing_role_user@email.com",
+            "password": "missing_role_user",
+        },
+    )
     assert response.status_code == 422
 
     # Clearing environement.
@@ -197,120 +153,92 @@ async def test_register_admin_missing_roles():
 
 
 @pytest.mark.asyncio
-async def test_register_admin_duplicate_email():
+@pytest.mark.usefixtures("restore_users")
+async def test_register_admin_duplicate_email(client, admin_tokens, repository):
     """Test admin registration with duplicate email"""
 
-    # DB connection.
-    await build_db_client()
-
     # Add values to test the db.
     now_date = datetime.utcnow()
-    await User(
-        email="new_test_user_admin@email.com",
-        username="new_test_user_admin",
-        password="new_test_user",
-        roles=["user"],
-        creation=now_date,
-        last_update=now_date,
-    ).save()
-
-    # Execute login.
-    login_response = await admin_login()
+    await repository.insert(
+        UserRecord(
+            email="new_test_user_admin@email.com",
+            username="new_test_user_admin",
+            password="new_test_user",
+            roles=["user"],
+            creation=now_date,
+            last_update=now_date,
+        )
+    )
 
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register-roles",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "duplicate_test_user_admin",
-                "email": "new_test_user_admin@email.com",
-                "password": "new_test_user_admin",
-                "roles": ["admin", "user"],
-            },
-        )
+    response = await client.post(
+        "/user/register-roles",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+        json={
+            "username": "duplicate_test_user_admin",
+            "email": "new_test_user_admin@email.com",
+            "password": "new_test_user_admin",
+            "roles": ["admin", "user"],
+        },
+    )
     assert response.status_code == 409
 
-    # Clearing environement.
-    await User.find_one(User.username == "new_test_user_admin").delete()
-
 
 @pytest.mark.asyncio
-async def test_register_admin_duplicate_username():
+@pytest.mark.usefixtures("restore_users")
+async def test_register_admin_duplicate_username(client, admin_tokens, repository):
     """Test admin registration with duplicate username"""
 
-    # DB connection.
-    await build_db_client()
-
     # Add values to test the db.
     now_date = datetime.utcnow()
-    await User(
-        email="new_test_user_admin@email.com",
-        username="new_test_user_admin",
-        password="new_test_user",
-        roles=["user"],
-        creation=now_date,
-        last_update=now_date,
-    ).save()
-
-    # Execute login.
-    login_response = await admin_login()
+    await repository.insert(
+        UserRecord(
+            email="new_test_user_admin@email.com",
+            username="new_test_user_admin",
+            password="new_test_user",
+            roles=["user"],
+            creation=now_date,
+            last_update=now_date,
+        )
+    )
 
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            "/user/register-roles",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "new_test_user_admin",
-                "email": "duplicate_test_user_admin@email.com",
-                "password": "new_test_user_admin",
-                "roles": ["admin", "user"],
-            },
-        )
+    response = await client.post(
+        "/user/register-roles",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+        json={
+            "username": "new_test_user_admin",
+            "email": "duplicate_test_user_admin@email.com",
+            "password": "new_test_user_admin",
+            "roles": ["admin", "user"],
+        },
+    )
     assert response.status_code == 409
 
-    # Clearing environement.
-    await User.find_one(User.username == "new_test_user_admin").delete()
-
 
 @pytest.mark.asyncio
-async def test_get_all_users():
+async def test_get_all_users(client, user_tokens):
     """Test get all users db call."""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            "/user/all",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.get(
+        "/user/all",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
     assert IS_TYPED(parse_raw_as(List[UserPartialDetails], response.text), List[UserPartialDetails])
 
 
 @pytest.mark.asyncio
-async def test_get_all_user_as_admin():
+async def test_get_all_user_as_admin(client, admin_tokens):
     """Test get all user from adim user, should expect more details"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            "/user/all",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.get(
+        "/user/all",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
     assert IS_TYPED(
@@ -320,44 +248,30 @@ async def test_get_all_user_as_admin():
 
 
 @pytest.mark.asyncio
-async def test_get_users_count():
+async def test_get_users_count(client, admin_tokens):
     """Test get user count"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            "/user/count",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.get(
+        "/user/count",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
 
 
 @pytest.mark.asyncio
-async def test_get_user_by_id_username():
+async def test_get_user_by_id_username(client, user_tokens):
     """Test get user by id username"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
     # Username
     username = "admin"
 
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            f"/user/username/{username}",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.get(
+        f"/user/username/{username}",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
 
@@ -366,24 +280,17 @@ async def test_get_user_by_id_username():
 
 
 @pytest.mark.asyncio
-async def test_get_user_by_id_username_as_admin():
+async def test_get_user_by_id_username_as_admin(client, admin_tokens):
     """Test get user by id username as admin"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Username
     username = "admin"
 
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            f"/user/username/{username}",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.get(
+        f"/user/username/{username}",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
 
@@ -392,21 +299,14 @@ async def test_get_user_by_id_username_as_admin():
 
 
 @pytest.mark.asyncio
-async def test_get_current_user():
+async def test_get_current_user(client, user_tokens):
     """Test get current user"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            "/user/me",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.get(
+        "/user/me",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
 
@@ -420,274 +320,183 @@ async def test_get_current_user():
 
 
 @pytest.mark.asyncio
-async def test_update_user():
+@pytest.mark.usefixtures("restore_users")
+async def test_update_user(client, user_tokens, repository):
     """Test update user"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.put(
-            "/user/username/user",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "user1",
-                "email": "user@email.com",
-                "roles": ["user"],
-            },
-        )
+    response = await client.put(
+        "/user/username/user",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+        json={
+            "username": "user1",
+            "email": "user@email.com",
+            "roles": ["user"],
+        },
+    )
 
     assert response.status_code == 200
 
-    # Check and reset DB content to original state.
-    user_check = await User.find_one(User.username == "user1")
-    assert user_check.username == "user1"
-    user_check.username = "user"
-    await user_check.save()
+    # The changes are reverted by the restore_users fixture.
+    assert await repository.find_by_username("user1", BaseUsername) is not None
 
 
 @pytest.mark.asyncio
-async def test_update_user_bad_user():
+async def test_update_user_bad_user(client, user_tokens):
     """Test update user with bad user informations"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.put(
-            "/user/username/admin",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "admin1",
-                "email": "admin@email.com",
-                "roles": ["admin", "user"],
-            },
-        )
+    response = await client.put(
+        "/user/username/admin",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+        json={
+            "username": "admin1",
+            "email": "admin@email.com",
+            "roles": ["admin", "user"],
+        },
+    )
 
     assert response.status_code == 403
 
 
 @pytest.mark.asyncio
-async def test_update_user_bad_roles():
+async def test_update_user_bad_roles(client, user_tokens):
     """Test udpate user with bad roles"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.put(
-            "/user/username/admin",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "user",
-                "email": "user@email.com",
-                "roles": ["admin", "user"],
-            },
-        )
+    response = await client.put(
+        "/user/username/admin",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+        json={
+            "username": "user",
+            "email": "user@email.com",
+            "roles": ["admin", "user"],
+        },
+    )
 
     assert response.status_code == 403
 
 
 @pytest.mark.asyncio
-async def test_update_user_admin():
+@pytest.mark.usefixtures("restore_users")
+async def test_update_user_admin(client, admin_tokens, repository):
     """Test udpate user admin"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.put(
-            "/user/username/user",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "user1",
-                "email": "user@email.com",
-                "roles": ["user"],
-            },
-        )
+    response = await client.put(
+        "/user/username/user",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+        json={
+            "username": "user1",
+            "email": "user@email.com",
+            "roles": ["user"],
+        },
+    )
 
     assert response.status_code == 200
 
-    # Check and reset DB content to original state.
-    user_check = await User.find_one(User.username == "user1")
-    assert user_check.username == "user1"
-    user_check.username = "user"
-    await user_check.save()
+    # The changes are reverted by the restore_users fixture.
+    assert await repository.find_by_username("user1", BaseUsername) is not None
 
 
 @pytest.mark.asyncio
-async def test_update_user_admin_missing():
+async def test_update_user_admin_missing(client, admin_tokens):
     """Test update user admin whose user not presetn"""
     # Try to update an user that does not exists.
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.put(
-            "/user/username/missing",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "user1",
-                "email": "user@email.com",
-                "roles": ["user"],
-            },
-        )
+    response = await client.put(
+        "/user/username/missing",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+        json={
+            "username": "user1",
+            "email": "user@email.com",
+            "roles": ["user"],
+        },
+    )
 
     assert response.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_update_user_duplicate_uername_or_email():
+async def test_update_user_duplicate_uername_or_email(client, user_tokens):
     """Test update user duplicate using already existing username or email"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.put(
-            "/user/username/missing",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-            json={
-                "username": "admin",
-                "email": "user@email.com",
-                "roles": ["user"],
-            },
-        )
+    response = await client.put(
+        "/user/username/missing",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+        json={
+            "username": "admin",
+            "email": "user@email.com",
+            "roles": ["user"],
+        },
+    )
 
     assert response.status_code == 403
 
 
 @pytest.mark.asyncio
-async def test_delete_user():
+@pytest.mark.usefixtures("restore_users")
+async def test_delete_user(client, user_tokens):
     """Test user deletion"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
-    # Store user to delete to then add it later after test completion.
-    temp_user = await User.find_one(User.username == "user")
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.delete(
-            "/user/username/user",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.delete(
+        "/user/username/user",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
 
-    # Check and reset DB content to original state.
-    await temp_user.create()
-
 
 @pytest.mark.asyncio
-async def test_delte_user_bad_user():
+async def test_delte_user_bad_user(client, user_tokens):
     """Test bad user deletion"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await user_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.delete(
-            "/user/username/admin",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.delete(
+        "/user/username/admin",
+        headers={"Authorization": f"{user_tokens.token_type} {user_tokens.access_token}"},
+    )
 
     assert response.status_code == 403
 
 
 @pytest.mark.asyncio
-async def test_delete_user_admin():
+@pytest.mark.usefixtures("restore_users")
+async def test_delete_user_admin(client, admin_tokens):
     """Test delete user admin"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
-    # Store user to delete to then add it later after test completion.
-    temp_user = await User.find_one(User.username == "user")
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.delete(
-            "/user/username/user",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.delete(
+        "/user/username/user",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+    )
 
     assert response.status_code == 200
 
-    # Check and reset DB content to original state.
-    await temp_user.save()
-
 
 @pytest.mark.asyncio
-async def test_delete_user_admin_missing():
+async def test_delete_user_admin_missing(client, admin_tokens):
     """Test deleting admin user whose does not exists"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.delete(
-            "/user/username/missing",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.delete(
+        "/user/username/missing",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+    )
 
     assert response.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_delete_last_admin():
+async def test_delete_last_admin(client, admin_tokens):
     """Test deleting last admin, should result in failure"""
 
-    # DB connection.
-    await build_db_client()
-
-    # Execute login.
-    login_response = await admin_login()
-
     # Endpoint test.
-    async with AsyncClient(app=fastapi_app, base_url=BASE_URL) as ac:
-        response = await ac.delete(
-            "/user/username/admin",
-            headers={"Authorization": f"{login_response.token_type} {login_response.access_token}"},
-        )
+    response = await client.delete(
+        "/user/username/admin",
+        headers={"Authorization": f"{admin_tokens.token_type} {admin_tokens.access_token}"},
+    )
 
     assert response.status_code == 406
@@ -0,0 +1,34 @@
+import logging
+
+from src.services.logger.implementations.file_handler import BatchTimedRotatingFileHandler
+
+
+class FailingStream:
+    """Stream failing as a full disk would"""
+
+    # pylint: disable=missing-function-docstring
+    def write(self, _):
+        raise OSError("No space left on device")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_write_error_handled(tmp_path):
+    """Test a failing write is reported to handleError instead of being raised"""
+    handled = []
+    handler = BatchTimedRotatingFileHandler(str(tmp_path / "app.log"), when="midnight")
+    handler.stream.close()
+    handler.stream = FailingStream()
+    handler.handleError = handled.append
+
+    records = [
+        logging.LogRecord("test", logging.INFO, __file__, 0, f"record {i}", None, None)
+        for i in range(3)
+    ]
+    handler.handle_batch(records)
+
+    assert handled == [records[-1]]
@@ -0,0 +1,91 @@
+import json
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.context import REQUEST_ID
+from src.services.logger.enums.level import LogLevel
+from src.services.logger.implementations.logger import TimedLogger
+
+CONFIG = """
+bound_test:
+  format: '%(levelname)s - %(message)s'
+  level: INFO
+  filename: bound_test.log
+  when: 'D'
+"""
+
+JSON_CONFIG = """
+json_test:
+  formatter: json
+  level: INFO
+  filename: json_test.log
+  when: 'D'
+  batch_size: 4
+"""
+
+
+def test_bound_logger(tmp_path):
+    """Test bound loggers are cached and level gated"""
+    config_file = tmp_path / "log.yaml"
+    config_file.write_text(CONFIG)
+    timed_logger = TimedLogger(config_file_path=str(config_file))
+
+    bound_logger = timed_logger.get("bound_test")
+
+    assert bound_logger is timed_logger.get("bound_test")
+    assert bound_logger.is_enabled_for(LogLevel.INFO)
+    assert not bound_logger.is_enabled_for(LogLevel.DEBUG)
+    timed_logger.shutdown()
+
+
+def test_json_output(tmp_path, monkeypatch):
+    """Test records are written as JSON lines with the request id"""
+    monkeypatch.setenv("LOGGING_DIR", str(tmp_path))
+    config_file = tmp_path / "log.yaml"
+    config_file.write_text(JSON_CONFIG)
+    timed_logger = TimedLogger(config_file_path=str(config_file))
+
+    token = REQUEST_ID.set("test-request-id")
+    try:
+        for i in range(10):
+            timed_logger.get("json_test").info("Record %s", i)
+    finally:
+        REQUEST_ID.reset(token)
+    timed_logger.shutdown()
+
+    lines = (tmp_path / "json_test.log").read_text().splitlines()
+    entries = [json.loads(line) for line in lines]
+    assert [entry["message"] for entry in entries] == [f"Record {i}" for i in range(10)]
+    assert {entry["request_id"] for entry in entries} == {"test-request-id"}
+
+
+def test_set_level_and_reload(tmp_path, monkeypatch):
+    """Test levels change at runtime and a reload swaps handlers without losing records"""
+    monkeypatch.setenv("LOGGING_DIR", str(tmp_path))
+    config_file = tmp_path / "log.yaml"
+    config_file.write_text(JSON_CONFIG)
+    timed_logger = TimedLogger(config_file_path=str(config_file))
+
+    timed_logger.set_level("json_test", LogLevel.DEBUG)
+    assert timed_logger.levels()["json_test"] == LogLevel.DEBUG
+    timed_logger.get("json_test").debug("Record 0")
+
+    timed_logger.reload()
+    assert timed_logger.levels()["json_test"] == LogLevel.INFO
+    assert len(logging.getLogger("json_test").handlers) == 1
+    timed_logger.get("json_test").debug("Dropped")
+    timed_logger.get("json_test").info("Record 1")
+
+    # A broken file leaves the live configuration untouched.
+    config_file.write_text("json_test:\n  level: LOUD\n")
+    with pytest.raises(ValidationError):
+        timed_logger.reload()
+    with pytest.raises(KeyError):
+        timed_logger.set_level("missing", LogLevel.DEBUG)
+    timed_logger.get("json_test").info("Record 2")
+    timed_logger.shutdown()
+
+    lines = (tmp_path / "json_test.log").read_text().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [f"Record {i}" for i in range(3)]
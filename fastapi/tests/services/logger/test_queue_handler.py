@@ -0,0 +1,57 @@
+import logging
+from queue import Queue
+
+from src.services.logger.enums.overflow import OverflowPolicy
+from src.services.logger.implementations.queue_handler import (
+    BackgroundListener,
+    BoundedQueueHandler,
+)
+
+
+def make_record(level: int, msg: str) -> logging.LogRecord:
+    """Build a record for the tests logger"""
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+def test_drop_oldest():
+    """Test the oldest record is dropped when the queue is full"""
+    queue: Queue = Queue(maxsize=1)
+    handler = BoundedQueueHandler(queue, OverflowPolicy.DROP_OLDEST)
+
+    handler.handle(make_record(logging.INFO, "first"))
+    handler.handle(make_record(logging.INFO, "second"))
+
+    assert handler.dropped == 1
+    assert queue.get_nowait().msg == "second"
+
+
+def test_drop_debug():
+    """Test debug records are dropped when the queue is full"""
+    queue: Queue = Queue(maxsize=1)
+    handler = BoundedQueueHandler(queue, OverflowPolicy.DROP_DEBUG)
+
+    handler.handle(make_record(logging.INFO, "first"))
+    handler.handle(make_record(logging.DEBUG, "debug"))
+
+    assert handler.dropped == 1
+    assert queue.get_nowait().msg == "first"
+
+
+def test_flush_on_stop():
+    """Test queued records are written when the listener is stopped"""
+    written = []
+
+    class ListHandler(logging.Handler):
+        # pylint: disable=missing-class-docstring
+        def emit(self, record):
+            written.append(record.getMessage())
+
+    queue: Queue = Queue(maxsize=10)
+    handler = BoundedQueueHandler(queue)
+    listener = BackgroundListener(queue, ListHandler())
+    for i in range(10):
+        handler.handle(make_record(logging.INFO, f"record {i}"))
+    listener.start()
+    listener.stop()
+
+    assert written == [f"record {i}" for i in range(10)]
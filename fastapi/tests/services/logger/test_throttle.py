@@ -0,0 +1,70 @@
+import logging
+from time import sleep
+
+from src.services.logger.implementations.throttle import ThrottleFilter
+from src.services.logger.models.configuration import ThrottleConfig
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_record(msg: str, *args, level: int = logging.WARNING) -> logging.LogRecord:
+    """Build a record for the tests logger"""
+    return logging.LogRecord("test", level, __file__, 0, msg, args, None)
+
+
+def test_rate_limit_and_summary():
+    """Test the token bucket drops the exceeding records and a summary replaces them"""
+    clock = FakeClock()
+    summaries = []
+    throttle = ThrottleFilter(
+        ThrottleConfig(rate=1, burst=2, summary_interval=10), summaries.append, clock
+    )
+
+    kept = [throttle.filter(make_record("Wrong password for %s.", i)) for i in range(5)]
+    assert kept == [True, True, False, False, False]
+
+    # A different template has its own bucket, critical records are never throttled.
+    assert throttle.filter(make_record("user not found"))
+    assert throttle.filter(make_record("Wrong password for %s.", 0, level=logging.CRITICAL))
+
+    clock.now = 10
+    assert throttle.filter(make_record("Wrong password for %s.", 5))
+    assert len(summaries) == 1
+    assert summaries[0].getMessage() == "3 similar messages suppressed: Wrong password for %s."
+
+
+def test_sampling():
+    """Test one record every period is kept, starting from the first one"""
+    throttle = ThrottleFilter(ThrottleConfig(sample_rate=0.25), lambda _: None, FakeClock())
+
+    kept = [throttle.filter(make_record("sampled")) for _ in range(8)]
+    assert kept == [True, False, False, False, True, False, False, False]
+
+
+def test_summary_timer():
+    """Test the summary is emitted on time even when no other record is logged"""
+    summaries = []
+    throttle = ThrottleFilter(
+        ThrottleConfig(rate=1, burst=1, summary_interval=0.05), summaries.append
+    )
+    throttle.start()
+    try:
+        assert [throttle.filter(make_record("quiet")) for _ in range(3)] == [True, False, False]
+        for _ in range(100):
+            if summaries:
+                break
+            sleep(0.01)
+    finally:
+        throttle.stop()
+
+    assert [summary.getMessage() for summary in summaries] == [
+        "2 similar messages suppressed: quiet"
+    ]
@@ -0,0 +1,55 @@
+from threading import Thread
+
+import pytest
+
+from src.services.metrics.implementations.registry import MetricsRegistry
+
+
+def test_render_histogram():
+    """Test histograms are rendered with cumulative buckets, count and sum"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), (0.1, 1.0))
+
+    for value in (0.05, 0.5, 5.0):
+        histogram.labels("/").observe(value)
+
+    lines = registry.render().splitlines()
+    assert lines == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/",le="0.1"} 1',
+        'latency_seconds_bucket{route="/",le="1"} 2',
+        'latency_seconds_bucket{route="/",le="+Inf"} 3',
+        'latency_seconds_count{route="/"} 3',
+        'latency_seconds_sum{route="/"} 5.55',
+    ]
+
+
+def test_counters_summed_over_threads():
+    """Test the per-thread values are summed when rendering"""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests.").labels()
+
+    def work():
+        for _ in range(1000):
+            counter.inc()
+
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert "requests_total 4000" in registry.render().splitlines()
+
+
+def test_register_twice():
+    """Test a name returns the same family, unless registered differently"""
+    registry = MetricsRegistry()
+    gauge = registry.gauge("in_flight", "In flight.", ("method",))
+
+    assert registry.gauge("in_flight", "In flight.", ("method",)) is gauge
+    with pytest.raises(ValueError):
+        registry.counter("in_flight", "In flight.")
+    with pytest.raises(ValueError):
+        gauge.labels("GET", "extra")
@@ -0,0 +1,144 @@
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+
+from src.services.tracing.enums.span_kind import SpanKind
+from src.services.tracing.implementations.exporters import (
+    JsonLinesSpanExporter,
+    OtlpHttpSpanExporter,
+)
+from src.services.tracing.implementations.processor import BatchSpanProcessor
+from src.services.tracing.implementations.tracer import Tracer
+from src.services.tracing.models.configuration import TracingConfig
+
+
+class SilentLogger:
+    """Bound logger discarding everything"""
+
+    def warning(self, *_) -> None:
+        # pylint: disable=missing-function-docstring
+        pass
+
+
+class ListExporter:
+    """Exporter keeping the spans in memory"""
+
+    # pylint: disable=missing-function-docstring
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def shutdown(self):
+        pass
+
+
+def build_tracer(exporter, sample_rate: float = 1.0) -> Tracer:
+    """Tracer exporting to the given exporter"""
+    processor = BatchSpanProcessor(exporter, SilentLogger(), 100, 10, 0.01)
+    return Tracer(TracingConfig(sample_rate=sample_rate), processor)
+
+
+def test_span_tree():
+    """Test the children share the trace of the current span and failures are recorded"""
+    exporter = ListExporter()
+    tracer = build_tracer(exporter)
+
+    with tracer.span("request", kind=SpanKind.SERVER) as root:
+        with tracer.span("child", {"key": "value"}):
+            assert tracer.current_span().parent_id == root.span_id
+        with pytest.raises(ValueError):
+            with tracer.span("failing"):
+                raise ValueError("broken")
+    assert tracer.current_span() is None
+    tracer.shutdown()
+
+    child, failing, request = exporter.spans
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert request.parent_id is None
+    assert child.attributes == {"key": "value"}
+    assert failing.error == "broken"
+    assert request.duration_ms >= child.duration_ms
+
+
+def test_sampling():
+    """Test a trace not sampled records nothing, the children included"""
+    exporter = ListExporter()
+    tracer = build_tracer(exporter, sample_rate=0)
+
+    with tracer.span("request") as root:
+        assert not root.sampled
+        with tracer.span("child") as child:
+            assert not child.sampled
+    tracer.shutdown()
+
+    assert not exporter.spans
+
+
+def test_continue_trace():
+    """Test a traceparent header continues the caller trace and its sampling decision"""
+    exporter = ListExporter()
+    tracer = build_tracer(exporter, sample_rate=0)
+    trace_id, span_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+
+    with tracer.continue_trace(f"00-{trace_id}-{span_id}-01"):
+        with tracer.span("request"):
+            pass
+    with tracer.continue_trace(f"00-{trace_id}-{span_id}-00"):
+        with tracer.span("request"):
+            pass
+    assert tracer.continue_trace("00-not-a-trace-01") is None
+    tracer.shutdown()
+
+    assert [(span.trace_id, span.parent_id) for span in exporter.spans] == [(trace_id, span_id)]
+
+
+def test_jsonl_exporter(tmp_path):
+    """Test each span is written as a JSON line"""
+    tracer = build_tracer(JsonLinesSpanExporter(str(tmp_path / "traces.jsonl")))
+    with tracer.span("request"):
+        with tracer.span("child"):
+            pass
+    tracer.shutdown()
+
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["child", "request"]
+
+
+def test_otlp_exporter():
+    """Test the spans are posted to a local collector stand-in in the OTLP JSON encoding"""
+    received = []
+
+    class CollectorHandler(BaseHTTPRequestHandler):
+        # pylint: disable=missing-class-docstring,missing-function-docstring,invalid-name
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.path, json.loads(body)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *_):
+            pass
+
+    collector = HTTPServer(("127.0.0.1", 0), CollectorHandler)
+    Thread(target=collector.serve_forever, daemon=True).start()
+    try:
+        endpoint = f"http://127.0.0.1:{collector.server_port}"
+        tracer = build_tracer(OtlpHttpSpanExporter(endpoint, "test-service", 5))
+        with tracer.span("request", {"http.status_code": 200}, kind=SpanKind.SERVER):
+            pass
+        tracer.shutdown()
+    finally:
+        collector.shutdown()
+
+    path, payload = received[0]
+    resource_spans = payload["resourceSpans"][0]
+    span = resource_spans["scopeSpans"][0]["spans"][0]
+    assert path == "/v1/traces"
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "test-service"}
+    assert span["name"] == "request"
+    assert span["kind"] == 2
+    assert span["attributes"] == [{"key": "http.status_code", "value": {"intValue": "200"}}]
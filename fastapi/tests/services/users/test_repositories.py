@@ -0,0 +1,117 @@
+from datetime import datetime
+from os.path import join
+
+import pytest
+import pytest_asyncio
+
+from src.core.exceptions import DuplicateUserError
+from src.helpers.container import CONTAINER
+from src.models.user import (
+    BaseUserRoles,
+    CurrentUserDetails,
+    Role,
+    UpdateUserDetails,
+    UserPartialDetails,
+)
+from src.services.users.implementations.mongo_repository import MongoUserRepository
+from src.services.users.implementations.sqlite_repository import SqliteUserRepository
+from src.services.users.interfaces.i_user_repository import IUserRepository
+from src.services.users.models.user_record import UserRecord
+
+PREFIX = "repository."
+
+
+def build_record(name: str, roles=(Role.USER,)) -> UserRecord:
+    """User record with a username and an email derived from the name."""
+    now = datetime.utcnow()
+    return UserRecord(
+        email=f"{name}@email.com",
+        username=f"{PREFIX}{name}",
+        password="hash",
+        roles=list(roles),
+        creation=now,
+        last_update=now,
+    )
+
+
+@pytest_asyncio.fixture(params=["mongo", "sqlite"])
+async def repository(request, tmp_path):
+    """Each implementation, MongoDB on the backend of the tests."""
+    if request.param == "mongo":
+        instance = CONTAINER.get(IUserRepository)
+        if not isinstance(instance, MongoUserRepository):
+            pytest.skip("DB_BACKEND is sqlite")
+    else:
+        instance = SqliteUserRepository(join(tmp_path, "users.sqlite3"))
+    await instance.connect()
+    for name in ("carl", "anna", "bob", "dan"):
+        await instance.delete(f"{PREFIX}{name}")
+    yield instance
+    for name in ("carl", "anna", "bob", "dan"):
+        await instance.delete(f"{PREFIX}{name}")
+    if request.param == "sqlite":
+        await instance.close()
+
+
+@pytest.mark.asyncio
+async def test_protocol(repository):
+    assert isinstance(repository, IUserRepository)
+    await repository.ping()
+    # Both are seeded with the default users.
+    assert await repository.find_by_username("admin", BaseUserRoles) is not None
+
+
+@pytest.mark.asyncio
+async def test_insert_and_find(repository):
+    await repository.insert(build_record("carl"))
+    await repository.insert(build_record("anna", (Role.ADMIN, Role.USER)))
+    await repository.insert(build_record("bob"))
+
+    found = await repository.find_by_username(f"{PREFIX}anna", CurrentUserDetails)
+    assert isinstance(found, CurrentUserDetails)
+    assert found.email == "anna@email.com" and found.roles == [Role.ADMIN, Role.USER]
+    assert await repository.find_by_username(f"{PREFIX}none", CurrentUserDetails) is None
+
+    # Sorted by username, the default users come before the prefix.
+    every = await repository.find_many(UserPartialDetails, None, None)
+    usernames = [user.username for user in every]
+    assert usernames == sorted(usernames)
+    start = usernames.index(f"{PREFIX}anna")
+    page = await repository.find_many(UserPartialDetails, start + 1, 1)
+    assert [user.username for user in page] == [f"{PREFIX}bob"]
+    assert await repository.count() == len(usernames)
+    admins = await repository.count(Role.ADMIN)
+    assert admins == sum(Role.ADMIN in user.roles for user in every)
+
+
+@pytest.mark.asyncio
+async def test_duplicates(repository):
+    await repository.insert(build_record("carl"))
+    await repository.insert(build_record("bob"))
+
+    with pytest.raises(DuplicateUserError) as error:
+        await repository.insert(build_record("carl"))
+    assert "must be unique" in error.value.msg
+    with pytest.raises(DuplicateUserError):
+        await repository.update(
+            f"{PREFIX}bob",
+            UpdateUserDetails(email="bob@email.com", username=f"{PREFIX}carl", roles=[Role.USER]),
+            datetime.utcnow(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete(repository):
+    await repository.insert(build_record("carl"))
+    details = UpdateUserDetails(
+        email="dan@email.com", username=f"{PREFIX}dan", roles=[Role.ADMIN, Role.USER]
+    )
+
+    assert await repository.update(f"{PREFIX}carl", details, datetime.utcnow())
+    assert not await repository.update(f"{PREFIX}carl", details, datetime.utcnow())
+    updated = await repository.find_by_username(f"{PREFIX}dan", CurrentUserDetails)
+    assert updated.email == "dan@email.com" and Role.ADMIN in updated.roles
+
+    assert await repository.delete(f"{PREFIX}dan")
+    assert not await repository.delete(f"{PREFIX}dan")
+    assert await repository.find_by_username(f"{PREFIX}dan", BaseUserRoles) is None
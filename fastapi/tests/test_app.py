@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+from os import environ
+from os.path import exists, join
+
+import pytest
+
+from benchmarks.startup import BUDGETS_PATH, FASTAPI_DIR, over_budget, time_to_first_request
+from tests import WORKER
+
+
+def test_import_reads_no_configuration(tmp_path):
+    """Test importing the application reads no configuration and creates no directory"""
+    logging_dir = join(tmp_path, "logs")
+    completed = subprocess.run(
+        [sys.executable, "-c", "import src.app"],
+        cwd=FASTAPI_DIR,
+        env={**environ, "CONFIGS_DIR": join(tmp_path, "missing"), "LOGGING_DIR": logging_dir},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # The configuration is read and the logging directory created on startup only.
+    assert completed.returncode == 0, completed.stderr
+    assert not exists(logging_dir)
+
+
+# A wall-clock check, meaningful on an idle machine only: opt in with STARTUP_BUDGET=1,
+# never with pytest-xdist where the workers compete for the CPUs.
+@pytest.mark.skipif(
+    not environ.get("STARTUP_BUDGET") or bool(WORKER),
+    reason="set STARTUP_BUDGET=1 and run serially to check the startup budgets",
+)
+def test_startup_budget():
+    """Test the startup stays within the budgets of benchmarks/baselines/startup.json"""
+    with open(BUDGETS_PATH, encoding="utf-8") as budgets_stream:
+        budgets = json.load(budgets_stream)["budgets"]
+
+    assert over_budget(time_to_first_request(), budgets) == []
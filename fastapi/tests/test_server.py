@@ -0,0 +1,102 @@
+import signal
+import socket
+import subprocess
+import sys
+import time
+from os import environ
+from os.path import dirname, join
+
+import httpx
+import pytest
+
+from src.helpers.config import load_yaml_model
+from src.server import (
+    MONITORING_CONNECTIONS,
+    STARTUP_FAILURE,
+    ServerConfig,
+    available_cpus,
+    max_workers,
+    worker_count,
+    worker_pool_size,
+)
+
+FASTAPI_DIR = dirname(dirname(__file__))
+
+
+def free_port() -> int:
+    """A port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, **env) -> subprocess.Popen:
+    """Start the production server with two workers on the given port."""
+    return subprocess.Popen(
+        [sys.executable, "-m", "src.server", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=FASTAPI_DIR,
+        env={**environ, "WEB_CONCURRENCY": "2", **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def test_config():
+    config = load_yaml_model(ServerConfig, join(environ["CONFIGS_DIR"], "server", "server.yaml"))
+    assert config.port == 8000 and config.graceful_timeout > 0
+
+
+def test_worker_count(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    assert available_cpus() >= 1
+    assert worker_count(ServerConfig()) == available_cpus()
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert worker_count(ServerConfig()) == 3
+    assert worker_count(ServerConfig(workers=5)) == 5
+
+
+def test_worker_pool_size():
+    # Pools and monitoring connections of all the workers stay within the budget.
+    for budget, workers in ((200, 4), (100, 3), (64, 8), (200, 66)):
+        size = worker_pool_size(budget, workers)
+        assert size >= 1
+        assert workers * (size + MONITORING_CONNECTIONS) <= budget
+    # A budget too small for the workers is refused, they are capped first.
+    assert max_workers(200) == 66
+    with pytest.raises(ValueError):
+        worker_pool_size(200, 100)
+
+
+def test_serve_and_stop():
+    port = free_port()
+    server = start_server(port)
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/health/live")
+                break
+            except httpx.TransportError:
+                assert server.poll() is None, server.stderr.read()
+                assert time.monotonic() < deadline
+                time.sleep(0.1)
+        assert response.status_code == 200
+    finally:
+        server.send_signal(signal.SIGTERM)
+        _, stderr = server.communicate(timeout=30)
+
+    # Both workers ran the shutdown of the application.
+    assert server.returncode == 0, stderr
+    assert stderr.count("Application shutdown complete.") == 2
+
+
+def test_startup_failure(tmp_path):
+    server = start_server(
+        free_port(),
+        DB_BACKEND="sqlite",
+        DB_SQLITE_PATH=join(tmp_path, "missing", "users.sqlite3"),
+    )
+    _, stderr = server.communicate(timeout=30)
+
+    assert server.returncode == STARTUP_FAILURE, stderr